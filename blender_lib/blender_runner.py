@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, Optional, Callable
 import threading
 
+from blender_lib.script_utils import JSON_OUTPUT_MARKER
+
 
 class BlenderRunner:
     """Executes Python code via Blender's Python interpreter.
@@ -100,6 +102,73 @@ class BlenderRunner:
         Raises:
             subprocess.TimeoutExpired: If operation takes too long
         """
+        stdout_lines = []
+
+        def on_line(line: str):
+            stdout_lines.append(line)
+            # Call progress callback for each line
+            progress_callback(line)
+
+        result = self._run_with_line_reader(script_path, args, on_line, timeout)
+        result.stdout = '\n'.join(stdout_lines)
+        return result
+
+    def run_script_streaming(self,
+                             script_path: Path,
+                             args: Dict[str, str],
+                             line_callback: Optional[Callable[[str], None]] = None,
+                             timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+        """Execute a script via Blender, keeping only the JSON result output.
+
+        stdout is read line by line. Lines before the JSON output marker are
+        passed to line_callback and dropped, so large results are not held
+        in memory twice alongside Blender's startup log.
+
+        Args:
+            script_path: Path to the Python script to execute
+            args: Dictionary of arguments to pass to the script
+            line_callback: Optional callback for each non-JSON line of output
+            timeout: Optional timeout override
+
+        Returns:
+            CompletedProcess whose stdout holds the output from the JSON
+            marker onward (empty if the marker never appeared)
+
+        Raises:
+            TimeoutError: If operation takes too long
+        """
+        json_lines = []
+
+        def on_line(line: str):
+            if json_lines or JSON_OUTPUT_MARKER in line:
+                json_lines.append(line)
+            elif line_callback:
+                line_callback(line)
+
+        result = self._run_with_line_reader(script_path, args, on_line, timeout)
+        result.stdout = '\n'.join(json_lines)
+        return result
+
+    def _run_with_line_reader(self,
+                              script_path: Path,
+                              args: Dict[str, str],
+                              on_stdout_line: Callable[[str], None],
+                              timeout: Optional[int]) -> subprocess.CompletedProcess:
+        """Run a Blender script, handing each stdout line to a callback.
+
+        Args:
+            script_path: Path to the Python script to execute
+            args: Dictionary of arguments to pass to the script
+            on_stdout_line: Called with each stdout line (trailing whitespace stripped)
+            timeout: Optional timeout override
+
+        Returns:
+            CompletedProcess with stderr and returncode; stdout is left empty
+            for the caller to fill in
+
+        Raises:
+            TimeoutError: If operation takes too long
+        """
         if not script_path.exists():
             raise FileNotFoundError(f"Script not found: {script_path}")
 
@@ -124,17 +193,12 @@ class BlenderRunner:
                 bufsize=1  # Line buffered
             )
 
-            # Collect all output
-            stdout_lines = []
             stderr_lines = []
 
             def read_stdout():
-                """Read stdout and call progress callback."""
+                """Read stdout and pass each line on."""
                 for line in process.stdout:
-                    line = line.rstrip()
-                    stdout_lines.append(line)
-                    # Call progress callback for each line
-                    progress_callback(line)
+                    on_stdout_line(line.rstrip())
 
             def read_stderr():
                 """Read stderr."""
@@ -161,15 +225,13 @@ class BlenderRunner:
             stderr_thread.join()
 
             # Create a CompletedProcess result
-            result = subprocess.CompletedProcess(
+            return subprocess.CompletedProcess(
                 args=cmd,
                 returncode=process.returncode,
-                stdout='\n'.join(stdout_lines),
+                stdout='',
                 stderr='\n'.join(stderr_lines)
             )
 
-            return result
-
         except Exception as e:
             if isinstance(e, TimeoutError):
                 raise
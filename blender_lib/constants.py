@@ -20,6 +20,9 @@ BACKUP_EXTENSIONS = ['.blend1', '.blend2']
 # All supported file extensions
 ALL_SUPPORTED_EXTENSIONS = TEXTURE_EXTENSIONS + BLEND_EXTENSIONS
 
+# Texture extensions as a set, for suffix checks on hot paths
+TEXTURE_SUFFIXES = frozenset(TEXTURE_EXTENSIONS)
+
 # ============================================================================
 # Timeout Values (in seconds)
 # ============================================================================
@@ -36,6 +39,21 @@ TIMEOUT_LONG = 180
 # Very long operations (large directory moves)
 TIMEOUT_VERY_LONG = 300
 
+# ============================================================================
+# Concurrency
+# ============================================================================
+
+# Upper bound on Blender processes sharing one batch reference scan; each
+# process holds a whole .blend file in memory
+MAX_SCAN_PROCESSES = 4
+
+# ============================================================================
+# UI Timing (in milliseconds)
+# ============================================================================
+
+# Delay before pending link state is written to the config file
+LINK_STATE_SAVE_DELAY_MS = 300
+
 # ============================================================================
 # Ignore Patterns
 # ============================================================================
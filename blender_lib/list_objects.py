@@ -7,7 +7,7 @@ import argparse
 # Import shared utilities
 import os
 sys.path.insert(0, os.path.dirname(__file__))
-from script_utils import output_json, create_error_result, create_success_result
+from script_utils import output_json, output_json_file, create_error_result, create_success_result
 
 
 def list_objects_and_collections(scene_name=None):
@@ -76,6 +76,8 @@ if __name__ == "__main__":
         parser = argparse.ArgumentParser()
         parser.add_argument('--blend-file', required=True, help='Path to .blend file')
         parser.add_argument('--scene', required=False, default=None, help='Scene name to filter by')
+        parser.add_argument('--output-json', required=False, default=None,
+                            help='Write the result to this file instead of stdout')
 
         # Get args after the '--' separator
         args = parser.parse_args(sys.argv[sys.argv.index('--') + 1:])
@@ -87,7 +89,10 @@ if __name__ == "__main__":
         result = list_objects_and_collections(scene_name=args.scene)
 
         # Output as JSON
-        output_json(create_success_result(**result))
+        if args.output_json:
+            output_json_file(create_success_result(**result), args.output_json)
+        else:
+            output_json(create_success_result(**result))
 
         sys.exit(0)
 
@@ -16,10 +16,29 @@ JSON_OUTPUT_MARKER = "JSON_OUTPUT:"
 def output_json(data: Dict[str, Any]) -> None:
     """Output JSON with standard marker for parsing by the main application.
 
+    The main application only parses the result, so it is streamed compactly
+    rather than built as one indented string.
+
     Args:
         data: Dictionary to output as JSON
     """
-    print(f"{JSON_OUTPUT_MARKER}{json.dumps(data, indent=2)}")
+    sys.stdout.write(JSON_OUTPUT_MARKER)
+    json.dump(data, sys.stdout, separators=(',', ':'))
+    sys.stdout.write('\n')
+
+
+def output_json_file(data: Dict[str, Any], output_path: str) -> None:
+    """Write JSON result to a file instead of stdout.
+
+    Large results (thousands of objects) are slow to pipe through stdout and
+    then scan for the marker, so callers can pass a file path to read back.
+
+    Args:
+        data: Dictionary to write as JSON
+        output_path: Path of the file to write
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
 
 
 def create_error_result(error_message: str, **kwargs) -> Dict[str, Any]:
@@ -0,0 +1,120 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is always available
+    orjson = None
+
+
+HAS_ORJSON = orjson is not None
+
+# Parsed documents by path, with the (mtime_ns, size) they were read at
+_file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+
+    orjson parses large Blender results several times faster than the
+    stdlib and accepts bytes directly, so no decode step is needed.
+
+    Args:
+        data: JSON text as str or UTF-8 bytes
+
+    Returns:
+        The parsed object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to indented UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def load_json_cached(path: Path) -> Any:
+    """Read a JSON file, reusing the last parse while the file is unchanged.
+
+    The config file is read by several widgets on every state restore but
+    rarely changes, so a stat call replaces the open and parse. The returned
+    object is shared between callers and must not be mutated; copy it first.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The parsed document
+
+    Raises:
+        OSError: If the file does not exist or cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(key, 'rb') as f:
+        data = loads(f.read())
+    _file_cache[key] = (stamp, data)
+    return data
+
+
+def write_json_atomic(path: Path, obj: Any) -> None:
+    """Write JSON to a file without ever leaving it half-written.
+
+    The document is written to a temporary file in the same directory and
+    moved over the target, so a crash or a concurrent reader never sees a
+    truncated config. The file is written ASCII-escaped, like the stdlib
+    default, because the config is also read with the platform encoding.
+    An existing file keeps its permissions.
+
+    Args:
+        path: File to write
+        obj: JSON-serializable object
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    data = json.dumps(obj, indent=2).encode('ascii')
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file as 0600, keep the mode of the file it replaces
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+        _file_cache.pop(os.fspath(path), None)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
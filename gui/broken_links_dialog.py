@@ -314,7 +314,7 @@ class BrokenLinksDialog(QDialog):
         reply = QMessageBox.question(
             self,
             TITLE_CONFIRM_REMOVE_LINKS,
-            TMPL_CONFIRM_REMOVE_SELECTED.format(
+            TMPL_CONFIRM_REMOVE_SELECTED(
                 count=len(selected_links),
                 items=items_str
             ),
@@ -335,7 +335,7 @@ class BrokenLinksDialog(QDialog):
         reply = QMessageBox.question(
             self,
             TITLE_CONFIRM_REMOVE_LINKS,
-            TMPL_CONFIRM_REMOVE_ALL.format(
+            TMPL_CONFIRM_REMOVE_ALL(
                 count=total_broken_links,
                 file_count=len(files_with_broken_links)
             ),
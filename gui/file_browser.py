@@ -1,6 +1,5 @@
 """File browser widget with tree view."""
 
-import json
 import subprocess
 import platform
 import shutil
@@ -22,7 +21,8 @@ from services.blender_service import BlenderService
 from gui.progress_dialog import OperationProgressDialog
 from gui.file_links_dialog import FileLinksDialog
 from gui.file_references_dialog import FileReferencesDialog
-from blender_lib.constants import TEXTURE_EXTENSIONS
+from blender_lib.constants import TEXTURE_SUFFIXES
+from core.json_utils import load_json_cached, write_json_atomic
 from gui.ui_strings import (
     TITLE_BLENDER_NOT_FOUND, TITLE_ERROR_OPENING_FILE,
     TITLE_CONFIRM_DELETION, TITLE_SUCCESS, TITLE_ERROR,
@@ -310,7 +310,7 @@ class FileItemDelegate(QStyledItemDelegate):
     def _is_supported_file(self, file_path):
         """Check if file is a .blend or texture file."""
         suffix = file_path.suffix.lower()
-        return suffix == '.blend' or suffix in TEXTURE_EXTENSIONS
+        return suffix == '.blend' or suffix in TEXTURE_SUFFIXES
 
     def get_trash_icon_rect(self, option):
         """Get the rectangle where the trash icon is drawn."""
@@ -645,7 +645,7 @@ class FileBrowserWidget(QWidget):
             QMessageBox.critical(
                 self,
                 TITLE_ERROR_OPENING_FILE,
-                TMPL_FAILED_TO_OPEN_BLENDER.format(
+                TMPL_FAILED_TO_OPEN_BLENDER(
                     file_name=file_path.name,
                     error=str(e)
                 )
@@ -707,9 +707,9 @@ class FileBrowserWidget(QWidget):
 
         # Show confirmation dialog
         if selected_path.is_dir():
-            message = TMPL_CONFIRM_DELETE_DIR.format(dir_path=str(selected_path))
+            message = TMPL_CONFIRM_DELETE_DIR(dir_path=str(selected_path))
         else:
-            message = TMPL_CONFIRM_DELETE_FILE.format(file_path=str(selected_path))
+            message = TMPL_CONFIRM_DELETE_FILE(file_path=str(selected_path))
 
         # Update message to indicate it will be moved to trash
         message += "\n\nIt will be moved to the trash/recycle bin."
@@ -754,7 +754,7 @@ class FileBrowserWidget(QWidget):
         # Check if file type is supported
         suffix = selected_path.suffix.lower()
         is_blend = suffix == '.blend'
-        is_texture = suffix in TEXTURE_EXTENSIONS
+        is_texture = suffix in TEXTURE_SUFFIXES
 
         if not (is_blend or is_texture):
             return
@@ -765,7 +765,7 @@ class FileBrowserWidget(QWidget):
 
         # Show progress dialog
         progress_dialog = OperationProgressDialog(TITLE_FINDING_REFERENCES, self)
-        progress_dialog.update_progress(0, TMPL_SCANNING_REFS.format(filename=selected_path.name))
+        progress_dialog.update_progress(0, TMPL_SCANNING_REFS(filename=selected_path.name))
         progress_dialog.show()
 
         try:
@@ -784,7 +784,7 @@ class FileBrowserWidget(QWidget):
                 QMessageBox.critical(
                     self,
                     TITLE_ERROR,
-                    TMPL_FAILED_FIND_REFS.format(error=result.get('error', 'Unknown error'))
+                    TMPL_FAILED_FIND_REFS(error=result.get('error', 'Unknown error'))
                 )
                 return
 
@@ -794,7 +794,7 @@ class FileBrowserWidget(QWidget):
             files_scanned = result.get("files_scanned", 0)
 
             if not referencing_files:
-                message = TMPL_NO_REFS_FOUND.format(count=files_scanned)
+                message = TMPL_NO_REFS_FOUND(count=files_scanned)
                 QMessageBox.information(self, TITLE_FINDING_REFERENCES, message)
                 return
 
@@ -813,7 +813,7 @@ class FileBrowserWidget(QWidget):
             QMessageBox.critical(
                 self,
                 TITLE_ERROR,
-                TMPL_FAILED_FIND_REFS.format(error=str(e))
+                TMPL_FAILED_FIND_REFS(error=str(e))
             )
 
     def _show_linked_files(self):
@@ -906,10 +906,10 @@ class FileBrowserWidget(QWidget):
 
         try:
             # Load existing config
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
 
             # Get expanded paths
             expanded_paths = []
@@ -942,8 +942,7 @@ class FileBrowserWidget(QWidget):
             }
             config_data['file_browser'] = file_browser_state
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
 
         except Exception as e:
             print(f"Warning: Could not save file browser state: {e}")
@@ -982,8 +981,7 @@ class FileBrowserWidget(QWidget):
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = load_json_cached(self.config_file)
 
             file_browser_state = config_data.get('file_browser', {})
             root_path = self.project.project_root
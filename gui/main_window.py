@@ -1,6 +1,5 @@
 """Main application window."""
 
-import json
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -8,7 +7,7 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QFileDialog, QMessageBox, QStatusBar,
-    QLabel, QPushButton, QLineEdit, QFrame, QApplication
+    QLabel, QPushButton, QLineEdit, QFrame
 )
 
 from controllers.project_controller import ProjectController
@@ -20,6 +19,7 @@ from gui.ui_strings import (
     TITLE_PROJECT_OPENED, TITLE_ERROR,
     TMPL_PROJECT_INFO
 )
+from core.json_utils import load_json_cached, write_json_atomic
 
 
 class MainWindow(QMainWindow):
@@ -85,7 +85,7 @@ class MainWindow(QMainWindow):
         """Create the project selector bar at the top of the window."""
         self.project_bar = QFrame()
         self.project_bar.setFrameShape(QFrame.StyledPanel)
-        self.project_bar.setStyleSheet(Theme.get_project_bar_style())
+        Theme.apply(self.project_bar, 'project_bar')
         self.project_bar.setMaximumHeight(42)  # Very compact height
         self.project_bar.setMinimumHeight(32)
 
@@ -202,7 +202,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(
                 self,
                 TITLE_PROJECT_OPENED,
-                TMPL_PROJECT_INFO.format(
+                TMPL_PROJECT_INFO(
                     project_name=project_root.name,
                     project_root=project_root,
                     blend_count=info.get('blend_files_count', 0)
@@ -226,15 +226,14 @@ class MainWindow(QMainWindow):
             self.config_dir.mkdir(parents=True, exist_ok=True)
 
             # Load existing config to preserve theme preference
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
 
             config_data["last_project"] = str(project_root)
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
         except Exception as e:
             print(f"Warning: Could not save last project: {e}")
 
@@ -244,8 +243,7 @@ class MainWindow(QMainWindow):
             if not self.config_file.exists():
                 return
 
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = load_json_cached(self.config_file)
 
             last_project = config_data.get('last_project')
             if last_project:
@@ -293,33 +291,33 @@ class MainWindow(QMainWindow):
 
     def _update_project_bar_button_styles(self):
         """Update project bar button styles with theme colors and compact padding."""
-        c = Theme.get_colors()
+        c = Theme.get_c()
 
         # Primary button (Select Project) - compact with theme colors
         self.select_project_btn.setStyleSheet(f"""
             QPushButton {{
-                background-color: {c['primary']};
-                color: {c['text_inverse']};
+                background-color: {c.primary};
+                color: {c.text_inverse};
                 border: none;
                 padding: 2px 10px;
                 font-weight: bold;
             }}
             QPushButton:hover {{
-                background-color: {c['primary_hover']};
+                background-color: {c.primary_hover};
             }}
         """)
 
         # Theme toggle button - compact with base button colors
         self.theme_toggle_btn.setStyleSheet(f"""
             QPushButton {{
-                background-color: {c['bg_secondary']};
-                color: {c['text_primary']};
-                border: 1px solid {c['border_medium']};
+                background-color: {c.bg_secondary};
+                color: {c.text_primary};
+                border: 1px solid {c.border_medium};
                 padding: 2px;
             }}
             QPushButton:hover {{
-                background-color: {c['bg_tertiary']};
-                border-color: {c['border_dark']};
+                background-color: {c.bg_tertiary};
+                border-color: {c.border_dark};
             }}
         """)
 
@@ -327,12 +325,12 @@ class MainWindow(QMainWindow):
         """Toggle between light and dark themes."""
         new_theme = Theme.toggle_theme()
 
-        # Update the app stylesheet
-        QApplication.instance().setStyleSheet(Theme.get_stylesheet())
+        # Update the app palette and stylesheet
+        Theme.apply_app_theme()
 
-        # Update component-specific styles that don't use global stylesheet
-        self.project_bar.setStyleSheet(Theme.get_project_bar_style())
-        self.operations_panel.file_display.setStyleSheet(Theme.get_file_display_style())
+        # Update component-specific styles that don't use global stylesheet;
+        # hidden widgets pick theirs up when next shown
+        Theme.restyle_widgets()
 
         # Update project bar buttons with new theme colors
         self._update_project_bar_button_styles()
@@ -353,15 +351,14 @@ class MainWindow(QMainWindow):
             self.config_dir.mkdir(parents=True, exist_ok=True)
 
             # Load existing config or create new one
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
 
             config_data['theme'] = theme
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
         except Exception as e:
             print(f"Warning: Could not save theme preference: {e}")
 
@@ -371,8 +368,7 @@ class MainWindow(QMainWindow):
             if not self.config_file.exists():
                 return
 
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = load_json_cached(self.config_file)
 
             theme = config_data.get('theme', 'light')
             Theme.set_theme(theme)
@@ -392,10 +388,10 @@ class MainWindow(QMainWindow):
             self.config_dir.mkdir(parents=True, exist_ok=True)
 
             # Load existing config
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
 
             # Save window geometry
             geometry = self.saveGeometry()
@@ -405,8 +401,7 @@ class MainWindow(QMainWindow):
             splitter_state = self.splitter.saveState()
             config_data['splitter_state'] = base64.b64encode(splitter_state.data()).decode('utf-8')
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
         except Exception as e:
             print(f"Warning: Could not save window state: {e}")
 
@@ -419,8 +414,7 @@ class MainWindow(QMainWindow):
             if not self.config_file.exists():
                 return
 
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = load_json_cached(self.config_file)
 
             # Restore window geometry
             if 'window_geometry' in config_data:
@@ -467,6 +461,9 @@ class MainWindow(QMainWindow):
         # Save file browser state
         self.file_browser.save_state()
 
+        # Write delayed operation panel state
+        self.operations_panel.flush_pending_state()
+
         # Close project if open
         if self.project_controller.is_open:
             self.project_controller.close_project()
@@ -2,18 +2,31 @@
 
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Callable, Optional
+from typing import Any, Callable, Iterable, Optional, Sequence
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 from PySide6.QtWidgets import QWidget, QMessageBox, QApplication, QPushButton
 from PySide6.QtGui import QCursor
 
 from controllers.file_operations_controller import FileOperationsController
+from gui.operations.workers import ScriptRunnable
+from blender_lib.constants import TEXTURE_SUFFIXES
+
+_BLEND_SUFFIX = '.blend'
+
+# HTML fragments shared by all result message boxes
+_BULLET = "  • {}<br>"
+_TRUNC_MORE = "  ... and {n} more<br>"
+_SECTION_HDR = "<br><b>{}:</b><br>"
 
 
 class BaseOperationTab(QWidget):
     """Base class for operation tabs providing common functionality."""
 
+    # Shared wait cursor, created on first use because a QCursor cannot be
+    # built before the QApplication exists (i.e. at class definition time)
+    _WAIT_CURSOR: Optional[QCursor] = None
+
     def __init__(self, controller: FileOperationsController, parent=None):
         """Initialize base tab.
 
@@ -25,6 +38,8 @@ class BaseOperationTab(QWidget):
         self.controller = controller
         self.operations_panel = parent  # Reference to parent OperationsPanelWidget
         self.current_file: Optional[Path] = None
+        # Signals of running background tasks, kept alive until they report back
+        self._active_tasks = set()
 
     def set_file(self, file_path: Path):
         """Set the currently selected file.
@@ -36,6 +51,19 @@ class BaseOperationTab(QWidget):
         """
         self.current_file = file_path
 
+    @property
+    def is_busy(self) -> bool:
+        """Whether a background task started by this tab is still running."""
+        return bool(self._active_tasks)
+
+    def _update_controls(self):
+        """Recompute which controls are enabled from the current tab state.
+
+        Called when a background task starts and ends, so controls are never
+        re-enabled from a stale snapshot. Tabs that use run_in_background
+        override this and keep their task buttons disabled while is_busy.
+        """
+
     # Dialog Helper Methods
 
     def show_error(self, title: str, message: str):
@@ -95,8 +123,63 @@ class BaseOperationTab(QWidget):
 
     # Loading State Management
 
+    @classmethod
+    def _wait_cursor(cls) -> QCursor:
+        """Get the shared wait cursor.
+
+        Returns:
+            Wait cursor reused across all loading states
+        """
+        if cls._WAIT_CURSOR is None:
+            BaseOperationTab._WAIT_CURSOR = QCursor(Qt.WaitCursor)
+        return BaseOperationTab._WAIT_CURSOR
+
+    def _begin_loading(self,
+                       button: QPushButton,
+                       loading_text: str,
+                       wait_cursor: bool = True,
+                       extra_widgets: Sequence[QWidget] = (),
+                       restore_enabled: bool = True) -> Callable[[], None]:
+        """Put a button (and related widgets) into the loading state.
+
+        Args:
+            button: Button to disable and update text
+            loading_text: Text to show on button during loading
+            wait_cursor: Whether to show the wait cursor
+            extra_widgets: Other widgets to disable while loading
+            restore_enabled: Whether restoring also re-applies the enabled
+                states saved here (off when the caller recomputes them)
+
+        Returns:
+            Function that restores the original state
+        """
+        # Save original state
+        original_text = button.text()
+        original_states = [(widget, widget.isEnabled()) for widget in (button, *extra_widgets)]
+
+        # Set loading state
+        button.setText(loading_text)
+        for widget, _ in original_states:
+            widget.setEnabled(False)
+        if wait_cursor:
+            QApplication.setOverrideCursor(self._wait_cursor())
+
+        def restore():
+            if wait_cursor:
+                QApplication.restoreOverrideCursor()
+            button.setText(original_text)
+            if restore_enabled:
+                for widget, enabled in original_states:
+                    widget.setEnabled(enabled)
+
+        return restore
+
     @contextmanager
-    def loading_state(self, button: QPushButton, loading_text: str):
+    def loading_state(self,
+                      button: QPushButton,
+                      loading_text: str,
+                      wait_cursor: bool = True,
+                      extra_widgets: Sequence[QWidget] = ()):
         """Context manager for managing loading state with cursor and button updates.
 
         Usage:
@@ -107,27 +190,68 @@ class BaseOperationTab(QWidget):
         Args:
             button: Button to disable and update text
             loading_text: Text to show on button during loading
+            wait_cursor: Whether to show the wait cursor (off for file dialogs)
+            extra_widgets: Other widgets to disable while loading
 
         Yields:
             None
         """
-        # Save original state
-        original_text = button.text()
-        original_enabled = button.isEnabled()
-
-        # Set loading state
-        button.setText(loading_text)
-        button.setEnabled(False)
-        QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
-        QApplication.processEvents()  # Force UI update
+        restore = self._begin_loading(button, loading_text, wait_cursor, extra_widgets)
+        # Repaint just the button instead of pumping the whole event queue
+        button.repaint()
 
         try:
             yield
         finally:
             # Restore original state
-            QApplication.restoreOverrideCursor()
-            button.setText(original_text)
-            button.setEnabled(original_enabled)
+            restore()
+
+    def run_in_background(self,
+                          task: Callable[[], Any],
+                          on_finished: Callable[[Any], None],
+                          on_error: Callable[[str], None],
+                          button: QPushButton,
+                          loading_text: str,
+                          extra_widgets: Sequence[QWidget] = ()):
+        """Run a blocking task on the thread pool with a loading state.
+
+        The GUI thread keeps processing events while Blender runs. The loading
+        state is restored before on_finished/on_error is called. While the task
+        runs is_busy is True; _update_controls is called when it starts and
+        again when it ends to recompute which controls are enabled.
+
+        Args:
+            task: Blocking callable to run; must not touch widgets
+            on_finished: Called on the GUI thread with the task result
+            on_error: Called on the GUI thread with the error message
+            button: Button to disable and update text
+            loading_text: Text to show on button during loading
+            extra_widgets: Other widgets to disable while the task runs
+        """
+        restore_loading = self._begin_loading(button, loading_text, extra_widgets=extra_widgets,
+                                              restore_enabled=False)
+
+        runnable = ScriptRunnable(task)
+        signals = runnable.signals
+        self._active_tasks.add(signals)
+        self._update_controls()
+
+        def restore():
+            self._active_tasks.discard(signals)
+            restore_loading()
+            self._update_controls()
+
+        def finished(result):
+            restore()
+            on_finished(result)
+
+        def failed(message: str):
+            restore()
+            on_error(message)
+
+        signals.finished.connect(finished)
+        signals.error.connect(failed)
+        QThreadPool.globalInstance().start(runnable)
 
     def with_loading_cursor(self, operation: Callable):
         """Execute an operation with wait cursor.
@@ -138,13 +262,45 @@ class BaseOperationTab(QWidget):
         Returns:
             Result of the operation
         """
-        QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
+        QApplication.setOverrideCursor(self._wait_cursor())
         QApplication.processEvents()
         try:
             return operation()
         finally:
             QApplication.restoreOverrideCursor()
 
+    # Message Formatting Helpers
+
+    @staticmethod
+    def format_bullet_list(visible: Iterable[str], hidden_count: int = 0) -> str:
+        """Format items as HTML bullet lines for a message box.
+
+        Args:
+            visible: Item texts to show, already truncated by the caller
+            hidden_count: Number of items left out (<= 0 adds no summary line)
+
+        Returns:
+            HTML fragment with one line per item
+        """
+        more = _TRUNC_MORE.format(n=hidden_count) if hidden_count > 0 else ""
+        return "".join([_BULLET.format(text) for text in visible]) + more
+
+    @staticmethod
+    def format_message_section(title: str, visible: Sequence[str], hidden_count: int = 0) -> str:
+        """Format a titled bullet section, or nothing if there are no items.
+
+        Args:
+            title: Section title (e.g. "Warnings")
+            visible: Item texts to show, already truncated by the caller
+            hidden_count: Number of items left out
+
+        Returns:
+            HTML fragment, empty when visible is empty
+        """
+        if not visible:
+            return ""
+        return _SECTION_HDR.format(title) + BaseOperationTab.format_bullet_list(visible, hidden_count)
+
     # File Type Helpers
 
     @staticmethod
@@ -157,7 +313,7 @@ class BaseOperationTab(QWidget):
         Returns:
             True if file is a .blend file
         """
-        return file_path.suffix == '.blend'
+        return file_path.suffix == _BLEND_SUFFIX
 
     @staticmethod
     def is_texture_file(file_path: Path) -> bool:
@@ -169,7 +325,7 @@ class BaseOperationTab(QWidget):
         Returns:
             True if file is a texture file
         """
-        return file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.exr', '.hdr', '.tif', '.tiff']
+        return file_path.suffix.lower() in TEXTURE_SUFFIXES
 
     @staticmethod
     def is_directory(file_path: Path) -> bool:
@@ -1,17 +1,19 @@
 """Link Objects/Collections tab for linking between .blend files."""
 
-import json
+import copy
+import os
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QScrollArea, QWidget, QListWidget, QListWidgetItem, QComboBox,
-    QCheckBox, QRadioButton, QButtonGroup
+    QCheckBox, QRadioButton, QButtonGroup, QListView, QAbstractItemView
 )
 
 from gui.operations.base_tab import BaseOperationTab
+from gui.operations.list_items import ItemPayload, build_item_rows, is_hidden_by_filter, payload_name
 from gui.preview_dialog import OperationPreviewDialog
 from gui.theme import Theme
 from gui.ui_strings import (
@@ -22,12 +24,19 @@ from gui.ui_strings import (
     MSG_SELECT_BLEND_FILE, MSG_SELECT_SOURCE_BLEND, MSG_SELECT_TARGET_SCENE,
     MSG_SELECT_VALID_SOURCE, MSG_SELECT_ITEMS_TO_LINK, MSG_ENTER_COLLECTION_NAME,
     MSG_NO_VALID_ITEMS,
-    LABEL_NO_BLEND_SELECTED, LABEL_SELECT_BLEND_IN_BROWSER,
+    LABEL_NO_BLEND_SELECTED, LABEL_SELECT_BLEND_IN_BROWSER, LABEL_LOADING_SCENES,
     TMPL_SOURCE_FILE_NOT_FOUND, TMPL_FAILED_TO_LOAD, TMPL_CONFIRM_LINK,
     TMPL_LINK_COMPLETE,
-    BTN_PROCESSING, BTN_EXECUTING, BTN_LOAD_OBJECTS_COLLECTIONS
+    BTN_PROCESSING, BTN_EXECUTING, BTN_LOADING, BTN_LOAD_OBJECTS_COLLECTIONS
 )
-from blender_lib.constants import TIMEOUT_SHORT
+from blender_lib.constants import TIMEOUT_SHORT, LINK_STATE_SAVE_DELAY_MS
+from core.json_utils import dumps as json_dumps, load_json_cached, write_json_atomic
+from services.blender_service import extract_json_from_output
+
+
+# Blender scripts used by this tab, resolved once at import
+_BLENDER_LIB = Path(__file__).parent.parent.parent / "blender_lib"
+_LIST_OBJECTS_SCRIPT = _BLENDER_LIB / "list_objects.py"
 
 
 class LinkObjectsTab(BaseOperationTab):
@@ -48,6 +57,17 @@ class LinkObjectsTab(BaseOperationTab):
         self.link_source_file: Optional[Path] = None
         self.link_locked_file: Optional[Path] = None
         self.pending_locked_file_restore = None
+
+        # In-memory copy of the 'link_operation' config section. Saves update
+        # it and a single-shot timer writes it out once the signals settle.
+        self._link_state_cache: Optional[dict] = None
+        # Hash of the section as last read or written, to skip no-op writes
+        self._last_saved_hash: Optional[int] = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(LINK_STATE_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush_link_state)
+
         self.setup_ui()
         self._restore_link_state()
 
@@ -87,7 +107,7 @@ class LinkObjectsTab(BaseOperationTab):
 
         self.link_target_display = QLabel(LABEL_NO_BLEND_SELECTED)
         self.link_target_display.setWordWrap(True)
-        self.link_target_display.setStyleSheet(Theme.get_file_display_style())
+        Theme.apply(self.link_target_display, 'file_display')
         tab_layout.addWidget(self.link_target_display)
 
         # Scene selection with lock
@@ -124,7 +144,7 @@ class LinkObjectsTab(BaseOperationTab):
 
         self.link_source_display = QLabel(LABEL_SELECT_BLEND_IN_BROWSER)
         self.link_source_display.setWordWrap(True)
-        self.link_source_display.setStyleSheet(Theme.get_file_display_style())
+        Theme.apply(self.link_source_display, 'file_display')
         tab_layout.addWidget(self.link_source_display)
 
         # Source scene selector
@@ -175,6 +195,12 @@ class LinkObjectsTab(BaseOperationTab):
 
         self.link_items_list = QListWidget()
         self.link_items_list.setSelectionMode(QListWidget.ExtendedSelection)
+        # Every row is a single line in the same font, so skip per-row size probing
+        self.link_items_list.setUniformItemSizes(True)
+        # Lay out large source files in chunks so the list stays responsive
+        self.link_items_list.setLayoutMode(QListView.Batched)
+        self.link_items_list.setBatchSize(256)
+        self.link_items_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.link_items_list.itemSelectionChanged.connect(self._on_link_item_selection_changed)
         tab_layout.addWidget(self.link_items_list)
 
@@ -301,14 +327,14 @@ class LinkObjectsTab(BaseOperationTab):
 
         # Update Link tab (only for .blend files)
         is_blend = self.is_blend_file(file_path)
+        file_html = f"<b>{file_path.name}</b><br><small>{file_path}</small>" if is_blend else None
 
         if self.link_scene_lock.isChecked():
             # Target is locked - selected file becomes SOURCE
             if is_blend:
                 self.link_source_file = file_path
-                self.link_source_display.setText(f"<b>{file_path.name}</b><br><small>{str(file_path)}</small>")
+                self.link_source_display.setText(file_html)
                 self.link_load_source_scenes_btn.setEnabled(True)
-                self.link_load_btn.setEnabled(True)
                 # Clear previous items when source changes
                 self.link_items_list.clear()
                 self.link_filter_input.clear()
@@ -324,15 +350,13 @@ class LinkObjectsTab(BaseOperationTab):
                 self.link_source_scene_combo.clear()
                 self.link_source_scene_combo.setEnabled(False)
                 self.link_load_source_scenes_btn.setEnabled(False)
-                self.link_load_btn.setEnabled(False)
                 self.link_items_list.clear()
                 self.link_filter_input.clear()
                 self.link_source_data = {"objects": [], "collections": []}
         else:
             # Target is not locked - selected file becomes TARGET
             if is_blend:
-                self.link_target_display.setText(f"<b>{file_path.name}</b><br><small>{str(file_path)}</small>")
-                self.link_load_target_scenes_btn.setEnabled(True)
+                self.link_target_display.setText(file_html)
 
                 # Auto-load if checkbox is checked AND this tab is visible
                 if self.link_auto_load_checkbox.isChecked() and self.isVisible():
@@ -341,7 +365,22 @@ class LinkObjectsTab(BaseOperationTab):
                 self.link_target_display.setText(LABEL_NO_BLEND_SELECTED)
                 self.link_scene_combo.clear()
                 self.link_scene_combo.setEnabled(False)
-                self.link_load_target_scenes_btn.setEnabled(False)
+
+        self._update_controls()
+
+    def _update_controls(self):
+        """Enable the buttons that start Blender tasks unless one is running."""
+        idle = not self.is_busy
+        target_file = self.link_locked_file if self.link_scene_lock.isChecked() else self.current_file
+        data = self.link_source_data if isinstance(self.link_source_data, dict) else {}
+        has_items = bool(data.get("objects") or data.get("collections"))
+
+        self.link_load_target_scenes_btn.setEnabled(
+            idle and target_file is not None and self.is_blend_file(target_file)
+        )
+        self.link_load_btn.setEnabled(idle and self.link_source_file is not None)
+        self.link_preview_btn.setEnabled(idle and has_items)
+        self.link_execute_btn.setEnabled(idle and has_items)
 
     def _load_scenes_for_target(self):
         """Load scenes from the target .blend file."""
@@ -432,10 +471,10 @@ class LinkObjectsTab(BaseOperationTab):
             # Update target to current file
             if self.current_file and self.current_file.suffix == '.blend':
                 self.link_target_display.setText(f"<b>{self.current_file.name}</b><br><small>{str(self.current_file)}</small>")
-                self.link_load_target_scenes_btn.setEnabled(True)
 
         # Update scene combo state based on lock
         self._update_scene_combo_state()
+        self._update_controls()
 
         # Save lock state
         self._save_link_state()
@@ -473,55 +512,99 @@ class LinkObjectsTab(BaseOperationTab):
             return
 
         if not self.link_source_file.exists():
-            self.show_warning(TITLE_FILE_NOT_FOUND, TMPL_SOURCE_FILE_NOT_FOUND.format(file_path=self.link_source_file))
+            self.show_warning(TITLE_FILE_NOT_FOUND, TMPL_SOURCE_FILE_NOT_FOUND(file_path=self.link_source_file))
             return
 
-        try:
-            with self.loading_state(self.link_load_btn, "Loading..."):
-                # Use the same list_objects.py script
-                runner = self.get_blender_runner()
-                script_path = Path(__file__).parent.parent.parent / "blender_lib" / "list_objects.py"
-
-                # Get selected scene
-                scene_name = self.link_source_scene_combo.currentText()
-                script_args = {"blend-file": str(self.link_source_file)}
-
-                # Add scene parameter if not "All"
-                if scene_name and scene_name != "All":
-                    script_args["scene"] = scene_name
-
-                result = runner.run_script(
-                    script_path,
-                    script_args,
-                    timeout=TIMEOUT_SHORT
-                )
+        # Get selected scene
+        scene_name = self.link_source_scene_combo.currentText()
+        script_args = {"blend-file": str(self.link_source_file)}
+
+        # Add scene parameter if not "All"
+        if scene_name and scene_name != "All":
+            script_args["scene"] = scene_name
+
+        # Blender runs on the thread pool; the list is filled when it reports back
+        runner = self.get_blender_runner()
+        source_file = self.link_source_file
+        self.run_in_background(
+            lambda: self._run_list_objects_script(runner, _LIST_OBJECTS_SCRIPT, script_args),
+            lambda data: self._on_link_source_loaded(source_file, data),
+            lambda error: self.show_error(TITLE_LOAD_ERROR, TMPL_FAILED_TO_LOAD(error=error)),
+            self.link_load_btn,
+            "Loading..."
+        )
+
+    @staticmethod
+    def _run_list_objects_script(runner, script_path: Path, script_args: dict) -> dict:
+        """Run list_objects.py and return its validated result.
 
-                # Parse JSON output
-                from services.blender_service import extract_json_from_output
-                data = extract_json_from_output(result.stdout)
+        Runs on a worker thread, so it must not touch any widgets.
 
-                if "error" in data and data["error"]:
-                    raise Exception(data["error"])
+        Args:
+            runner: Blender script runner
+            script_path: Path to list_objects.py
+            script_args: Script arguments
 
-                # Ensure we have the expected keys
-                if "objects" not in data or "collections" not in data:
-                    raise Exception(f"Invalid data structure: {list(data.keys())}")
+        Returns:
+            Parsed result data
 
-                # Store the data
-                self.link_source_data = data
+        Raises:
+            Exception: If the script reports an error or the data is invalid
+        """
+        result = runner.run_script(
+            script_path,
+            script_args,
+            timeout=TIMEOUT_SHORT
+        )
 
-                # Populate the list
-                self._populate_link_items_list()
+        # Parse JSON output
+        data = extract_json_from_output(result.stdout)
 
-                # Enable preview and execute buttons
-                self.link_preview_btn.setEnabled(True)
-                self.link_execute_btn.setEnabled(True)
+        if "error" in data and data["error"]:
+            raise Exception(data["error"])
 
-        except Exception as e:
-            self.show_error(TITLE_LOAD_ERROR, TMPL_FAILED_TO_LOAD.format(error=str(e)))
+        # Ensure we have the expected keys
+        if "objects" not in data or "collections" not in data:
+            raise Exception(f"Invalid data structure: {list(data.keys())}")
+
+        return data
+
+    def _on_link_source_loaded(self, source_file: Path, data: dict):
+        """Show the items loaded from the source .blend file.
+
+        Args:
+            source_file: Source file the items were loaded from
+            data: Result data from list_objects.py
+        """
+        # The user may have picked another source file in the meantime
+        if self.link_source_file != source_file:
+            return
+
+        # Store the data
+        self.link_source_data = data
+
+        # Populate the list
+        self._populate_link_items_list()
+
+        # Enable preview and execute buttons
+        self._update_controls()
 
     def _populate_link_items_list(self):
         """Populate the list widget with objects and collections based on filter."""
+        # Suspend repaints and per-insert signals while rebuilding; the
+        # selection handler runs once afterwards instead
+        self.link_items_list.setUpdatesEnabled(False)
+        self.link_items_list.blockSignals(True)
+        try:
+            self._fill_link_items_list()
+        finally:
+            self.link_items_list.blockSignals(False)
+            self.link_items_list.setUpdatesEnabled(True)
+
+        self._on_link_item_selection_changed()
+
+    def _fill_link_items_list(self):
+        """Rebuild the items list; called with updates and signals suspended."""
         self.link_items_list.clear()
 
         # Ensure link_source_data is a valid dict
@@ -530,27 +613,12 @@ class LinkObjectsTab(BaseOperationTab):
 
         filter_type = self.link_type_combo.currentText()
 
-        # Add objects
-        if filter_type in ["All", "Objects"]:
-            objects = self.link_source_data.get("objects", [])
-            if isinstance(objects, list):
-                for obj in objects:
-                    if isinstance(obj, dict):
-                        item_text = f"🔷 {obj.get('name', 'Unknown')} ({obj.get('type', 'Unknown')})"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, {"type": "object", "data": obj})
-                        self.link_items_list.addItem(item)
-
-        # Add collections
-        if filter_type in ["All", "Collections"]:
-            collections = self.link_source_data.get("collections", [])
-            if isinstance(collections, list):
-                for col in collections:
-                    if isinstance(col, dict):
-                        item_text = f"📁 {col.get('name', 'Unknown')} ({col.get('objects_count', 0)} objects)"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, {"type": "collection", "data": col})
-                        self.link_items_list.addItem(item)
+        # Materials cannot be linked, so they are never listed here
+        rows = build_item_rows(self.link_source_data, filter_type, include_materials=False)
+        for item_text, item_data in rows:
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.UserRole, item_data)
+            self.link_items_list.addItem(item)
 
         # Apply name filter if there is one
         self._filter_items_by_name()
@@ -567,19 +635,7 @@ class LinkObjectsTab(BaseOperationTab):
         # Show/hide items based on filter text
         for i in range(self.link_items_list.count()):
             item = self.link_items_list.item(i)
-            if not filter_text:
-                # No filter - show all items
-                item.setHidden(False)
-            else:
-                # Get item data to check the actual name
-                item_data = item.data(Qt.UserRole)
-                if item_data and "data" in item_data:
-                    item_name = item_data["data"].get("name", "").lower()
-                    # Show item if name contains filter text
-                    item.setHidden(filter_text not in item_name)
-                else:
-                    # If no data, hide the item
-                    item.setHidden(True)
+            item.setHidden(is_hidden_by_filter(item.data(Qt.UserRole), filter_text))
 
     def _preview_link(self):
         """Preview the link operation."""
@@ -637,14 +693,16 @@ class LinkObjectsTab(BaseOperationTab):
                 if not target_collection.endswith('.link'):
                     target_collection = target_collection + '.link'
 
-        # Extract item names and types
+        # Extract item names and types in a single pass over the selection
         item_names = []
         item_types = []
+        add_name = item_names.append
+        add_type = item_types.append
         for item in selected_items:
             item_data = item.data(Qt.UserRole)
-            if item_data and "data" in item_data:
-                item_names.append(item_data["data"].get("name", ""))
-                item_types.append(item_data["type"])  # 'object' or 'collection'
+            if isinstance(item_data, ItemPayload):
+                add_name(item_data.data.get("name", ""))
+                add_type(item_data.kind)  # 'object' or 'collection'
 
         if not item_names:
             self.show_warning(TITLE_NO_ITEMS, MSG_NO_VALID_ITEMS)
@@ -660,95 +718,121 @@ class LinkObjectsTab(BaseOperationTab):
             return
 
         # Validate selection for instance mode
-        if link_mode == 'instance':
-            # Count total items in selection
-            total_items = len(item_names)
+        if link_mode == 'instance' and len(item_names) != 1:
+            self.show_warning(
+                "Invalid Selection",
+                "Instance mode requires exactly ONE item to be selected.\n\n"
+                "Please select a single collection or object, or switch to 'Individual' mode."
+            )
+            return
 
-            if total_items != 1:
-                self.show_warning(
-                    "Invalid Selection",
-                    "Instance mode requires exactly ONE item to be selected.\n\n"
-                    "Please select a single collection or object, or switch to 'Individual' mode."
-                )
-                return
+        from blender_lib.models import LinkOperationParams
+
+        # Create operation parameters
+        params = LinkOperationParams(
+            target_file=target_file,
+            target_scene=target_scene,
+            source_file=self.link_source_file,
+            item_names=item_names,
+            item_types=item_types,
+            target_collection=target_collection if target_collection else "",
+            link_mode=link_mode,
+            hide_viewport=self.link_as_hidden_checkbox.isChecked(),
+            hide_instancer=self.link_hide_instancer_checkbox.isChecked()
+        )
 
-        # Execute with loading state
-        btn = self.link_preview_btn if dry_run else self.link_execute_btn
-        loading_text = BTN_PROCESSING if dry_run else BTN_EXECUTING
+        # Blender runs on the thread pool; results are shown when it reports back
+        blender_service = self.controller.project.blender_service
+        if dry_run:
+            operation = blender_service.preview_link_operation
+            on_finished = self._show_link_preview
+            btn, loading_text, other_btn = self.link_preview_btn, BTN_PROCESSING, self.link_execute_btn
+        else:
+            operation = blender_service.execute_link_operation
+            on_finished = self._show_link_result
+            btn, loading_text, other_btn = self.link_execute_btn, BTN_EXECUTING, self.link_preview_btn
+
+        self.run_in_background(
+            lambda: operation(params),
+            on_finished,
+            lambda error: self.show_error("Link Error", f"Failed to link items:\n\n{error}"),
+            btn,
+            loading_text,
+            extra_widgets=(other_btn,)
+        )
 
-        try:
-            with self.loading_state(btn, loading_text):
-                from blender_lib.models import LinkOperationParams
-
-                # Create operation parameters
-                params = LinkOperationParams(
-                    target_file=target_file,
-                    target_scene=target_scene,
-                    source_file=self.link_source_file,
-                    item_names=item_names,
-                    item_types=item_types,
-                    target_collection=target_collection if target_collection else "",
-                    link_mode=link_mode,
-                    hide_viewport=self.link_as_hidden_checkbox.isChecked(),
-                    hide_instancer=self.link_hide_instancer_checkbox.isChecked()
-                )
+    def _show_link_preview(self, preview):
+        """Show the result of a link preview.
 
-                if dry_run:
-                    # Preview mode
-                    preview = self.controller.project.blender_service.preview_link_operation(params)
+        Args:
+            preview: OperationPreview from the Blender service
+        """
+        if preview.errors:
+            error_msg = "<b>Cannot link due to errors:</b><br>" + self.format_bullet_list(preview.errors)
 
-                    if preview.errors:
-                        error_msg = "<b>Cannot link due to errors:</b><br>"
-                        for error in preview.errors:
-                            error_msg += f"  • {error}<br>"
+            self.show_error(TITLE_LINK_ERRORS, error_msg)
+        else:
+            # Show preview dialog
+            dialog = OperationPreviewDialog(preview, self)
+            dialog.exec()
 
-                        self.show_error(TITLE_LINK_ERRORS, error_msg)
-                    else:
-                        # Show preview dialog
-                        dialog = OperationPreviewDialog(preview, self)
-                        dialog.exec()
+    def _show_link_result(self, result):
+        """Show the result of an executed link operation.
 
-                else:
-                    # Execute mode
-                    result = self.controller.project.blender_service.execute_link_operation(params)
-
-                    if result.success:
-                        self.show_success(
-                            TITLE_LINK_COMPLETE,
-                            TMPL_LINK_COMPLETE.format(
-                                message=result.message,
-                                changes=result.changes_made
-                            )
-                        )
-
-                        # Clear selection
-                        self.link_items_list.clearSelection()
-                    else:
-                        error_msg = f"<b>Link operation failed:</b><br>{result.message}<br>"
-                        if result.errors:
-                            error_msg += "<br><b>Errors:</b><br>"
-                            for error in result.errors:
-                                error_msg += f"  • {error}<br>"
+        Args:
+            result: OperationResult from the Blender service
+        """
+        if result.success:
+            self.show_success(
+                TITLE_LINK_COMPLETE,
+                TMPL_LINK_COMPLETE(
+                    message=result.message,
+                    changes=result.changes_made
+                )
+            )
+
+            # Clear selection
+            self.link_items_list.clearSelection()
+        else:
+            error_msg = (
+                f"<b>Link operation failed:</b><br>{result.message}<br>"
+                + self.format_message_section("Errors", result.errors)
+            )
 
-                        self.show_error(TITLE_LINK_FAILED, error_msg)
+            self.show_error(TITLE_LINK_FAILED, error_msg)
 
-        except Exception as e:
-            self.show_error("Link Error", f"Failed to link items:\n\n{str(e)}")
+    def _get_link_state(self) -> dict:
+        """Get the link operation config section, reading it on first use.
+
+        Returns:
+            The cached 'link_operation' section (mutable)
+        """
+        if self._link_state_cache is None:
+            link_state = {}
+            try:
+                if self.config_file:
+                    # Copy, the cached document is shared with other readers
+                    link_state = copy.deepcopy(load_json_cached(self.config_file).get('link_operation', {}))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Warning: Could not read link operation state: {e}")
+            self._link_state_cache = link_state
+            self._last_saved_hash = hash(json_dumps(link_state))
+        return self._link_state_cache
 
     def _save_link_state(self):
-        """Save link operation state to config file."""
+        """Save link operation state to config file.
+
+        The state is updated in memory and written after a short delay, so
+        bursts of signals result in a single write.
+        """
         if not self.config_file:
             return
 
         try:
-            # Load existing config
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-
             # Get current state
-            link_state = config_data.get('link_operation', {})
+            link_state = self._get_link_state()
 
             # Save link mode
             link_state['link_mode'] = 'instance' if self.link_mode_instance.isChecked() else 'individual'
@@ -756,18 +840,25 @@ class LinkObjectsTab(BaseOperationTab):
             # Save lock state
             link_state['scene_lock_enabled'] = self.link_scene_lock.isChecked()
 
+            # While a locked file's scenes are loading the combo holds a
+            # placeholder, keep the saved scene until the real one is known
+            scene_name = self.link_scene_combo.currentText()
+            if scene_name == LABEL_LOADING_SCENES:
+                scene_name = ''
+
             # If lock is enabled, save the locked file and scene
             if self.link_scene_lock.isChecked():
                 if self.link_locked_file:
                     link_state['locked_file'] = str(self.link_locked_file)
-                link_state['locked_scene'] = self.link_scene_combo.currentText()
+                if scene_name:
+                    link_state['locked_scene'] = scene_name
 
             # Save per-file scene selection
             # Use locked file if lock is enabled, otherwise use current file
             target_file = self.link_locked_file if self.link_scene_lock.isChecked() else self.current_file
-            if target_file and self.link_scene_combo.currentText():
+            if target_file and scene_name:
                 per_file_scenes = link_state.get('per_file_scenes', {})
-                per_file_scenes[str(target_file)] = self.link_scene_combo.currentText()
+                per_file_scenes[str(target_file)] = scene_name
                 link_state['per_file_scenes'] = per_file_scenes
 
             # Save target collection
@@ -792,25 +883,68 @@ class LinkObjectsTab(BaseOperationTab):
             # Save auto-load checkbox state
             link_state['auto_load'] = self.link_auto_load_checkbox.isChecked()
 
-            config_data['link_operation'] = link_state
+            # Restart the timer so only the last change in a burst is written
+            self._save_timer.start()
+
+        except Exception as e:
+            print(f"Warning: Could not save link operation state: {e}")
+
+    def _flush_link_state(self):
+        """Write the pending link operation state to the config file."""
+        if not self.config_file or self._link_state_cache is None:
+            return
+
+        try:
+            # Reselecting the same values leaves the section unchanged
+            state_hash = hash(json_dumps(self._link_state_cache))
+            if state_hash == self._last_saved_hash:
+                return
 
-            # Write back to file
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            # Re-read the file so changes made by other sections are kept
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
+
+            config_data['link_operation'] = self._link_state_cache
+            write_json_atomic(self.config_file, config_data)
+            self._last_saved_hash = state_hash
 
         except Exception as e:
             print(f"Warning: Could not save link operation state: {e}")
 
+    def flush_pending_state(self):
+        """Write any link state still waiting for the save timer."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._flush_link_state()
+
+    @staticmethod
+    def _path_exists(path: str) -> bool:
+        """Check that a path from the config exists with a single stat call.
+
+        Args:
+            path: Path string as stored in the config
+
+        Returns:
+            True if the path exists
+        """
+        try:
+            os.stat(path)
+        except (OSError, ValueError):
+            return False
+        return True
+
     def _restore_link_state(self):
         """Restore link operation state from config file."""
-        if not self.config_file or not self.config_file.exists():
+        if not self.config_file:
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
-
-            link_state = config_data.get('link_operation', {})
+            try:
+                link_state = load_json_cached(self.config_file).get('link_operation', {})
+            except FileNotFoundError:
+                return
 
             # Restore link mode
             link_mode = link_state.get('link_mode', 'instance')
@@ -826,15 +960,16 @@ class LinkObjectsTab(BaseOperationTab):
             if scene_lock_enabled:
                 locked_file = link_state.get('locked_file')
                 locked_scene = link_state.get('locked_scene')
-                if locked_file and Path(locked_file).exists():
+                if locked_file and self._path_exists(locked_file):
+                    locked_path = Path(locked_file)
                     # Check if project is open (blender_service available)
                     if self.controller.project.is_open and self.controller.project.blender_service:
                         # Project is open, restore immediately
-                        self._apply_locked_file_restoration(Path(locked_file), locked_scene)
+                        self._apply_locked_file_restoration(locked_path, locked_scene)
                     else:
                         # Project not open yet, defer restoration
                         self.pending_locked_file_restore = {
-                            'locked_file': Path(locked_file),
+                            'locked_file': locked_path,
                             'locked_scene': locked_scene
                         }
                 else:
@@ -885,14 +1020,12 @@ class LinkObjectsTab(BaseOperationTab):
         # Use locked file if lock is enabled, otherwise use current file
         target_file = self.link_locked_file if self.link_scene_lock.isChecked() else self.current_file
 
-        if not self.config_file or not self.config_file.exists() or not target_file:
+        if not self.config_file or not target_file:
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
-
-            link_state = config_data.get('link_operation', {})
+            # Use the in-memory state, the file may not have been written yet
+            link_state = self._get_link_state()
 
             # Check if lock is enabled
             if link_state.get('scene_lock_enabled', False):
@@ -916,15 +1049,51 @@ class LinkObjectsTab(BaseOperationTab):
             print(f"Warning: Could not restore scene selection: {e}")
 
     def _apply_locked_file_restoration(self, locked_file: Path, locked_scene: str):
-        """Apply locked file restoration when blender_service is available."""
-        try:
-            self.link_locked_file = locked_file
-            # Update the display to show the locked file
-            self.link_target_display.setText(f"<b>{locked_file.name}</b><br><small>{str(locked_file)}</small>")
+        """Apply locked file restoration when blender_service is available.
+
+        The scenes are read on the thread pool, so opening a project does not
+        wait for Blender; the scene combo shows a placeholder meanwhile.
+        """
+        self.link_locked_file = locked_file
+        # Update the display to show the locked file
+        self.link_target_display.setText(f"<b>{locked_file.name}</b><br><small>{str(locked_file)}</small>")
+
+        self.link_scene_combo.blockSignals(True)
+        self.link_scene_combo.clear()
+        self.link_scene_combo.addItem(LABEL_LOADING_SCENES)
+        self.link_scene_combo.setEnabled(False)
+        self.link_scene_combo.blockSignals(False)
+
+        # Tick the lock now, the rest of the restore saves the state before
+        # the scenes arrive and would otherwise write the lock as disabled
+        self.link_scene_lock.blockSignals(True)
+        self.link_scene_lock.setChecked(True)
+        self.link_scene_lock.blockSignals(False)
+
+        # Load scenes for the locked file
+        blender_service = self.controller.project.blender_service
+        self.run_in_background(
+            lambda: blender_service.get_scenes(locked_file),
+            lambda scenes: self._on_locked_scenes_loaded(locked_file, locked_scene, scenes),
+            lambda error: self._on_locked_scenes_failed(locked_file, error),
+            self.link_load_target_scenes_btn,
+            BTN_LOADING
+        )
+
+    def _on_locked_scenes_loaded(self, locked_file: Path, locked_scene: str, scenes: list):
+        """Finish locked file restoration once its scenes are loaded.
 
-            # Load scenes for the locked file
-            blender_service = self.controller.project.blender_service
-            scenes = blender_service.get_scenes(locked_file)
+        Args:
+            locked_file: Locked file the scenes were loaded for
+            locked_scene: Scene to select, if it still exists
+            scenes: Scenes returned by blender_service.get_scenes
+        """
+        # The user may have unlocked or picked another file in the meantime
+        if self.link_locked_file != locked_file:
+            self._update_scene_combo_state()
+            return
+
+        try:
             self.link_scenes = scenes
 
             # Block signals during restoration to avoid saving state while loading
@@ -940,11 +1109,6 @@ class LinkObjectsTab(BaseOperationTab):
                         self.link_scene_combo.setCurrentIndex(index)
             self.link_scene_combo.blockSignals(False)
 
-            # Block signals while setting checkbox to avoid validation during initialization
-            self.link_scene_lock.blockSignals(True)
-            self.link_scene_lock.setChecked(True)
-            self.link_scene_lock.blockSignals(False)
-
             # Update scene combo state (will be disabled because lock is checked)
             self._update_scene_combo_state()
 
@@ -955,6 +1119,28 @@ class LinkObjectsTab(BaseOperationTab):
             self.link_scene_combo.blockSignals(False)
             print(f"Warning: Could not apply locked file restoration: {e}")
 
+    def _on_locked_scenes_failed(self, locked_file: Path, error: str):
+        """Handle a failed scene load during locked file restoration.
+
+        Args:
+            locked_file: Locked file the scenes were requested for
+            error: Error message from the background task
+        """
+        if self.link_locked_file == locked_file:
+            self.link_scenes = []
+            self.link_scene_combo.blockSignals(True)
+            self.link_scene_combo.clear()
+            self.link_scene_combo.blockSignals(False)
+            # Without scenes the lock cannot be kept, leave the saved state as is
+            self.link_locked_file = None
+            self.link_scene_lock.blockSignals(True)
+            self.link_scene_lock.setChecked(False)
+            self.link_scene_lock.blockSignals(False)
+        # Restoration disabled the combo while loading
+        self._update_scene_combo_state()
+        self._update_controls()
+        print(f"Warning: Could not apply locked file restoration: {error}")
+
     def apply_pending_restorations(self):
         """Apply any pending restorations after project is opened."""
         if self.pending_locked_file_restore:
@@ -970,18 +1156,14 @@ class LinkObjectsTab(BaseOperationTab):
 
         # Auto-copy name if checkbox is checked and exactly one item is selected
         if self.link_auto_copy_name_checkbox.isChecked() and len(selected_items) == 1:
-            item_data = selected_items[0].data(Qt.UserRole)
-            if item_data and "data" in item_data:
-                item_name = item_data["data"].get("name", "")
-                if item_name:
-                    self.link_collection_input.setText(item_name)
+            item_name = payload_name(selected_items[0].data(Qt.UserRole))
+            if item_name:
+                self.link_collection_input.setText(item_name)
 
     def _copy_item_name_to_collection(self):
         """Copy the selected item name to the target collection field."""
         selected_items = self.link_items_list.selectedItems()
         if len(selected_items) == 1:
-            item_data = selected_items[0].data(Qt.UserRole)
-            if item_data and "data" in item_data:
-                item_name = item_data["data"].get("name", "")
-                if item_name:
-                    self.link_collection_input.setText(item_name)
+            item_name = payload_name(selected_items[0].data(Qt.UserRole))
+            if item_name:
+                self.link_collection_input.setText(item_name)
@@ -1,10 +1,11 @@
 """Move/Rename tab for file and directory operations."""
 
+import os
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QScrollArea, QWidget, QFileDialog, QApplication
+    QScrollArea, QWidget, QFileDialog
 )
 
 from gui.operations.base_tab import BaseOperationTab
@@ -20,6 +21,10 @@ from gui.ui_strings import (
 from blender_lib.constants import TIMEOUT_MEDIUM
 from services.blender_service import extract_json_from_output
 
+# Blender scripts used by this tab, resolved once at import
+_BLENDER_LIB = Path(__file__).parent.parent.parent / "blender_lib"
+_RENAME_TEXTURE_SCRIPT = _BLENDER_LIB / "rename_texture.py"
+
 
 class MoveRenameTab(BaseOperationTab):
     """Tab for moving and renaming files and directories."""
@@ -101,9 +106,14 @@ class MoveRenameTab(BaseOperationTab):
 
         # Update UI for move/rename tab
         self.new_path_input.setText(str(file_path))
-        self.browse_btn.setEnabled(True)
-        self.preview_btn.setEnabled(True)
-        self.execute_btn.setEnabled(True)
+        self._update_controls()
+
+    def _update_controls(self):
+        """Enable the action buttons for a selected file unless a task is running."""
+        enabled = self.current_file is not None and not self.is_busy
+        self.browse_btn.setEnabled(enabled)
+        self.preview_btn.setEnabled(enabled)
+        self.execute_btn.setEnabled(enabled)
 
     def _browse_new_path(self):
         """Open file dialog to select new path."""
@@ -111,11 +121,7 @@ class MoveRenameTab(BaseOperationTab):
             return
 
         # Show loading state while dialog is open
-        self.browse_btn.setText("Browsing...")
-        self.browse_btn.setEnabled(False)
-        QApplication.processEvents()
-
-        try:
+        with self.loading_state(self.browse_btn, "Browsing...", wait_cursor=False):
             new_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Select New Location",
@@ -126,23 +132,20 @@ class MoveRenameTab(BaseOperationTab):
             if new_path:
                 self.new_path_input.setText(new_path)
 
-        finally:
-            # Restore button state
-            self.browse_btn.setText("Browse...")
-            self.browse_btn.setEnabled(True)
-
     def _preview_operation(self):
         """Show preview dialog for the operation."""
         if not self.current_file:
             self.show_warning(TITLE_NO_FILE, MSG_SELECT_FILE)
             return
 
-        new_path = Path(self.new_path_input.text())
+        new_path_str = self.new_path_input.text().strip()
 
-        if new_path == self.current_file:
+        if self._is_same_path(new_path_str, str(self.current_file)):
             self.show_info(TITLE_NO_CHANGE, MSG_SOURCE_TARGET_SAME)
             return
 
+        new_path = Path(new_path_str)
+
         # Check file/directory type
         is_directory = self.is_directory(self.current_file)
         is_blend = self.is_blend_file(self.current_file)
@@ -154,7 +157,6 @@ class MoveRenameTab(BaseOperationTab):
                 # Use progress dialog for directories and .blend files
                 progress_dialog = OperationProgressDialog("Generating Preview", self)
                 progress_dialog.show()
-                QApplication.processEvents()
 
                 # Generate preview with progress updates
                 preview = self.controller.preview_move_file(
@@ -172,33 +174,18 @@ class MoveRenameTab(BaseOperationTab):
                 dialog.exec()
 
             elif is_texture:
-                # Handle texture files using Blender script with loading state
-                with self.loading_state(self.preview_btn, "Loading Preview..."):
-                    runner = self.get_blender_runner()
-                    script_path = Path(__file__).parent.parent.parent / "blender_lib" / "rename_texture.py"
-                    project_root = self.get_project_root()
-
-                    # Run preview
-                    result = runner.run_script(
-                        script_path,
-                        {
-                            "old-path": str(self.current_file),
-                            "new-path": str(new_path),
-                            "project-root": str(project_root),
-                            "dry-run": "true"
-                        },
-                        timeout=TIMEOUT_MEDIUM
-                    )
-
-                    # Parse JSON output
-                    data = extract_json_from_output(result.stdout)
-
-                    if not data.get("success", False):
-                        errors = data.get("errors", [])
-                        raise Exception(errors[0] if errors else "Unknown error")
-
-                    # Show results
-                    self._show_texture_preview_results(data, new_path)
+                # Run the Blender script off the GUI thread and show results when it reports back
+                runner = self.get_blender_runner()
+                script_args = self._rename_texture_args(new_path, dry_run=True)
+                old_path = self.current_file
+                self.run_in_background(
+                    lambda: self._run_rename_texture_script(runner, script_args),
+                    lambda data: self._show_texture_preview_results(data, old_path, new_path),
+                    lambda error: self.show_error("Preview Error", f"Failed to generate preview:\n\n{error}"),
+                    self.preview_btn,
+                    "Loading Preview...",
+                    extra_widgets=(self.execute_btn, self.browse_btn)
+                )
 
             else:
                 # Unsupported file type
@@ -215,40 +202,66 @@ class MoveRenameTab(BaseOperationTab):
             if progress_dialog:
                 progress_dialog.close()
 
-    def _show_texture_preview_results(self, data: dict, new_path: Path):
+    def _show_texture_preview_results(self, data: dict, old_path: Path, new_path: Path):
         """Show preview results for texture file rename.
 
         Args:
             data: Result data from Blender script
+            old_path: Texture file the preview was run for
             new_path: New path for texture file
         """
         updated_files = data.get("updated_files", [])
         updated_files_count = data.get("updated_files_count", 0)
         warnings = data.get("warnings", [])
 
-        message_parts = []
-        message_parts.append(f"<b>Will rename texture file:</b><br>")
-        message_parts.append(f"  {self.current_file.name} → {new_path.name}<br>")
-
         if updated_files_count > 0:
-            message_parts.append(f"<br><b>Will update {updated_files_count} .blend file(s):</b><br>")
-            for file_info in updated_files[:5]:
-                file_name = Path(file_info["file"]).name
-                image_count = len(file_info["updated_images"])
-                message_parts.append(f"  • {file_name} ({image_count} image(s))<br>")
-            if len(updated_files) > 5:
-                message_parts.append(f"  ... and {len(updated_files) - 5} more<br>")
+            files_text = (
+                f"<br><b>Will update {updated_files_count} .blend file(s):</b><br>"
+                + self.format_bullet_list(
+                    [f"{name} ({count} image(s))" for name, count in self._texture_display_rows(updated_files)],
+                    len(updated_files) - 5
+                )
+            )
         else:
-            message_parts.append("<br><i>No .blend files reference this texture.</i><br>")
+            files_text = "<br><i>No .blend files reference this texture.</i><br>"
+
+        message = (
+            f"<b>Will rename texture file:</b><br>"
+            f"  {old_path.name} → {new_path.name}<br>"
+            f"{files_text}"
+            f"{self.format_message_section('Warnings', warnings[:5], len(warnings) - 5)}"
+        )
+
+        self.show_info("Preview Results", message)
+
+    @staticmethod
+    def _is_same_path(path_a: str, path_b: str) -> bool:
+        """Check whether two path strings point to the same location.
 
-        if warnings:
-            message_parts.append(f"<br><b>Warnings:</b><br>")
-            for warning in warnings[:5]:
-                message_parts.append(f"  • {warning}<br>")
-            if len(warnings) > 5:
-                message_parts.append(f"  ... and {len(warnings) - 5} more<br>")
+        Compares normalized strings, which is much cheaper than building
+        Path objects just to compare them.
 
-        self.show_info("Preview Results", "".join(message_parts))
+        Args:
+            path_a: First path
+            path_b: Second path
+
+        Returns:
+            True if both normalize to the same path
+        """
+        return os.path.normcase(os.path.normpath(path_a)) == os.path.normcase(os.path.normpath(path_b))
+
+    @staticmethod
+    def _texture_display_rows(updated_files: list) -> list:
+        """Get (file name, image count) pairs for the files shown in a message.
+
+        Args:
+            updated_files: Updated file entries from rename_texture.py
+
+        Returns:
+            Pairs for at most the first five files
+        """
+        # os.path.basename avoids building a Path per entry just for .name
+        return [(os.path.basename(fi["file"]), len(fi["updated_images"])) for fi in updated_files[:5]]
 
     def _execute_operation(self):
         """Execute the move operation."""
@@ -256,12 +269,14 @@ class MoveRenameTab(BaseOperationTab):
             self.show_warning(TITLE_NO_FILE, MSG_SELECT_FILE)
             return
 
-        new_path = Path(self.new_path_input.text())
+        new_path_str = self.new_path_input.text().strip()
 
-        if new_path == self.current_file:
+        if self._is_same_path(new_path_str, str(self.current_file)):
             self.show_info(TITLE_NO_CHANGE, MSG_SOURCE_TARGET_SAME)
             return
 
+        new_path = Path(new_path_str)
+
         # Check file/directory type
         is_directory = self.is_directory(self.current_file)
         is_blend = self.is_blend_file(self.current_file)
@@ -271,7 +286,7 @@ class MoveRenameTab(BaseOperationTab):
         item_type = "directory" if is_directory else "file"
         confirmed = self.confirm(
             TITLE_CONFIRM_OPERATION,
-            TMPL_CONFIRM_MOVE.format(
+            TMPL_CONFIRM_MOVE(
                 item_type=item_type,
                 old_path=self.current_file,
                 new_path=new_path
@@ -309,14 +324,12 @@ class MoveRenameTab(BaseOperationTab):
         self.execute_btn.setEnabled(False)
         self.preview_btn.setEnabled(False)
         self.browse_btn.setEnabled(False)
-        QApplication.processEvents()
 
         try:
             # Create and show progress dialog
             item_name = f"{self.current_file.name}/" if is_directory else self.current_file.name
             progress_dialog = OperationProgressDialog(f"Moving {item_name}", self)
             progress_dialog.show()
-            QApplication.processEvents()
 
             # Execute operation
             result = self.controller.execute_move_file(
@@ -332,7 +345,7 @@ class MoveRenameTab(BaseOperationTab):
 
                 self.show_success(
                     TITLE_SUCCESS,
-                    TMPL_SUCCESS_WITH_CHANGES.format(
+                    TMPL_SUCCESS_WITH_CHANGES(
                         message=result.message,
                         changes=result.changes_made
                     )
@@ -344,7 +357,7 @@ class MoveRenameTab(BaseOperationTab):
                 progress_dialog.mark_error(result.message)
                 progress_dialog.exec()
 
-                self.show_error(TITLE_ERROR, TMPL_OPERATION_FAILED.format(message=result.message))
+                self.show_error(TITLE_ERROR, TMPL_OPERATION_FAILED(message=result.message))
 
                 # Restore button state on error
                 self._restore_button_state()
@@ -359,49 +372,70 @@ class MoveRenameTab(BaseOperationTab):
         Args:
             new_path: New path for the texture file
         """
-        with self.loading_state(self.execute_btn, BTN_EXECUTING):
-            # Also disable other buttons
-            self.preview_btn.setEnabled(False)
-            self.browse_btn.setEnabled(False)
+        # Run the Blender script off the GUI thread and show results when it reports back
+        runner = self.get_blender_runner()
+        script_args = self._rename_texture_args(new_path, dry_run=False)
+        old_path = self.current_file
+        self.run_in_background(
+            lambda: self._run_rename_texture_script(runner, script_args),
+            lambda data: self._show_texture_execute_results(data, old_path, new_path),
+            lambda error: self.show_error("Error", f"Operation failed:\n\n{error}"),
+            self.execute_btn,
+            BTN_EXECUTING,
+            extra_widgets=(self.preview_btn, self.browse_btn)
+        )
 
-            try:
-                # Handle texture files using Blender script
-                runner = self.get_blender_runner()
-                script_path = Path(__file__).parent.parent.parent / "blender_lib" / "rename_texture.py"
-                project_root = self.get_project_root()
-
-                # Run execute
-                result = runner.run_script(
-                    script_path,
-                    {
-                        "old-path": str(self.current_file),
-                        "new-path": str(new_path),
-                        "project-root": str(project_root),
-                        "dry-run": "false"
-                    },
-                    timeout=TIMEOUT_MEDIUM
-                )
+    def _rename_texture_args(self, new_path: Path, dry_run: bool) -> dict:
+        """Build rename_texture.py arguments for the current file.
+
+        Args:
+            new_path: New path for the texture file
+            dry_run: Whether to only preview the rename
+
+        Returns:
+            Script arguments
+        """
+        return {
+            "old-path": str(self.current_file),
+            "new-path": str(new_path),
+            "project-root": str(self.get_project_root()),
+            "dry-run": "true" if dry_run else "false"
+        }
+
+    @staticmethod
+    def _run_rename_texture_script(runner, script_args: dict) -> dict:
+        """Run rename_texture.py and return its result.
+
+        Runs on a worker thread, so it must not touch any widgets.
 
-                # Parse JSON output
-                data = extract_json_from_output(result.stdout)
+        Args:
+            runner: Blender script runner
+            script_args: Arguments from _rename_texture_args
+
+        Returns:
+            Parsed result data
+
+        Raises:
+            Exception: If the script reports failure
+        """
+        # Only the JSON region of stdout is kept; updated_files can be large
+        result = runner.run_script_streaming(_RENAME_TEXTURE_SCRIPT, script_args, timeout=TIMEOUT_MEDIUM)
 
-                if not data.get("success", False):
-                    errors = data.get("errors", [])
-                    raise Exception(errors[0] if errors else "Unknown error")
+        # Parse JSON output
+        data = extract_json_from_output(result.stdout)
 
-                # Show results
-                self._show_texture_execute_results(data, new_path)
+        if not data.get("success", False):
+            errors = data.get("errors", [])
+            raise Exception(errors[0] if errors else "Unknown error")
 
-            finally:
-                # Restore other buttons
-                self.preview_btn.setEnabled(True)
-                self.browse_btn.setEnabled(True)
+        return data
 
-    def _show_texture_execute_results(self, data: dict, new_path: Path):
+    def _show_texture_execute_results(self, data: dict, old_path: Path, new_path: Path):
         """Show execution results for texture file rename.
 
         Args:
             data: Result data from Blender script
+            old_path: Texture file the rename was run for
             new_path: New path for texture file
         """
         updated_files = data.get("updated_files", [])
@@ -410,35 +444,30 @@ class MoveRenameTab(BaseOperationTab):
         warnings = data.get("warnings", [])
         errors = data.get("errors", [])
 
-        message_parts = []
-
-        if file_moved:
-            message_parts.append(f"<b>Successfully renamed texture file!</b><br>")
+        if updated_files_count > 0:
+            files_text = (
+                f"<br><b>Updated {updated_files_count} .blend file(s):</b><br>"
+                + self.format_bullet_list(
+                    [f"{name} ({count} image(s))" for name, count in self._texture_display_rows(updated_files)],
+                    len(updated_files) - 5
+                )
+            )
         else:
-            message_parts.append(f"<b>Texture file prepared for rename.</b><br>")
+            files_text = ""
+
+        status = "Successfully renamed texture file!" if file_moved else "Texture file prepared for rename."
+        message = (
+            f"<b>{status}</b><br>"
+            f"{files_text}"
+            f"{self.format_message_section('Warnings', warnings[:5], len(warnings) - 5)}"
+            f"{self.format_message_section('Errors', errors)}"
+        )
 
-        if updated_files_count > 0:
-            message_parts.append(f"<br><b>Updated {updated_files_count} .blend file(s):</b><br>")
-            for file_info in updated_files[:5]:
-                file_name = Path(file_info["file"]).name
-                image_count = len(file_info["updated_images"])
-                message_parts.append(f"  • {file_name} ({image_count} image(s))<br>")
-            if len(updated_files) > 5:
-                message_parts.append(f"  ... and {len(updated_files) - 5} more<br>")
-
-        if warnings:
-            message_parts.append(f"<br><b>Warnings:</b><br>")
-            for warning in warnings[:5]:
-                message_parts.append(f"  • {warning}<br>")
-            if len(warnings) > 5:
-                message_parts.append(f"  ... and {len(warnings) - 5} more<br>")
-
-        if errors:
-            message_parts.append(f"<br><b>Errors:</b><br>")
-            for error in errors:
-                message_parts.append(f"  • {error}<br>")
-
-        self.show_info("Rename Complete", "".join(message_parts))
+        self.show_info("Rename Complete", message)
+
+        # The user may have selected another file while the rename ran
+        if self.current_file != old_path:
+            return
 
         # Clear inputs after successful execution
         if file_moved:
@@ -460,6 +489,4 @@ class MoveRenameTab(BaseOperationTab):
     def _restore_button_state(self):
         """Restore button state after operation."""
         self.execute_btn.setText(BTN_EXECUTE_MOVE)
-        self.execute_btn.setEnabled(True)
-        self.preview_btn.setEnabled(True)
-        self.browse_btn.setEnabled(True)
+        self._update_controls()
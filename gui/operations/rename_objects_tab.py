@@ -1,6 +1,7 @@
 """Rename Objects/Collections tab for bulk renaming within .blend files."""
 
-import json
+import os
+import tempfile
 from pathlib import Path
 
 from PySide6.QtCore import Qt
@@ -10,15 +11,24 @@ from PySide6.QtWidgets import (
 )
 
 from gui.operations.base_tab import BaseOperationTab
+from gui.operations.list_items import build_item_rows, is_hidden_by_filter, payload_name
 from gui.progress_dialog import OperationProgressDialog
 from gui.ui_strings import (
-    TITLE_NO_FILE, TITLE_NO_SELECTION, TITLE_MISSING_INPUT, TITLE_NO_ITEMS, TITLE_CONFIRM_RENAME,
-    MSG_SELECT_BLEND_FILE, MSG_SELECT_ITEMS_TO_RENAME, MSG_ENTER_FIND_TEXT, MSG_NO_VALID_ITEMS,
+    TITLE_NO_FILE, TITLE_NO_SELECTION, TITLE_NO_ITEMS, TITLE_MISSING_INPUT,
+    TITLE_CONFIRM_RENAME,
+    MSG_SELECT_BLEND_FILE, MSG_SELECT_ITEMS_TO_RENAME, MSG_NO_VALID_ITEMS,
+    MSG_ENTER_FIND_TEXT,
     TMPL_CONFIRM_RENAME_OBJECTS, TMPL_FAILED_TO_LOAD,
     BTN_PROCESSING, BTN_EXECUTING
 )
 from blender_lib.constants import TIMEOUT_SHORT, TIMEOUT_MEDIUM
-from services.blender_service import extract_json_from_output
+from core.json_utils import load_json_cached, write_json_atomic
+from services.blender_service import extract_json_from_output, read_json_result
+
+# Blender scripts used by this tab, resolved once at import
+_BLENDER_LIB = Path(__file__).parent.parent.parent / "blender_lib"
+_LIST_OBJECTS_SCRIPT = _BLENDER_LIB / "list_objects.py"
+_RENAME_OBJECTS_SCRIPT = _BLENDER_LIB / "rename_objects.py"
 
 
 class RenameObjectsTab(BaseOperationTab):
@@ -35,6 +45,8 @@ class RenameObjectsTab(BaseOperationTab):
         super().__init__(controller, parent)
         self.config_file = config_file
         self.obj_list_data = {"objects": [], "collections": [], "materials": []}
+        # Names of the selected items, kept in sync by _on_object_selection_changed
+        self._selected_names: list[str] = []
         self.setup_ui()
         self._restore_state()
 
@@ -163,6 +175,12 @@ class RenameObjectsTab(BaseOperationTab):
         self.obj_execute_btn.clicked.connect(self._execute_rename_objects)
         tab_layout.addWidget(self.obj_execute_btn)
 
+        # Widgets toggled together when the selected file changes
+        self._file_type_widgets = {
+            'blend_only': (self.obj_load_scenes_btn, self.obj_load_btn),
+            'needs_items': (self.obj_preview_btn, self.obj_execute_btn),
+        }
+
         # Add stretch
         tab_layout.addStretch()
 
@@ -183,13 +201,20 @@ class RenameObjectsTab(BaseOperationTab):
         super().set_file(file_path)
 
         # Update Rename Objects tab (only for .blend files)
-        if self.is_blend_file(file_path):
-            self.obj_load_scenes_btn.setEnabled(True)
-            self.obj_load_btn.setEnabled(True)
-            self.obj_list.clear()
-            self.obj_filter_input.clear()
-            self.obj_list_data = {"objects": [], "collections": [], "materials": []}
+        is_blend = self.is_blend_file(file_path)
 
+        for widget in self._file_type_widgets['blend_only']:
+            widget.setEnabled(is_blend)
+
+        # Any previously loaded items belong to the old file
+        for widget in self._file_type_widgets['needs_items']:
+            widget.setEnabled(False)
+        self.obj_list.clear()
+        self._selected_names = []
+        self.obj_filter_input.clear()
+        self.obj_list_data = {"objects": [], "collections": [], "materials": []}
+
+        if is_blend:
             # Auto-load if checkbox is checked AND this tab is visible
             if self.obj_auto_load_checkbox.isChecked() and self.isVisible():
                 self._load_scenes_for_rename()
@@ -197,13 +222,6 @@ class RenameObjectsTab(BaseOperationTab):
         else:
             self.obj_scene_combo.clear()
             self.obj_scene_combo.setEnabled(False)
-            self.obj_load_scenes_btn.setEnabled(False)
-            self.obj_load_btn.setEnabled(False)
-            self.obj_preview_btn.setEnabled(False)
-            self.obj_execute_btn.setEnabled(False)
-            self.obj_list.clear()
-            self.obj_filter_input.clear()
-            self.obj_list_data = {"objects": [], "collections": [], "materials": []}
 
     def _load_scenes_for_rename(self):
         """Load scenes from the .blend file."""
@@ -240,7 +258,7 @@ class RenameObjectsTab(BaseOperationTab):
             with self.loading_state(self.obj_load_btn, "Loading..."):
                 # Get the blender runner from controller
                 runner = self.get_blender_runner()
-                script_path = Path(__file__).parent.parent.parent / "blender_lib" / "list_objects.py"
+                script_path = _LIST_OBJECTS_SCRIPT
 
                 # Verify script exists
                 if not script_path.exists():
@@ -254,15 +272,22 @@ class RenameObjectsTab(BaseOperationTab):
                 if scene_name and scene_name != "All":
                     script_args["scene"] = scene_name
 
-                # Run the script with blend file as argument
-                result = runner.run_script(
-                    script_path,
-                    script_args,
-                    timeout=TIMEOUT_SHORT
-                )
-
-                # Parse JSON output
-                data = extract_json_from_output(result.stdout)
+                # Large scenes produce multi-MB output, so have the script
+                # write it to a file rather than piping it through stdout
+                fd, output_path = tempfile.mkstemp(suffix='.json')
+                os.close(fd)
+                output_path = Path(output_path)
+                script_args["output-json"] = str(output_path)
+
+                try:
+                    result = runner.run_script(
+                        script_path,
+                        script_args,
+                        timeout=TIMEOUT_SHORT
+                    )
+                    data = read_json_result(output_path, result.stdout)
+                finally:
+                    output_path.unlink(missing_ok=True)
 
                 # Validate data structure
                 if not isinstance(data, dict):
@@ -285,11 +310,12 @@ class RenameObjectsTab(BaseOperationTab):
                 self.obj_execute_btn.setEnabled(True)
 
         except Exception as e:
-            self.show_error("Load Error", TMPL_FAILED_TO_LOAD.format(error=str(e)))
+            self.show_error("Load Error", TMPL_FAILED_TO_LOAD(error=str(e)))
 
     def _populate_objects_list(self):
         """Populate the list widget with objects and collections."""
         self.obj_list.clear()
+        self._selected_names = []
 
         # Ensure obj_list_data is a valid dict
         if not isinstance(self.obj_list_data, dict):
@@ -297,36 +323,10 @@ class RenameObjectsTab(BaseOperationTab):
 
         filter_type = self.obj_type_combo.currentText()
 
-        if filter_type in ["All", "Objects"]:
-            objects = self.obj_list_data.get("objects", [])
-            if isinstance(objects, list):
-                for obj in objects:
-                    if isinstance(obj, dict):
-                        item_text = f"🔷 {obj.get('name', 'Unknown')} ({obj.get('type', 'Unknown')})"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, {"type": "object", "data": obj})
-                        self.obj_list.addItem(item)
-
-        if filter_type in ["All", "Collections"]:
-            collections = self.obj_list_data.get("collections", [])
-            if isinstance(collections, list):
-                for col in collections:
-                    if isinstance(col, dict):
-                        item_text = f"📁 {col.get('name', 'Unknown')} ({col.get('objects_count', 0)} objects)"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, {"type": "collection", "data": col})
-                        self.obj_list.addItem(item)
-
-        if filter_type in ["All", "Materials"]:
-            materials = self.obj_list_data.get("materials", [])
-            if isinstance(materials, list):
-                for mat in materials:
-                    if isinstance(mat, dict):
-                        nodes_text = "nodes" if mat.get("use_nodes", False) else "no nodes"
-                        item_text = f"🎨 {mat.get('name', 'Unknown')} ({nodes_text}, {mat.get('users', 0)} users)"
-                        item = QListWidgetItem(item_text)
-                        item.setData(Qt.UserRole, {"type": "material", "data": mat})
-                        self.obj_list.addItem(item)
+        for item_text, item_data in build_item_rows(self.obj_list_data, filter_type):
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.UserRole, item_data)
+            self.obj_list.addItem(item)
 
         # Apply name filter if there is one
         self._filter_items_by_name()
@@ -343,48 +343,31 @@ class RenameObjectsTab(BaseOperationTab):
         # Show/hide items based on filter text
         for i in range(self.obj_list.count()):
             item = self.obj_list.item(i)
-            if not filter_text:
-                # No filter - show all items
-                item.setHidden(False)
-            else:
-                # Get item data to check the actual name
-                item_data = item.data(Qt.UserRole)
-                if item_data and "data" in item_data:
-                    item_name = item_data["data"].get("name", "").lower()
-                    # Show item if name contains filter text
-                    item.setHidden(filter_text not in item_name)
-                else:
-                    # If no data, hide the item
-                    item.setHidden(True)
+            item.setHidden(is_hidden_by_filter(item.data(Qt.UserRole), filter_text))
 
     def _on_object_selection_changed(self):
         """Handle when objects/collections are selected in the list."""
-        selected_items = self.obj_list.selectedItems()
-
-        if not selected_items:
+        # Cache the names so renaming does not walk the items again
+        names = []
+        for item in self.obj_list.selectedItems():
+            name = payload_name(item.data(Qt.UserRole))
+            if name is not None:
+                names.append(name)
+        self._selected_names = names
+
+        if not names:
             # Clear if nothing selected
             self.obj_find_input.clear()
             return
 
-        if len(selected_items) == 1:
+        if len(names) == 1:
             # Single selection - fill with exact name
-            item_data = selected_items[0].data(Qt.UserRole)
-            if item_data and "data" in item_data:
-                name = item_data["data"].get("name", "")
-                self.obj_find_input.setText(name)
+            self.obj_find_input.setText(names[0])
         else:
-            # Multiple selection - try to find common pattern
-            names = []
-            for item in selected_items:
-                item_data = item.data(Qt.UserRole)
-                if item_data and "data" in item_data:
-                    names.append(item_data["data"].get("name", ""))
-
-            # Find common prefix or suffix
-            if names:
-                # For now, just show the first name as a hint
-                # User can modify to create a pattern
-                self.obj_find_input.setText(names[0])
+            # Multiple selection - prefill the shared prefix (e.g. "Chair_"),
+            # falling back to the first name when there is none
+            common = os.path.commonprefix(names)
+            self.obj_find_input.setText(common or names[0])
 
     def _copy_find_to_replace(self):
         """Copy the 'Find' text to the 'Replace' field."""
@@ -415,10 +398,14 @@ class RenameObjectsTab(BaseOperationTab):
             self.show_warning(TITLE_NO_FILE, MSG_SELECT_BLEND_FILE)
             return
 
-        # Get selected items
-        selected_items = self.obj_list.selectedItems()
-        if not selected_items:
-            self.show_warning(TITLE_NO_SELECTION, MSG_SELECT_ITEMS_TO_RENAME)
+        # Get selected item names
+        item_names = self._selected_names
+        if not item_names:
+            if self.obj_list.selectedItems():
+                # Rows are selected but none of them carry a usable name
+                self.show_warning(TITLE_NO_ITEMS, MSG_NO_VALID_ITEMS)
+            else:
+                self.show_warning(TITLE_NO_SELECTION, MSG_SELECT_ITEMS_TO_RENAME)
             return
 
         # Get find/replace text
@@ -429,17 +416,6 @@ class RenameObjectsTab(BaseOperationTab):
             self.show_warning(TITLE_MISSING_INPUT, MSG_ENTER_FIND_TEXT)
             return
 
-        # Extract item names
-        item_names = []
-        for item in selected_items:
-            item_data = item.data(Qt.UserRole)
-            if item_data and "data" in item_data:
-                item_names.append(item_data["data"].get("name", ""))
-
-        if not item_names:
-            self.show_warning(TITLE_NO_ITEMS, MSG_NO_VALID_ITEMS)
-            return
-
         # For preview, use loading state; for execute, use progress dialog
         if dry_run:
             self._run_rename_with_loading_state(item_names, find_text, replace_text, dry_run)
@@ -451,7 +427,7 @@ class RenameObjectsTab(BaseOperationTab):
         try:
             with self.loading_state(self.obj_preview_btn, BTN_PROCESSING):
                 runner = self.get_blender_runner()
-                script_path = Path(__file__).parent.parent.parent / "blender_lib" / "rename_objects.py"
+                script_path = _RENAME_OBJECTS_SCRIPT
 
                 # Get project root
                 project_root = self.get_project_root()
@@ -486,72 +462,62 @@ class RenameObjectsTab(BaseOperationTab):
         """Run rename operation with progress dialog (for execution)."""
         from PySide6.QtWidgets import QApplication
 
-        # Disable buttons
-        self.obj_execute_btn.setText(BTN_EXECUTING)
-        self.obj_execute_btn.setEnabled(False)
-        self.obj_preview_btn.setEnabled(False)
-        self.obj_load_btn.setEnabled(False)
-        QApplication.processEvents()
+        # Disable buttons; the progress dialog shows activity instead of a wait cursor
+        with self.loading_state(self.obj_execute_btn, BTN_EXECUTING, wait_cursor=False,
+                                extra_widgets=(self.obj_preview_btn, self.obj_load_btn)):
+            # Create and show progress dialog
+            progress_dialog = OperationProgressDialog(f"Renaming Objects/Collections", self)
+            progress_dialog.show()
+            QApplication.processEvents()
 
-        # Create and show progress dialog
-        progress_dialog = OperationProgressDialog(f"Renaming Objects/Collections", self)
-        progress_dialog.show()
-        QApplication.processEvents()
+            try:
+                runner = self.get_blender_runner()
+                script_path = _RENAME_OBJECTS_SCRIPT
 
-        try:
-            runner = self.get_blender_runner()
-            script_path = Path(__file__).parent.parent.parent / "blender_lib" / "rename_objects.py"
-
-            # Get project root
-            project_root = self.get_project_root()
-
-            # Define progress callback
-            def on_output_line(line: str):
-                """Process each line of output from Blender script."""
-                # Look for LOG: prefix
-                if line.startswith("LOG: "):
-                    message = line[5:]  # Remove "LOG: " prefix
-                    progress_dialog.log_text.append(message)
-                    QApplication.processEvents()
-
-            # Run the script with progress
-            result = runner.run_script_with_progress(
-                script_path,
-                {
-                    "blend-file": str(self.current_file),
-                    "project-root": str(project_root),
-                    "item-names": ",".join(item_names),
-                    "find": find_text,
-                    "replace": replace_text,
-                    "dry-run": "false"
-                },
-                progress_callback=on_output_line,
-                timeout=TIMEOUT_MEDIUM
-            )
+                # Get project root
+                project_root = self.get_project_root()
+
+                # Define progress callback
+                def on_output_line(line: str):
+                    """Process each line of output from Blender script."""
+                    # Look for LOG: prefix
+                    if line.startswith("LOG: "):
+                        message = line[5:]  # Remove "LOG: " prefix
+                        progress_dialog.log_text.append(message)
+                        QApplication.processEvents()
+
+                # Run the script with progress
+                result = runner.run_script_with_progress(
+                    script_path,
+                    {
+                        "blend-file": str(self.current_file),
+                        "project-root": str(project_root),
+                        "item-names": ",".join(item_names),
+                        "find": find_text,
+                        "replace": replace_text,
+                        "dry-run": "false"
+                    },
+                    progress_callback=on_output_line,
+                    timeout=TIMEOUT_MEDIUM
+                )
 
-            # Parse JSON output
-            data = extract_json_from_output(result.stdout)
+                # Parse JSON output
+                data = extract_json_from_output(result.stdout)
 
-            if "error" in data and data["error"]:
-                raise Exception(data["error"])
+                if "error" in data and data["error"]:
+                    raise Exception(data["error"])
 
-            # Mark complete
-            progress_dialog.update_progress(100, "Rename complete!")
-            progress_dialog.exec()
+                # Mark complete
+                progress_dialog.update_progress(100, "Rename complete!")
+                progress_dialog.exec()
 
-            # Show results
-            self._show_rename_results(data, dry_run=False)
+                # Show results
+                self._show_rename_results(data, dry_run=False)
 
-        except Exception as e:
-            progress_dialog.mark_error(str(e))
-            progress_dialog.exec()
-            self.show_error("Rename Error", f"Failed to rename items:\n\n{str(e)}")
-        finally:
-            # Restore buttons
-            self.obj_execute_btn.setText("Execute Rename")
-            self.obj_execute_btn.setEnabled(True)
-            self.obj_preview_btn.setEnabled(True)
-            self.obj_load_btn.setEnabled(True)
+            except Exception as e:
+                progress_dialog.mark_error(str(e))
+                progress_dialog.exec()
+                self.show_error("Rename Error", f"Failed to rename items:\n\n{str(e)}")
 
     def _show_rename_results(self, data: dict, dry_run: bool):
         """Show results of rename operation.
@@ -566,61 +532,49 @@ class RenameObjectsTab(BaseOperationTab):
         updated_files_count = data.get("updated_files_count", 0)
         updated_files = data.get("updated_files", [])
 
-        message_parts = []
+        if updated_files_count > 0:
+            files_header = (
+                f"Will update linked references in {updated_files_count} other file(s)" if dry_run
+                else f"Updated {updated_files_count} file(s) with linked references"
+            )
+            files_text = (
+                f"<br><b>{files_header}:</b><br>"
+                + self.format_bullet_list([Path(p).name for p in updated_files[:10]], len(updated_files) - 10)
+            )
+        else:
+            files_text = ""
 
         if dry_run:
             # Preview mode
             if renamed:
-                message_parts.append(f"<b>Will rename {len(renamed)} item(s) in this file:</b><br>")
-                for item in renamed[:10]:  # Show first 10
-                    message_parts.append(
-                        f"  • {item['old_name']} → {item['new_name']}<br>"
+                summary = (
+                    f"<b>Will rename {len(renamed)} item(s) in this file:</b><br>"
+                    + self.format_bullet_list(
+                        [f"{item['old_name']} → {item['new_name']}" for item in renamed[:10]],
+                        len(renamed) - 10
                     )
-                if len(renamed) > 10:
-                    message_parts.append(f"  ... and {len(renamed) - 10} more<br>")
-
-                # Show files with linked references
-                if updated_files_count > 0:
-                    message_parts.append(f"<br><b>Will update linked references in {updated_files_count} other file(s):</b><br>")
-                    for file_path in updated_files[:10]:
-                        file_name = Path(file_path).name
-                        message_parts.append(f"  • {file_name}<br>")
-                    if len(updated_files) > 10:
-                        message_parts.append(f"  ... and {len(updated_files) - 10} more<br>")
+                    + files_text
+                )
             else:
-                message_parts.append("<b>No items will be renamed.</b><br>")
+                summary = "<b>No items will be renamed.</b><br>"
         else:
             # Execute mode
             if renamed:
-                message_parts.append(f"<b>Successfully renamed {len(renamed)} item(s)!</b><br>")
-
-                if updated_files_count > 0:
-                    message_parts.append(f"<br><b>Updated {updated_files_count} file(s) with linked references:</b><br>")
-                    for file_path in updated_files[:10]:
-                        file_name = Path(file_path).name
-                        message_parts.append(f"  • {file_name}<br>")
-                    if len(updated_files) > 10:
-                        message_parts.append(f"  ... and {len(updated_files) - 10} more<br>")
+                summary = f"<b>Successfully renamed {len(renamed)} item(s)!</b><br>{files_text}"
 
                 # Reload the list to show new names
                 self._load_objects()
             else:
-                message_parts.append("<b>No items were renamed.</b><br>")
-
-        if warnings:
-            message_parts.append(f"<br><b>Warnings:</b><br>")
-            for warning in warnings[:5]:
-                message_parts.append(f"  • {warning}<br>")
-            if len(warnings) > 5:
-                message_parts.append(f"  ... and {len(warnings) - 5} more<br>")
+                summary = "<b>No items were renamed.</b><br>"
 
-        if errors:
-            message_parts.append(f"<br><b>Errors:</b><br>")
-            for error in errors:
-                message_parts.append(f"  • {error}<br>")
+        message = (
+            f"{summary}"
+            f"{self.format_message_section('Warnings', warnings[:5], len(warnings) - 5)}"
+            f"{self.format_message_section('Errors', errors)}"
+        )
 
         title = "Preview Results" if dry_run else "Rename Complete"
-        self.show_info(title, "".join(message_parts))
+        self.show_info(title, message)
 
     def _on_auto_load_changed(self, state: int):
         """Handle auto-load checkbox state change."""
@@ -633,10 +587,10 @@ class RenameObjectsTab(BaseOperationTab):
 
         try:
             # Load existing config
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
 
             # Save auto-load checkbox state
             rename_state = {
@@ -644,8 +598,7 @@ class RenameObjectsTab(BaseOperationTab):
             }
             config_data['rename_objects'] = rename_state
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
 
         except Exception as e:
             print(f"Warning: Could not save rename objects state: {e}")
@@ -656,8 +609,7 @@ class RenameObjectsTab(BaseOperationTab):
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = load_json_cached(self.config_file)
 
             rename_state = config_data.get('rename_objects', {})
 
@@ -4,7 +4,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout, QLabel, QPushButton, QScrollArea, QWidget, QMessageBox, QTabWidget, QDialog, QApplication
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QCursor
 
 from gui.operations.base_tab import BaseOperationTab
 from gui.broken_links_dialog import BrokenLinksDialog
@@ -271,7 +270,7 @@ class UtilitiesTab(BaseOperationTab):
             # Confirm with user
             confirmed = self.confirm(
                 TITLE_CONFIRM_DELETION,
-                TMPL_CONFIRM_DELETE_BACKUPS.format(
+                TMPL_CONFIRM_DELETE_BACKUPS(
                     count=len(backup_files),
                     blend1_count=len(blend1_files),
                     blend2_count=len(blend2_files),
@@ -299,21 +298,19 @@ class UtilitiesTab(BaseOperationTab):
 
             # Show results
             message_parts = []
+            append = message_parts.append
             if deleted_count > 0:
-                message_parts.append(f"<b>Successfully deleted {deleted_count} file(s)</b><br>")
-                message_parts.append(f"Freed {size_mb:.2f} MB of disk space<br>")
+                append(f"<b>Successfully deleted {deleted_count} file(s)</b><br>")
+                append(f"Freed {size_mb:.2f} MB of disk space<br>")
 
             if failed:
-                message_parts.append(f"<br><b>Failed to delete {len(failed)} file(s):</b><br>")
-                for error in failed[:5]:
-                    message_parts.append(f"  • {error}<br>")
-                if len(failed) > 5:
-                    message_parts.append(f"  ... and {len(failed) - 5} more<br>")
+                append(f"<br><b>Failed to delete {len(failed)} file(s):</b><br>")
+                append(self.format_bullet_list(failed[:5], len(failed) - 5))
 
             self.show_info(TITLE_CLEANUP_COMPLETE, "".join(message_parts))
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_TO_CLEAN.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_TO_CLEAN(error=str(e)))
 
     def _remove_empty_directories(self):
         """Remove all empty directories from the project."""
@@ -382,20 +379,18 @@ class UtilitiesTab(BaseOperationTab):
 
             # Show results
             message_parts = []
+            append = message_parts.append
             if removed_count > 0:
-                message_parts.append(f"<b>Successfully removed {removed_count} empty director{'y' if removed_count == 1 else 'ies'}</b><br>")
+                append(f"<b>Successfully removed {removed_count} empty director{'y' if removed_count == 1 else 'ies'}</b><br>")
 
             if failed:
-                message_parts.append(f"<br><b>Failed to remove {len(failed)} director{'y' if len(failed) == 1 else 'ies'}:</b><br>")
-                for error in failed[:5]:
-                    message_parts.append(f"  • {error}<br>")
-                if len(failed) > 5:
-                    message_parts.append(f"  ... and {len(failed) - 5} more<br>")
+                append(f"<br><b>Failed to remove {len(failed)} director{'y' if len(failed) == 1 else 'ies'}:</b><br>")
+                append(self.format_bullet_list(failed[:5], len(failed) - 5))
 
             self.show_info(TITLE_CLEANUP_COMPLETE, "".join(message_parts))
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_REMOVE_DIRS.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_REMOVE_DIRS(error=str(e)))
 
     def _find_unused_files(self):
         """Find files not referenced by any .blend file."""
@@ -505,36 +500,27 @@ class UtilitiesTab(BaseOperationTab):
             warnings = data.get("warnings", [])
 
             message_parts = []
+            append = message_parts.append
 
             if files_processed == 0:
-                message_parts.append("<b>No .blend files found in project.</b><br>")
+                append("<b>No .blend files found in project.</b><br>")
             elif total_libraries_reloaded == 0:
-                message_parts.append(f"<b>Processed {files_processed} .blend file(s)</b><br>")
-                message_parts.append(f"<br><i>No library links found to reload.</i><br>")
+                append(f"<b>Processed {files_processed} .blend file(s)</b><br>")
+                append("<br><i>No library links found to reload.</i><br>")
             else:
-                message_parts.append(f"<b>Successfully reloaded library links!</b><br>")
-                message_parts.append(f"<br>Files processed: {files_processed}<br>")
-                message_parts.append(f"Files with libraries: {files_with_libraries}<br>")
-                message_parts.append(f"Library links reloaded: {total_libraries_reloaded}<br>")
-
-            if warnings:
-                message_parts.append(f"<br><b>Warnings:</b><br>")
-                for warning in warnings[:5]:
-                    message_parts.append(f"  • {warning}<br>")
-                if len(warnings) > 5:
-                    message_parts.append(f"  ... and {len(warnings) - 5} more<br>")
-
-            if errors:
-                message_parts.append(f"<br><b>Errors:</b><br>")
-                for error in errors[:5]:
-                    message_parts.append(f"  • {error}<br>")
-                if len(errors) > 5:
-                    message_parts.append(f"  ... and {len(errors) - 5} more<br>")
+                append("<b>Successfully reloaded library links!</b><br>")
+                append(f"<br>Files processed: {files_processed}<br>")
+                append(f"Files with libraries: {files_with_libraries}<br>")
+                append(f"Library links reloaded: {total_libraries_reloaded}<br>")
+
+            append(self.format_message_section("Warnings", warnings[:5], len(warnings) - 5))
+
+            append(self.format_message_section("Errors", errors[:5], len(errors) - 5))
 
             self.show_info(TITLE_RELOAD_COMPLETE, "".join(message_parts))
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_RELOAD_LIBS.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_RELOAD_LIBS(error=str(e)))
 
     def _find_references(self):
         """Find all .blend files that reference the selected .blend file."""
@@ -590,20 +576,21 @@ class UtilitiesTab(BaseOperationTab):
             warnings = data.get("warnings", [])
 
             message_parts = []
+            append = message_parts.append
 
             if not referencing_files:
-                message_parts.append(f"<b>No references found to '{target_name}'</b><br>")
-                message_parts.append(f"<br>Scanned {files_scanned} .blend file(s) in the project.<br>")
+                append(f"<b>No references found to '{target_name}'</b><br>")
+                append(f"<br>Scanned {files_scanned} .blend file(s) in the project.<br>")
                 if file_type == "texture":
-                    message_parts.append(f"<br><i>This texture is not used by any .blend files.</i><br>")
+                    append("<br><i>This texture is not used by any .blend files.</i><br>")
                 else:
-                    message_parts.append(f"<br><i>This file is not linked by any other .blend files.</i><br>")
+                    append("<br><i>This file is not linked by any other .blend files.</i><br>")
             else:
-                message_parts.append(f"<b>Found {len(referencing_files)} file(s) referencing '{target_name}':</b><br><br>")
+                append(f"<b>Found {len(referencing_files)} file(s) referencing '{target_name}':</b><br><br>")
 
                 for ref in referencing_files[:10]:  # Show first 10
                     file_name = ref.get("file_name", "Unknown")
-                    message_parts.append(f"<b>• {file_name}</b><br>")
+                    append(f"<b>• {file_name}</b><br>")
 
                     # Handle texture references
                     if file_type == "texture":
@@ -611,14 +598,14 @@ class UtilitiesTab(BaseOperationTab):
                         images = ref.get("images", [])
 
                         if images_count > 0:
-                            message_parts.append(f"  Uses texture {images_count} time(s)")
+                            append(f"  Uses texture {images_count} time(s)")
                             if images:
                                 img_names = [img.get("name", "Unknown") for img in images[:3]]
-                                message_parts.append(f" (as {', '.join(img_names)}")
+                                append(f" (as {', '.join(img_names)}")
                                 if len(images) > 3:
-                                    message_parts.append(f", +{len(images) - 3} more")
-                                message_parts.append(")")
-                            message_parts.append("<br>")
+                                    append(f", +{len(images) - 3} more")
+                                append(")")
+                            append("<br>")
 
                     # Handle blend file references
                     else:
@@ -626,50 +613,40 @@ class UtilitiesTab(BaseOperationTab):
                         linked_collections = ref.get("linked_collections_count", 0)
 
                         if linked_objects > 0:
-                            message_parts.append(f"  Linked objects: {linked_objects}")
+                            append(f"  Linked objects: {linked_objects}")
                             obj_names = ref.get("linked_objects", [])
                             if obj_names:
-                                message_parts.append(f" ({', '.join(obj_names[:3])}")
+                                append(f" ({', '.join(obj_names[:3])}")
                                 if len(obj_names) > 3:
-                                    message_parts.append(f", +{len(obj_names) - 3} more")
-                                message_parts.append(")")
-                            message_parts.append("<br>")
+                                    append(f", +{len(obj_names) - 3} more")
+                                append(")")
+                            append("<br>")
 
                         if linked_collections > 0:
-                            message_parts.append(f"  Linked collections: {linked_collections}")
+                            append(f"  Linked collections: {linked_collections}")
                             col_names = ref.get("linked_collections", [])
                             if col_names:
-                                message_parts.append(f" ({', '.join(col_names[:3])}")
+                                append(f" ({', '.join(col_names[:3])}")
                                 if len(col_names) > 3:
-                                    message_parts.append(f", +{len(col_names) - 3} more")
-                                message_parts.append(")")
-                            message_parts.append("<br>")
+                                    append(f", +{len(col_names) - 3} more")
+                                append(")")
+                            append("<br>")
 
-                    message_parts.append("<br>")
+                    append("<br>")
 
                 if len(referencing_files) > 10:
-                    message_parts.append(f"<i>... and {len(referencing_files) - 10} more file(s)</i><br>")
+                    append(f"<i>... and {len(referencing_files) - 10} more file(s)</i><br>")
 
-                message_parts.append(f"<br>Total files scanned: {files_scanned}<br>")
+                append(f"<br>Total files scanned: {files_scanned}<br>")
 
-            if warnings:
-                message_parts.append(f"<br><b>Warnings:</b><br>")
-                for warning in warnings[:5]:
-                    message_parts.append(f"  • {warning}<br>")
-                if len(warnings) > 5:
-                    message_parts.append(f"  ... and {len(warnings) - 5} more<br>")
+            append(self.format_message_section("Warnings", warnings[:5], len(warnings) - 5))
 
-            if errors:
-                message_parts.append(f"<br><b>Errors:</b><br>")
-                for error in errors[:5]:
-                    message_parts.append(f"  • {error}<br>")
-                if len(errors) > 5:
-                    message_parts.append(f"  ... and {len(errors) - 5} more<br>")
+            append(self.format_message_section("Errors", errors[:5], len(errors) - 5))
 
             self.show_info(TITLE_FIND_REFERENCES_RESULTS, "".join(message_parts))
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_FIND_REFS.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_FIND_REFS(error=str(e)))
 
     def _check_broken_links(self):
         """Check all .blend files in the project for broken links."""
@@ -735,7 +712,7 @@ class UtilitiesTab(BaseOperationTab):
                 self.check_broken_links_btn.setEnabled(True)
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_CHECK_BROKEN_LINKS.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_CHECK_BROKEN_LINKS(error=str(e)))
 
     def _remove_broken_links(self, links_to_remove: list, dialog=None):
         """Remove the selected broken links.
@@ -791,33 +768,29 @@ class UtilitiesTab(BaseOperationTab):
                 errors = data.get("errors", [])
 
                 message_parts = []
+                append = message_parts.append
 
                 if total_fixed > 0:
-                    message_parts.append(f"<b>Successfully removed {total_fixed} broken link(s)!</b><br>")
-                    message_parts.append(f"<br>Files modified: {len(files_fixed)}<br><br>")
+                    append(f"<b>Successfully removed {total_fixed} broken link(s)!</b><br>")
+                    append(f"<br>Files modified: {len(files_fixed)}<br><br>")
 
                     for file_info in files_fixed[:5]:
                         file_name = file_info.get("file_name", "Unknown")
                         fixed_libraries = file_info.get("fixed_libraries", 0)
                         fixed_textures = file_info.get("fixed_textures", 0)
 
-                        message_parts.append(f"<b>• {file_name}</b><br>")
+                        append(f"<b>• {file_name}</b><br>")
                         if fixed_libraries > 0:
-                            message_parts.append(f"  Removed {fixed_libraries} broken library link(s)<br>")
+                            append(f"  Removed {fixed_libraries} broken library link(s)<br>")
                         if fixed_textures > 0:
-                            message_parts.append(f"  Removed {fixed_textures} broken texture(s)<br>")
+                            append(f"  Removed {fixed_textures} broken texture(s)<br>")
 
                     if len(files_fixed) > 5:
-                        message_parts.append(f"<br><i>... and {len(files_fixed) - 5} more file(s)</i><br>")
+                        append(f"<br><i>... and {len(files_fixed) - 5} more file(s)</i><br>")
                 else:
-                    message_parts.append("<b>No broken links were removed.</b><br>")
+                    append("<b>No broken links were removed.</b><br>")
 
-                if errors:
-                    message_parts.append(f"<br><b>Errors:</b><br>")
-                    for error in errors[:5]:
-                        message_parts.append(f"  • {error}<br>")
-                    if len(errors) > 5:
-                        message_parts.append(f"  ... and {len(errors) - 5} more<br>")
+                append(self.format_message_section("Errors", errors[:5], len(errors) - 5))
 
                 self.show_info(TITLE_REMOVE_COMPLETE, "".join(message_parts))
 
@@ -827,7 +800,7 @@ class UtilitiesTab(BaseOperationTab):
                 raise
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_REMOVE_LINKS.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_REMOVE_LINKS(error=str(e)))
 
     def _find_and_relink(self, broken_links: list, dialog=None):
         """Find missing files and relink them.
@@ -904,7 +877,7 @@ class UtilitiesTab(BaseOperationTab):
                         reply = QMessageBox.question(
                             self,
                             TITLE_FINDING_FILES,
-                            TMPL_EXACT_AND_SIMILAR_FOUND.format(
+                            TMPL_EXACT_AND_SIMILAR_FOUND(
                                 exact_count=len(found_files),
                                 similar_count=len(similar_files)
                             ),
@@ -938,7 +911,7 @@ class UtilitiesTab(BaseOperationTab):
                     reply = QMessageBox.question(
                         self,
                         TITLE_FINDING_FILES,
-                        TMPL_FILES_FOUND.format(
+                        TMPL_FILES_FOUND(
                             found_count=len(found_files),
                             details=details
                         ),
@@ -983,33 +956,29 @@ class UtilitiesTab(BaseOperationTab):
                 errors = data.get("errors", [])
 
                 message_parts = []
+                append = message_parts.append
 
                 if total_relinked > 0:
-                    message_parts.append(f"<b>Successfully relinked {total_relinked} file(s)!</b><br>")
-                    message_parts.append(f"<br>Files modified: {len(files_relinked)}<br><br>")
+                    append(f"<b>Successfully relinked {total_relinked} file(s)!</b><br>")
+                    append(f"<br>Files modified: {len(files_relinked)}<br><br>")
 
                     for file_info in files_relinked[:5]:
                         file_name = file_info.get("file_name", "Unknown")
                         relinked_libraries = file_info.get("relinked_libraries", 0)
                         relinked_textures = file_info.get("relinked_textures", 0)
 
-                        message_parts.append(f"<b>• {file_name}</b><br>")
+                        append(f"<b>• {file_name}</b><br>")
                         if relinked_libraries > 0:
-                            message_parts.append(f"  Relinked {relinked_libraries} library link(s)<br>")
+                            append(f"  Relinked {relinked_libraries} library link(s)<br>")
                         if relinked_textures > 0:
-                            message_parts.append(f"  Relinked {relinked_textures} texture(s)<br>")
+                            append(f"  Relinked {relinked_textures} texture(s)<br>")
 
                     if len(files_relinked) > 5:
-                        message_parts.append(f"<br><i>... and {len(files_relinked) - 5} more file(s)</i><br>")
+                        append(f"<br><i>... and {len(files_relinked) - 5} more file(s)</i><br>")
                 else:
-                    message_parts.append("<b>No files were relinked.</b><br>")
+                    append("<b>No files were relinked.</b><br>")
 
-                if errors:
-                    message_parts.append(f"<br><b>Errors:</b><br>")
-                    for error in errors[:5]:
-                        message_parts.append(f"  • {error}<br>")
-                    if len(errors) > 5:
-                        message_parts.append(f"  ... and {len(errors) - 5} more<br>")
+                append(self.format_message_section("Errors", errors[:5], len(errors) - 5))
 
                 self.show_info(TITLE_RELINK_COMPLETE, "".join(message_parts))
 
@@ -1023,7 +992,7 @@ class UtilitiesTab(BaseOperationTab):
                 raise
 
         except Exception as e:
-            self.show_error(TITLE_ERROR, TMPL_FAILED_FIND_FILES.format(error=str(e)))
+            self.show_error(TITLE_ERROR, TMPL_FAILED_FIND_FILES(error=str(e)))
 
     def _remap_collection_names(self, collection_refs: list, dialog=None):
         """Remap broken collection name references.
@@ -1114,24 +1083,25 @@ class UtilitiesTab(BaseOperationTab):
 
                 # Build result message
                 message_parts = []
+                append = message_parts.append
 
                 if total_remapped > 0:
-                    message_parts.append(f"<b>Successfully remapped {total_remapped} collection reference(s)!</b><br>")
-                    message_parts.append(f"<br>Files modified: {len(files_modified)}<br><br>")
+                    append(f"<b>Successfully remapped {total_remapped} collection reference(s)!</b><br>")
+                    append(f"<br>Files modified: {len(files_modified)}<br><br>")
 
                     for file_info in files_modified[:5]:
                         file_name = file_info.get("file_name", "Unknown")
                         remapped_count = file_info.get("remapped_count", 0)
-                        message_parts.append(f"<b>• {file_name}</b><br>")
-                        message_parts.append(f"  Remapped {remapped_count} collection(s)<br>")
+                        append(f"<b>• {file_name}</b><br>")
+                        append(f"  Remapped {remapped_count} collection(s)<br>")
 
                     if len(files_modified) > 5:
-                        message_parts.append(f"<br><i>... and {len(files_modified) - 5} more file(s)</i><br>")
+                        append(f"<br><i>... and {len(files_modified) - 5} more file(s)</i><br>")
                 else:
-                    message_parts.append("<b>No collections were remapped.</b><br>")
+                    append("<b>No collections were remapped.</b><br>")
 
                 if total_failed > 0:
-                    message_parts.append(f"<br><span style='color: orange;'>{total_failed} remapping(s) failed</span><br>")
+                    append(f"<br><span style='color: orange;'>{total_failed} remapping(s) failed</span><br>")
 
                 self.show_info("Remap Complete", "".join(message_parts))
 
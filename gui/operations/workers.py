@@ -0,0 +1,48 @@
+"""Thread pool workers for running blocking Blender calls off the GUI thread."""
+
+import logging
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class ScriptSignals(QObject):
+    """Signals emitted by ScriptRunnable.
+
+    QRunnable is not a QObject, so the signals live on this helper object.
+    """
+
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class ScriptRunnable(QRunnable):
+    """Runs a blocking call (usually a Blender subprocess) on a thread pool.
+
+    The call must not touch any widgets. Its return value is delivered through
+    ``signals.finished`` and any exception message through ``signals.error``,
+    both queued back to the GUI thread.
+    """
+
+    def __init__(self, task: Callable[[], Any]):
+        """Initialize runnable.
+
+        Args:
+            task: Callable doing the blocking work and returning its result
+        """
+        super().__init__()
+        self.task = task
+        self.signals = ScriptSignals()
+
+    def run(self):
+        """Run the task and emit its result or error."""
+        try:
+            result = self.task()
+        except Exception as e:
+            # The GUI only gets the message; keep the traceback in the log
+            logger.exception("Background task failed")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
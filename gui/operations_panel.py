@@ -48,7 +48,7 @@ class OperationsPanelWidget(QWidget):
 
         self.file_display = QLabel(LABEL_NO_FILE_SELECTED)
         self.file_display.setWordWrap(True)
-        self.file_display.setStyleSheet(Theme.get_file_display_style())
+        Theme.apply(self.file_display, 'file_display')
         layout.addWidget(self.file_display)
 
         # Separator
@@ -78,11 +78,15 @@ class OperationsPanelWidget(QWidget):
         """
         self.current_file = file_path
 
+        # Runs on every browser click, so format the path parts only once
+        path_str = str(file_path)
+        name = file_path.name
+
         # Update main file display
         if file_path.is_dir():
-            self.file_display.setText(f"<b>{file_path.name}/</b><br><small>{str(file_path)}</small>")
+            self.file_display.setText(f"<b>{name}/</b><br><small>{path_str}</small>")
         else:
-            self.file_display.setText(f"<b>{file_path.name}</b><br><small>{str(file_path)}</small>")
+            self.file_display.setText(f"<b>{name}</b><br><small>{path_str}</small>")
 
         # Notify all tabs
         self.move_tab.set_file(file_path)
@@ -99,3 +103,11 @@ class OperationsPanelWidget(QWidget):
         """
         # Only link tab has pending restorations
         self.link_tab.apply_pending_restorations()
+
+    def flush_pending_state(self):
+        """Write any tab state that is still waiting to be saved.
+
+        Called by the main window before closing, since some tabs delay
+        their config writes.
+        """
+        self.link_tab.flush_pending_state()
@@ -5,10 +5,9 @@ from pathlib import Path
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QPushButton,
-    QHeaderView
+    QTableView, QPushButton, QAbstractItemView
 )
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QBrush, QColor, QStandardItem, QStandardItemModel
 
 from blender_lib.models import OperationPreview
 
@@ -16,6 +15,13 @@ from blender_lib.models import OperationPreview
 class OperationPreviewDialog(QDialog):
     """Dialog showing preview of changes before execution."""
 
+    # (background, foreground) per change status, shared by all rows
+    _STATUS_BRUSHES = {
+        'warning': (QBrush(QColor(255, 250, 205)), QBrush(QColor(139, 69, 19))),  # Light yellow, dark brown text
+        'error': (QBrush(QColor(255, 230, 230)), QBrush(QColor(139, 0, 0))),      # Light red, dark red text
+        'ok': (QBrush(QColor(230, 255, 230)), QBrush(QColor(0, 100, 0))),         # Light green, dark green text
+    }
+
     def __init__(self, preview: OperationPreview, parent=None):
         """Initialize preview dialog.
 
@@ -76,51 +82,40 @@ class OperationPreviewDialog(QDialog):
             changes_label = QLabel("<b>Changes:</b>")
             layout.addWidget(changes_label)
 
-            self.table = QTableWidget()
-            self.table.setColumnCount(5)
-            self.table.setHorizontalHeaderLabels([
+            # Fill the model before attaching it, so no view updates happen per row
+            model = QStandardItemModel(0, 5, self)
+            model.setHorizontalHeaderLabels([
                 "File", "Type", "Item Name", "Old Path", "New Path"
             ])
 
-            self.table.setRowCount(len(self.preview.changes))
-
-            for i, change in enumerate(self.preview.changes):
-                # File
-                file_item = QTableWidgetItem(change.file_path.name)
-                self.table.setItem(i, 0, file_item)
-
-                # Type
-                type_item = QTableWidgetItem(change.item_type)
-                self.table.setItem(i, 1, type_item)
+            status_brushes = self._STATUS_BRUSHES
+            append_row = model.appendRow
+            for change in self.preview.changes:
+                # File, type, item name, old path, new path
+                row = [
+                    QStandardItem(change.file_path.name),
+                    QStandardItem(change.item_type),
+                    QStandardItem(change.item_name),
+                    QStandardItem(change.old_path),
+                    QStandardItem(change.new_path),
+                ]
 
-                # Item name
-                name_item = QTableWidgetItem(change.item_name)
-                self.table.setItem(i, 2, name_item)
+                # Color code by status
+                brushes = status_brushes.get(change.status)
+                if brushes:
+                    for item in row:
+                        item.setBackground(brushes[0])
+                        item.setForeground(brushes[1])
 
-                # Old path
-                old_item = QTableWidgetItem(change.old_path)
-                self.table.setItem(i, 3, old_item)
+                append_row(row)
 
-                # New path
-                new_item = QTableWidgetItem(change.new_path)
-                self.table.setItem(i, 4, new_item)
+            self.table = QTableView()
+            self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            self.table.setModel(model)
 
-                # Color code by status
-                if change.status == 'warning':
-                    for col in range(5):
-                        self.table.item(i, col).setBackground(QColor(255, 250, 205))  # Light yellow
-                        self.table.item(i, col).setForeground(QColor(139, 69, 19))    # Dark brown text
-                elif change.status == 'error':
-                    for col in range(5):
-                        self.table.item(i, col).setBackground(QColor(255, 230, 230))  # Light red
-                        self.table.item(i, col).setForeground(QColor(139, 0, 0))      # Dark red text
-                elif change.status == 'ok':
-                    for col in range(5):
-                        self.table.item(i, col).setBackground(QColor(230, 255, 230))  # Light green
-                        self.table.item(i, col).setForeground(QColor(0, 100, 0))      # Dark green text
-
-            # Resize columns to fit content
-            self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+            # Resize columns to fit content once; ResizeToContents would
+            # rescan every row whenever the table changes
+            self.table.resizeColumnsToContents()
             self.table.horizontalHeader().setStretchLastSection(True)
 
             layout.addWidget(self.table)
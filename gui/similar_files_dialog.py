@@ -1,6 +1,8 @@
 """Dialog for selecting similar file matches."""
 
+import os
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -28,6 +30,9 @@ class SimilarFilesDialog(QDialog):
         self.similar_files = similar_files
         self.project_root = project_root
         self.selected_matches = {}
+        # Prefix of paths inside the project, for cheap relative display paths;
+        # normcased so a drive letter or directory case mismatch still matches
+        self._root_prefix = os.path.normcase(os.path.join(str(project_root), ''))
 
         self.setWindowTitle(TITLE_SELECT_SIMILAR_FILES)
         self.resize(900, 600)
@@ -53,6 +58,14 @@ class SimilarFilesDialog(QDialog):
 
         self.table.setRowCount(len(self.similar_files))
 
+        # Fill all rows before Qt lays out and repaints the table
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        self.table.blockSignals(True)
+
+        # (name, relative path) per candidate; rows often share candidates
+        path_labels = {}
+
         for i, similar_info in enumerate(self.similar_files):
             missing_filename = similar_info.get("missing_filename", "Unknown")
             similar_matches = similar_info.get("similar_matches", [])
@@ -63,32 +76,35 @@ class SimilarFilesDialog(QDialog):
             if similar_matches:
                 best_match = similar_matches[0]
                 similarity = best_match.get("similarity", 0)
-                found_path = Path(best_match.get("path", ""))
+                found_path = best_match.get("path", "")
 
                 similarity_item = QTableWidgetItem(f"{similarity}%")
                 self.table.setItem(i, 1, similarity_item)
 
-                try:
-                    relative_path = found_path.relative_to(self.project_root)
-                    found_item = QTableWidgetItem(str(relative_path))
-                except ValueError:
-                    found_item = QTableWidgetItem(found_path.name)
+                found_item = QTableWidgetItem(self._relative_path(found_path) or os.path.basename(found_path))
                 self.table.setItem(i, 2, found_item)
 
                 combo = QComboBox()
                 combo.addItem("Skip", None)
 
                 for match in similar_matches:
-                    match_path = Path(match.get("path", ""))
+                    match_path = match.get("path", "")
+                    labels = path_labels.get(match_path)
+                    if labels is None:
+                        labels = path_labels[match_path] = (
+                            os.path.basename(match_path), self._relative_path(match_path)
+                        )
+                    match_name, rel_path = labels
                     match_similarity = match.get("similarity", 0)
-                    try:
-                        rel_path = match_path.relative_to(self.project_root)
-                        combo.addItem(f"{match_path.name} ({match_similarity}%) - {rel_path}", str(match_path))
-                    except ValueError:
-                        combo.addItem(f"{match_path.name} ({match_similarity}%)", str(match_path))
+                    if rel_path:
+                        combo.addItem(f"{match_name} ({match_similarity}%) - {rel_path}", match_path)
+                    else:
+                        combo.addItem(f"{match_name} ({match_similarity}%)", match_path)
 
                 combo.setCurrentIndex(1)
-                combo.currentIndexChanged.connect(lambda idx, row=i: self._on_selection_changed(row, idx))
+                # One shared slot for all rows; it reads the row from the combo
+                combo.setProperty("row", i)
+                combo.currentIndexChanged.connect(self._on_combo_index_changed)
 
                 self.table.setCellWidget(i, 3, combo)
 
@@ -103,10 +119,12 @@ class SimilarFilesDialog(QDialog):
                         self.table.item(i, col).setBackground(QColor(255, 250, 205))
                         self.table.item(i, col).setForeground(QColor(139, 69, 19))
 
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        # Size columns to their content once, then let the found file column take the rest
+        self.table.resizeColumnsToContents()
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
 
         layout.addWidget(self.table)
 
@@ -138,6 +156,27 @@ class SimilarFilesDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+    def _relative_path(self, path_str: str) -> Optional[str]:
+        """Get a path relative to the project root by string prefix.
+
+        Args:
+            path_str: Absolute path of a candidate file
+
+        Returns:
+            Project-relative path, or None if the file is outside the project
+        """
+        if os.path.normcase(path_str).startswith(self._root_prefix):
+            return path_str[len(self._root_prefix):]
+        return None
+
+    def _on_combo_index_changed(self, combo_index: int):
+        """Handle a row combo box change, using the row stored on the combo.
+
+        Args:
+            combo_index: Combo box index
+        """
+        self._on_selection_changed(self.sender().property("row"), combo_index)
+
     def _on_selection_changed(self, row: int, combo_index: int):
         """Handle combo box selection change.
 
@@ -158,16 +197,31 @@ class SimilarFilesDialog(QDialog):
 
     def _select_all_best(self):
         """Select the best match for all files."""
+        # Update the combos silently and rebuild the selection in one pass
+        selected_matches = {}
         for i in range(self.table.rowCount()):
             combo = self.table.cellWidget(i, 3)
+            if combo is None:
+                continue
             if combo.count() > 1:
+                combo.blockSignals(True)
                 combo.setCurrentIndex(1)
+                combo.blockSignals(False)
+            selected_path = combo.itemData(combo.currentIndex())
+            if selected_path:
+                selected_matches[self.similar_files[i].get("missing_path", "")] = selected_path
+        self.selected_matches = selected_matches
 
     def _skip_all(self):
         """Skip all similar matches."""
         for i in range(self.table.rowCount()):
             combo = self.table.cellWidget(i, 3)
+            if combo is None:
+                continue
+            combo.blockSignals(True)
             combo.setCurrentIndex(0)
+            combo.blockSignals(False)
+        self.selected_matches.clear()
 
     def get_selected_matches(self) -> dict:
         """Get the selected file matches.
@@ -1,4 +1,75 @@
-"""Application theme and styling."""
+"""Application theme and styling.
+
+Theme switches go through Theme.reapply, which clears a target's stylesheet
+before setting the new one: Qt then restyles from scratch instead of
+recomputing styles against the outgoing sheet.
+"""
+
+import colorsys
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import Callable, Dict, Mapping, Optional, TypedDict
+from weakref import WeakKeyDictionary, WeakSet
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+
+class ColorPalette(TypedDict):
+    """Base color palette schema shared by every theme (packed 0xRRGGBB)."""
+
+    bg_main: int
+    bg_secondary: int
+    bg_tertiary: int
+    bg_dark: int
+    text_primary: int
+    text_secondary: int
+    text_light: int
+    text_inverse: int
+    border_light: int
+    border_medium: int
+    border_dark: int
+    success: int
+    warning: int
+    error: int
+    info: int
+    primary: int
+    accent: int
+    row_ok: int
+    row_warning: int
+    row_error: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Spacing:
+    """Spacing scale."""
+
+    xs: str = '2px'
+    sm: str = '5px'
+    md: str = '10px'
+    lg: str = '15px'
+    xl: str = '20px'
+
+
+@dataclass(frozen=True, slots=True)
+class _Radius:
+    """Border radius scale."""
+
+    sm: str = '3px'
+    md: str = '5px'
+    lg: str = '8px'
+
+
+@dataclass(frozen=True, slots=True)
+class _FontSize:
+    """Font size scale."""
+
+    xs: str = '10px'
+    sm: str = '11px'
+    md: str = '12px'
+    lg: str = '14px'
+    xl: str = '16px'
 
 
 class Theme:
@@ -7,98 +78,159 @@ class Theme:
     # Current theme mode
     current_theme = 'light'
 
-    # Light theme color palette
-    COLORS_LIGHT = {
+    # Known themes and what toggle_theme switches each one to; extend both
+    # when adding a theme
+    _VALID_THEMES = frozenset({'light', 'dark'})
+    _TOGGLE_MAP = {'light': 'dark', 'dark': 'light'}
+
+    # Composed stylesheets by theme and name, built once at import
+    _styles: Dict[str, Dict[str, str]] = {}
+
+    # Palette-independent part of the main stylesheet, shared by both themes
+    _static_qss = ''
+
+    # Full palettes (base colors plus derived hover shades) by theme, as
+    # packed ints and rendered once to '#rrggbb' strings
+    _packed: Dict[str, Dict[str, int]] = {}
+    _palettes: Dict[str, Mapping[str, str]] = {}
+
+    # QPalette per theme, built on first use (needs a running QApplication)
+    _qpalettes: Dict[str, QPalette] = {}
+
+    # Palette roles filled from palette colors, for every color group
+    _PALETTE_ROLES = (
+        (QPalette.ColorRole.Window, 'bg_main'),
+        (QPalette.ColorRole.WindowText, 'text_primary'),
+        (QPalette.ColorRole.Base, 'bg_main'),
+        (QPalette.ColorRole.AlternateBase, 'bg_secondary'),
+        (QPalette.ColorRole.Text, 'text_primary'),
+        (QPalette.ColorRole.Button, 'bg_secondary'),
+        (QPalette.ColorRole.ButtonText, 'text_primary'),
+        (QPalette.ColorRole.Highlight, 'accent'),
+        (QPalette.ColorRole.HighlightedText, 'text_inverse'),
+        (QPalette.ColorRole.ToolTipBase, 'bg_secondary'),
+        (QPalette.ColorRole.ToolTipText, 'text_primary'),
+        (QPalette.ColorRole.PlaceholderText, 'text_light'),
+    )
+
+    # Roles overridden for disabled widgets
+    _DISABLED_ROLES = (
+        (QPalette.ColorRole.WindowText, 'text_light'),
+        (QPalette.ColorRole.Text, 'text_light'),
+        (QPalette.ColorRole.ButtonText, 'text_light'),
+    )
+
+    # Widgets styled through apply(), by stylesheet name
+    _styled: "WeakKeyDictionary[QWidget, str]" = WeakKeyDictionary()
+
+    # Hidden widgets whose restyle waits for their next show event
+    _pending: "WeakSet[QWidget]" = WeakSet()
+    _show_filter: Optional["_ShowEventFilter"] = None
+
+    # Light theme color palette as packed 0xRRGGBB ints (read-only; changing
+    # it would desync the prebuilt stylesheets)
+    COLORS_LIGHT: Mapping[str, int] = MappingProxyType(ColorPalette(**{
         # Background colors
-        'bg_main': '#ffffff',
-        'bg_secondary': '#f5f5f5',
-        'bg_tertiary': '#e8e8e8',
-        'bg_dark': '#2c3e50',
+        'bg_main': 0xffffff,
+        'bg_secondary': 0xf5f5f5,
+        'bg_tertiary': 0xe8e8e8,
+        'bg_dark': 0x2c3e50,
 
         # Text colors
-        'text_primary': '#2c3e50',
-        'text_secondary': '#7f8c8d',
-        'text_light': '#95a5a6',
-        'text_inverse': '#ffffff',
+        'text_primary': 0x2c3e50,
+        'text_secondary': 0x7f8c8d,
+        'text_light': 0x95a5a6,
+        'text_inverse': 0xffffff,
 
         # Border colors
-        'border_light': '#dcdcdc',
-        'border_medium': '#cccccc',
-        'border_dark': '#999999',
+        'border_light': 0xdcdcdc,
+        'border_medium': 0xcccccc,
+        'border_dark': 0x999999,
 
         # Status colors
-        'success': '#27ae60',
-        'success_hover': '#229954',
-        'warning': '#f39c12',
-        'warning_hover': '#d68910',
-        'error': '#c0392b',
-        'error_hover': '#a93226',
-        'info': '#3498db',
-        'info_hover': '#2980b9',
+        'success': 0x27ae60,
+        'warning': 0xf39c12,
+        'error': 0xc0392b,
+        'info': 0x3498db,
 
         # Semantic colors
-        'primary': '#2ecc71',
-        'primary_hover': '#27ae60',
-        'accent': '#3498db',
-        'accent_hover': '#2980b9',
+        'primary': 0x2ecc71,
+        'accent': 0x3498db,
 
         # Table row colors
-        'row_ok': '#e8f8f5',
-        'row_warning': '#fef5e7',
-        'row_error': '#fadbd8',
-    }
+        'row_ok': 0xe8f8f5,
+        'row_warning': 0xfef5e7,
+        'row_error': 0xfadbd8,
+    }))
 
-    # Dark theme color palette
-    COLORS_DARK = {
+    # Dark theme color palette (read-only)
+    COLORS_DARK: Mapping[str, int] = MappingProxyType(ColorPalette(**{
         # Background colors
-        'bg_main': '#1e1e1e',
-        'bg_secondary': '#2d2d2d',
-        'bg_tertiary': '#3d3d3d',
-        'bg_dark': '#0d0d0d',
+        'bg_main': 0x1e1e1e,
+        'bg_secondary': 0x2d2d2d,
+        'bg_tertiary': 0x3d3d3d,
+        'bg_dark': 0x0d0d0d,
 
         # Text colors
-        'text_primary': '#e0e0e0',
-        'text_secondary': '#b0b0b0',
-        'text_light': '#808080',
-        'text_inverse': '#1e1e1e',
+        'text_primary': 0xe0e0e0,
+        'text_secondary': 0xb0b0b0,
+        'text_light': 0x808080,
+        'text_inverse': 0x1e1e1e,
 
         # Border colors
-        'border_light': '#3d3d3d',
-        'border_medium': '#505050',
-        'border_dark': '#707070',
+        'border_light': 0x3d3d3d,
+        'border_medium': 0x505050,
+        'border_dark': 0x707070,
 
         # Status colors
-        'success': '#27ae60',
-        'success_hover': '#2ecc71',
-        'warning': '#f39c12',
-        'warning_hover': '#f5b041',
-        'error': '#c0392b',
-        'error_hover': '#e74c3c',
-        'info': '#3498db',
-        'info_hover': '#5dade2',
+        'success': 0x27ae60,
+        'warning': 0xf39c12,
+        'error': 0xc0392b,
+        'info': 0x3498db,
 
         # Semantic colors
-        'primary': '#2ecc71',
-        'primary_hover': '#27ae60',
-        'accent': '#3498db',
-        'accent_hover': '#5dade2',
+        'primary': 0x2ecc71,
+        'accent': 0x3498db,
 
         # Table row colors
-        'row_ok': '#1a3329',
-        'row_warning': '#3d3319',
-        'row_error': '#3d1f1f',
+        'row_ok': 0x1a3329,
+        'row_warning': 0x3d3319,
+        'row_error': 0x3d1f1f,
+    }))
+
+    # Colors that get a derived '<name>_hover' shade
+    HOVER_COLORS = ('success', 'warning', 'error', 'info', 'primary', 'accent')
+
+    # Lightness shift for hover shades: darker on light, lighter on dark
+    HOVER_SHADE = {
+        'light': -0.07,
+        'dark': 0.09,
     }
 
+    # Attribute-style views of the full palettes (Theme.C_LIGHT.bg_main),
+    # set by _build_styles
+    C_LIGHT: SimpleNamespace
+    C_DARK: SimpleNamespace
+
     @classmethod
-    def get_colors(cls) -> dict:
+    def get_colors(cls) -> Mapping[str, str]:
         """Get the current theme's color palette.
 
         Returns:
-            Color palette dictionary
+            Read-only color palette mapping, including hover shades
+        """
+        return cls._palettes[cls.current_theme]
+
+    @classmethod
+    def get_c(cls) -> SimpleNamespace:
+        """Get the current theme's color palette with attribute access.
+
+        Returns:
+            Namespace of palette colors, e.g. ``Theme.get_c().bg_main``
         """
         if cls.current_theme == 'dark':
-            return cls.COLORS_DARK
-        return cls.COLORS_LIGHT
+            return cls.C_DARK
+        return cls.C_LIGHT
 
     @classmethod
     def set_theme(cls, theme: str):
@@ -107,7 +239,7 @@ class Theme:
         Args:
             theme: 'light' or 'dark'
         """
-        if theme in ('light', 'dark'):
+        if theme in cls._VALID_THEMES:
             cls.current_theme = theme
 
     @classmethod
@@ -117,33 +249,208 @@ class Theme:
         Returns:
             New theme name
         """
-        cls.current_theme = 'dark' if cls.current_theme == 'light' else 'light'
+        cls.current_theme = cls._TOGGLE_MAP[cls.current_theme]
         return cls.current_theme
 
-    # Spacing
-    SPACING = {
-        'xs': '2px',
-        'sm': '5px',
-        'md': '10px',
-        'lg': '15px',
-        'xl': '20px',
-    }
+    # Spacing, border radius and font sizes
+    SPACING = _Spacing()
+    RADIUS = _Radius()
+    FONT_SIZE = _FontSize()
 
-    # Border radius
-    RADIUS = {
-        'sm': '3px',
-        'md': '5px',
-        'lg': '8px',
-    }
+    @classmethod
+    def _style_builders(cls) -> Dict[str, Callable[[Mapping[str, str]], str]]:
+        """Get the stylesheet builders by name.
 
-    # Font sizes
-    FONT_SIZE = {
-        'xs': '10px',
-        'sm': '11px',
-        'md': '12px',
-        'lg': '14px',
-        'xl': '16px',
-    }
+        Returns:
+            Mapping of stylesheet name to a function composing it from a palette
+        """
+        return {
+            'main': cls._build_stylesheet,
+            'project_bar': cls._build_project_bar_style,
+            'file_display': cls._build_file_display_style,
+        }
+
+    @staticmethod
+    def _hex(color: int) -> str:
+        """Render a packed 0xRRGGBB color as '#rrggbb'."""
+        return f'#{color:06x}'
+
+    @staticmethod
+    def _shade(color: int, delta: float) -> int:
+        """Shift the lightness of a color.
+
+        Args:
+            color: Packed 0xRRGGBB color
+            delta: Lightness change in HLS space, from -1.0 to 1.0
+
+        Returns:
+            Shifted packed color
+        """
+        rgb = ((color >> 16) / 255, ((color >> 8) & 0xff) / 255, (color & 0xff) / 255)
+        hue, lightness, saturation = colorsys.rgb_to_hls(*rgb)
+        lightness = min(1.0, max(0.0, lightness + delta))
+        r, g, b = (round(v * 255) for v in colorsys.hls_to_rgb(hue, lightness, saturation))
+        return (r << 16) | (g << 8) | b
+
+    @classmethod
+    def _derive_palette(cls, colors: Mapping[str, int], shade: float) -> Dict[str, int]:
+        """Add the hover shades to a base palette.
+
+        Args:
+            colors: Base color palette of packed colors
+            shade: Lightness shift applied to each hover color
+
+        Returns:
+            Palette with '<name>_hover' entries added
+        """
+        palette = dict(colors)
+        for name in cls.HOVER_COLORS:
+            palette[f'{name}_hover'] = cls._shade(colors[name], shade)
+        return palette
+
+    @classmethod
+    def _check_palettes(cls):
+        """Check that every palette matches the ColorPalette schema.
+
+        Raises:
+            ValueError: If a palette is missing a color or has an unknown one
+        """
+        expected = ColorPalette.__annotations__.keys()
+        for theme, colors in (('light', cls.COLORS_LIGHT), ('dark', cls.COLORS_DARK)):
+            missing = expected - colors.keys()
+            unknown = colors.keys() - expected
+            if missing or unknown:
+                raise ValueError(
+                    f"{theme} palette does not match ColorPalette: "
+                    f"missing {sorted(missing)}, unknown {sorted(unknown)}"
+                )
+
+    @classmethod
+    def _build_styles(cls):
+        """Build the full palettes and every stylesheet for both themes.
+
+        Raises:
+            ValueError: If a palette does not match the ColorPalette schema
+        """
+        cls._check_palettes()
+        cls._packed = {
+            'light': cls._derive_palette(cls.COLORS_LIGHT, cls.HOVER_SHADE['light']),
+            'dark': cls._derive_palette(cls.COLORS_DARK, cls.HOVER_SHADE['dark']),
+        }
+        cls._palettes = {
+            theme: MappingProxyType({name: cls._hex(color) for name, color in packed.items()})
+            for theme, packed in cls._packed.items()
+        }
+        cls.C_LIGHT = SimpleNamespace(**cls._palettes['light'])
+        cls.C_DARK = SimpleNamespace(**cls._palettes['dark'])
+
+        cls._static_qss = cls._build_static_stylesheet()
+        builders = cls._style_builders()
+        cls._styles = {
+            theme: {name: build(colors) for name, build in builders.items()}
+            for theme, colors in cls._palettes.items()
+        }
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Rebuild the stylesheets after replacing a palette at runtime."""
+        cls._qpalettes = {}
+        cls._build_styles()
+
+    @classmethod
+    def build_palette(cls) -> QPalette:
+        """Get the current theme as a QPalette.
+
+        The palette colors native and unstyled surfaces (dialogs, scroll
+        areas, selection highlights) that Qt draws without a stylesheet.
+        The QSS still sets background and text colors on the widgets it
+        targets (QWidget, QLineEdit, QTextEdit, QListWidget and others),
+        so both must be kept in step when a theme changes.
+
+        Returns:
+            Palette for the current theme, cached per theme
+        """
+        palette = cls._qpalettes.get(cls.current_theme)
+        if palette is None:
+            colors = cls._packed[cls.current_theme]
+            palette = QPalette()
+            for role, name in cls._PALETTE_ROLES:
+                palette.setColor(role, QColor(colors[name]))
+            for role, name in cls._DISABLED_ROLES:
+                palette.setColor(QPalette.ColorGroup.Disabled, role, QColor(colors[name]))
+            cls._qpalettes[cls.current_theme] = palette
+        return palette
+
+    @classmethod
+    def apply_app_theme(cls, app: Optional[QApplication] = None):
+        """Apply the current theme's palette and stylesheet to the application.
+
+        Args:
+            app: Application to style; defaults to the running instance
+        """
+        app = app or QApplication.instance()
+        app.setPalette(cls.build_palette())
+        cls.reapply(app)
+
+    @classmethod
+    def reapply(cls, target):
+        """Replace a target's stylesheet with the current main stylesheet.
+
+        The old sheet is cleared first so Qt does not recompute styles
+        against it while the new one is applied.
+
+        Args:
+            target: QApplication or QWidget to style
+        """
+        target.setStyleSheet("")
+        target.setStyleSheet(cls.get_stylesheet())
+
+    @classmethod
+    def apply(cls, widget: QWidget, name: str):
+        """Style a widget with a named stylesheet and keep it themed.
+
+        Args:
+            widget: Widget to style
+            name: Stylesheet name, e.g. 'project_bar' or 'file_display'
+        """
+        cls._styled[widget] = name
+        cls._pending.discard(widget)
+        widget.setStyleSheet(cls._styles[cls.current_theme][name])
+
+    @classmethod
+    def restyle_widgets(cls):
+        """Re-apply the current theme to widgets styled through apply().
+
+        Visible widgets are restyled now; hidden ones wait for their next
+        show event, so a theme switch only repolishes what is on screen.
+        """
+        styles = cls._styles[cls.current_theme]
+        for widget, name in list(cls._styled.items()):
+            try:
+                visible = widget.isVisible()
+            except RuntimeError:
+                # The C++ widget is gone but its wrapper is still alive
+                cls._styled.pop(widget, None)
+                continue
+
+            if visible:
+                cls._pending.discard(widget)
+                widget.setStyleSheet(styles[name])
+            elif widget not in cls._pending:
+                if cls._show_filter is None:
+                    cls._show_filter = _ShowEventFilter()
+                cls._pending.add(widget)
+                widget.installEventFilter(cls._show_filter)
+
+    @classmethod
+    def _apply_pending(cls, widget: QWidget):
+        """Restyle a widget whose theme update was deferred while hidden."""
+        if widget in cls._pending:
+            cls._pending.discard(widget)
+            widget.removeEventFilter(cls._show_filter)
+            name = cls._styled.get(widget)
+            if name is not None:
+                widget.setStyleSheet(cls._styles[cls.current_theme][name])
 
     @classmethod
     def get_stylesheet(cls) -> str:
@@ -152,68 +459,51 @@ class Theme:
         Returns:
             QSS stylesheet string
         """
-        c = cls.get_colors()
+        return cls._styles[cls.current_theme]['main']
+
+    @classmethod
+    def _build_stylesheet(cls, c: Mapping[str, str]) -> str:
+        """Compose the main application stylesheet from a palette.
+
+        Layout rules are shared by both themes; only the color overlay is
+        built per palette. Each property lives in exactly one of the two
+        parts, so appending the overlay keeps the original cascade.
+        """
+        return cls._static_qss + cls._build_color_overlay(c)
+
+    @classmethod
+    def _build_static_stylesheet(cls) -> str:
+        """Compose the palette-independent part of the main stylesheet."""
         s = cls.SPACING
         r = cls.RADIUS
         f = cls.FONT_SIZE
 
         return f"""
-        /* Main Application */
-        QMainWindow {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-        }}
-
         /* Labels */
         QLabel {{
-            color: {c['text_primary']};
-            font-size: {f['md']};
+            font-size: {f.md};
         }}
 
         /* Line Edits */
         QLineEdit {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            padding: {s['sm']} {s['md']};
-            font-size: {f['md']};
-        }}
-
-        QLineEdit:read-only {{
-            background-color: {c['bg_secondary']};
-            color: {c['text_secondary']};
-        }}
-
-        QLineEdit:focus {{
-            border: 1px solid {c['accent']};
+            border-radius: {r.sm};
+            padding: {s.sm} {s.md};
+            font-size: {f.md};
         }}
 
         /* Combo Box */
         QComboBox {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            padding: {s['sm']} {s['md']};
+            border-radius: {r.sm};
+            padding: {s.sm} {s.md};
             padding-right: 25px;
-            font-size: {f['md']};
+            font-size: {f.md};
             min-height: 20px;
         }}
 
-        QComboBox:hover {{
-            border: 1px solid {c['border_dark']};
-        }}
-
-        QComboBox:focus {{
-            border: 1px solid {c['accent']};
-        }}
-
         QComboBox::drop-down {{
             subcontrol-origin: padding;
             subcontrol-position: top right;
             width: 20px;
-            border-left: 1px solid {c['border_light']};
         }}
 
         QComboBox::down-arrow {{
@@ -222,270 +512,355 @@ class Theme:
         }}
 
         QComboBox QAbstractItemView {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            selection-background-color: {c['accent']};
-            selection-color: {c['text_inverse']};
             outline: none;
             padding: 2px;
         }}
 
         QComboBox QAbstractItemView::item {{
-            padding: {s['sm']} {s['md']};
+            padding: {s.sm} {s.md};
             min-height: 22px;
         }}
 
+        /* Buttons - Base Style */
+        QPushButton {{
+            border-radius: {r.sm};
+            padding: {s.sm} {s.lg};
+            font-size: {f.md};
+            min-height: 15px;
+        }}
+
+        /* Primary Buttons (Success/Execute actions) */
+        QPushButton[class="primary"] {{
+            font-weight: bold;
+        }}
+
+        /* Text Edit */
+        QTextEdit {{
+            border-radius: {r.sm};
+            padding: {s.sm};
+            font-size: {f.sm};
+            font-family: "Courier New", monospace;
+        }}
+
+        /* List Widget */
+        QListWidget {{
+            border-radius: {r.sm};
+        }}
+
+        QListWidget::item {{
+            padding: {s.sm};
+        }}
+
+        /* Scroll Bars */
+        QScrollBar:vertical {{
+            width: 12px;
+        }}
+
+        QScrollBar::handle:vertical {{
+            border-radius: {r.sm};
+            min-height: 20px;
+        }}
+
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+            height: 0px;
+        }}
+
+        QScrollBar:horizontal {{
+            height: 12px;
+        }}
+
+        QScrollBar::handle:horizontal {{
+            border-radius: {r.sm};
+            min-width: 20px;
+        }}
+
+        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+            width: 0px;
+        }}
+
+        /* Tree View */
+        QTreeView {{
+            border-radius: {r.sm};
+        }}
+
+        QTableWidget::item {{
+            padding: {s.sm};
+        }}
+
+        QHeaderView::section {{
+            padding: {s.sm} {s.md};
+            font-weight: bold;
+        }}
+
+        /* Progress Bar */
+        QProgressBar {{
+            border-radius: {r.sm};
+            text-align: center;
+            font-size: {f.md};
+        }}
+
+        QProgressBar::chunk {{
+            border-radius: {r.sm};
+        }}
+
+        /* Frames */
+        QFrame {{
+            border-radius: {r.sm};
+        }}
+        """
+
+    # Color declarations of the main stylesheet, filled from a palette
+    # with str.format_map; kept as a plain template so the literal text is
+    # a constant rather than an f-string re-evaluated per palette
+    _COLOR_OVERLAY_TEMPLATE = """
+        /* Line Edits */
+        QLineEdit {{
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
+        }}
+
+        QLineEdit:read-only {{
+            background-color: {bg_secondary};
+            color: {text_secondary};
+        }}
+
+        QLineEdit:focus {{
+            border: 1px solid {accent};
+        }}
+
+        /* Combo Box */
+        QComboBox {{
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
+        }}
+
+        QComboBox:hover {{
+            border: 1px solid {border_dark};
+        }}
+
+        QComboBox:focus {{
+            border: 1px solid {accent};
+        }}
+
+        QComboBox::drop-down {{
+            border-left: 1px solid {border_light};
+        }}
+
+        QComboBox QAbstractItemView {{
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
+            selection-background-color: {accent};
+            selection-color: {text_inverse};
+        }}
+
         QComboBox QAbstractItemView::item:hover {{
-            background-color: {c['bg_secondary']};
+            background-color: {bg_secondary};
         }}
 
         /* Buttons - Base Style */
         QPushButton {{
-            background-color: {c['bg_secondary']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            padding: {s['sm']} {s['lg']};
-            font-size: {f['md']};
-            min-height: 15px;
+            background-color: {bg_secondary};
+            color: {text_primary};
+            border: 1px solid {border_medium};
         }}
 
         QPushButton:hover {{
-            background-color: {c['bg_tertiary']};
-            border-color: {c['border_dark']};
+            background-color: {bg_tertiary};
+            border-color: {border_dark};
         }}
 
         QPushButton:pressed {{
-            background-color: {c['border_medium']};
+            background-color: {border_medium};
         }}
 
         QPushButton:disabled {{
-            background-color: {c['bg_secondary']};
-            color: {c['text_light']};
-            border-color: {c['border_light']};
+            background-color: {bg_secondary};
+            color: {text_light};
+            border-color: {border_light};
         }}
 
         /* Primary Buttons (Success/Execute actions) */
         QPushButton[class="primary"] {{
-            background-color: {c['primary']};
-            color: {c['text_inverse']};
+            background-color: {primary};
+            color: {text_inverse};
             border: none;
-            font-weight: bold;
         }}
 
         QPushButton[class="primary"]:hover {{
-            background-color: {c['primary_hover']};
+            background-color: {primary_hover};
         }}
 
         QPushButton[class="primary"]:disabled {{
-            background-color: {c['text_light']};
+            background-color: {text_light};
         }}
 
         /* Info Buttons (Preview/Browse) */
         QPushButton[class="info"] {{
-            background-color: {c['info']};
-            color: {c['text_inverse']};
+            background-color: {info};
+            color: {text_inverse};
             border: none;
         }}
 
         QPushButton[class="info"]:hover {{
-            background-color: {c['info_hover']};
+            background-color: {info_hover};
         }}
 
         /* Text Edit */
         QTextEdit {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            padding: {s['sm']};
-            font-size: {f['sm']};
-            font-family: "Courier New", monospace;
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
         }}
 
         /* List Widget */
         QListWidget {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            selection-background-color: {c['accent']};
-            selection-color: {c['text_inverse']};
-        }}
-
-        QListWidget::item {{
-            padding: {s['sm']};
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
+            selection-background-color: {accent};
+            selection-color: {text_inverse};
         }}
 
         QListWidget::item:hover {{
-            background-color: {c['bg_secondary']};
+            background-color: {bg_secondary};
         }}
 
         QListWidget::item:selected {{
-            background-color: {c['accent']};
-            color: {c['text_inverse']};
+            background-color: {accent};
+            color: {text_inverse};
         }}
 
         /* Scroll Area */
         QScrollArea {{
-            background-color: {c['bg_main']};
+            background-color: {bg_main};
             border: none;
         }}
 
         /* Scroll Bars */
         QScrollBar:vertical {{
-            background-color: {c['bg_secondary']};
-            width: 12px;
+            background-color: {bg_secondary};
             border: none;
         }}
 
         QScrollBar::handle:vertical {{
-            background-color: {c['border_medium']};
-            border-radius: {r['sm']};
-            min-height: 20px;
+            background-color: {border_medium};
         }}
 
         QScrollBar::handle:vertical:hover {{
-            background-color: {c['border_dark']};
-        }}
-
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            height: 0px;
+            background-color: {border_dark};
         }}
 
         QScrollBar:horizontal {{
-            background-color: {c['bg_secondary']};
-            height: 12px;
+            background-color: {bg_secondary};
             border: none;
         }}
 
         QScrollBar::handle:horizontal {{
-            background-color: {c['border_medium']};
-            border-radius: {r['sm']};
-            min-width: 20px;
+            background-color: {border_medium};
         }}
 
         QScrollBar::handle:horizontal:hover {{
-            background-color: {c['border_dark']};
-        }}
-
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-            width: 0px;
+            background-color: {border_dark};
         }}
 
         /* Widget Containers */
         QWidget {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
+            background-color: {bg_main};
+            color: {text_primary};
         }}
 
         /* Tree View */
         QTreeView {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            selection-background-color: {c['accent']};
-            selection-color: {c['text_inverse']};
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
+            selection-background-color: {accent};
+            selection-color: {text_inverse};
         }}
 
         QTreeView::item:hover {{
-            background-color: {c['bg_secondary']};
+            background-color: {bg_secondary};
         }}
 
         QTreeView::item:selected {{
-            background-color: {c['accent']};
-            color: {c['text_inverse']};
+            background-color: {accent};
+            color: {text_inverse};
         }}
 
         /* Table Widget */
         QTableWidget {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
-            gridline-color: {c['border_light']};
-            selection-background-color: {c['accent']};
-            selection-color: {c['text_inverse']};
-        }}
-
-        QTableWidget::item {{
-            padding: {s['sm']};
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
+            gridline-color: {border_light};
+            selection-background-color: {accent};
+            selection-color: {text_inverse};
         }}
 
         QHeaderView::section {{
-            background-color: {c['bg_secondary']};
-            color: {c['text_primary']};
-            padding: {s['sm']} {s['md']};
-            border: 1px solid {c['border_medium']};
-            font-weight: bold;
+            background-color: {bg_secondary};
+            color: {text_primary};
+            border: 1px solid {border_medium};
         }}
 
         /* Progress Bar */
         QProgressBar {{
-            background-color: {c['bg_secondary']};
-            border: 1px solid {c['border_medium']};
-            border-radius: {r['sm']};
-            text-align: center;
-            color: {c['text_primary']};
-            font-size: {f['md']};
+            background-color: {bg_secondary};
+            border: 1px solid {border_medium};
+            color: {text_primary};
         }}
 
         QProgressBar::chunk {{
-            background-color: {c['success']};
-            border-radius: {r['sm']};
+            background-color: {success};
         }}
 
         /* Status Bar */
         QStatusBar {{
-            background-color: {c['bg_secondary']};
-            color: {c['text_primary']};
-            border-top: 1px solid {c['border_medium']};
-        }}
-
-        /* Frames */
-        QFrame {{
-            border-radius: {r['sm']};
-        }}
-
-        /* Dialog */
-        QDialog {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
+            background-color: {bg_secondary};
+            color: {text_primary};
+            border-top: 1px solid {border_medium};
         }}
 
         /* Menu Bar */
         QMenuBar {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border-bottom: 1px solid {c['border_light']};
+            background-color: {bg_main};
+            color: {text_primary};
+            border-bottom: 1px solid {border_light};
         }}
 
         QMenuBar::item:selected {{
-            background-color: {c['bg_secondary']};
+            background-color: {bg_secondary};
         }}
 
         QMenu {{
-            background-color: {c['bg_main']};
-            color: {c['text_primary']};
-            border: 1px solid {c['border_medium']};
+            background-color: {bg_main};
+            color: {text_primary};
+            border: 1px solid {border_medium};
         }}
 
         QMenu::item:selected {{
-            background-color: {c['accent']};
-            color: {c['text_inverse']};
+            background-color: {accent};
+            color: {text_inverse};
         }}
 
         /* Splitter */
         QSplitter::handle {{
-            background-color: {c['border_light']};
+            background-color: {border_light};
         }}
 
         QSplitter::handle:hover {{
-            background-color: {c['border_medium']};
+            background-color: {border_medium};
         }}
         """
 
+    @classmethod
+    def _build_color_overlay(cls, c: Mapping[str, str]) -> str:
+        """Compose the color declarations of the main stylesheet from a palette."""
+        return cls._COLOR_OVERLAY_TEMPLATE.format_map(c)
+
     @classmethod
     def get_project_bar_style(cls) -> str:
         """Get stylesheet for the project selector bar.
@@ -493,7 +868,11 @@ class Theme:
         Returns:
             QSS stylesheet string
         """
-        c = cls.get_colors()
+        return cls._styles[cls.current_theme]['project_bar']
+
+    @classmethod
+    def _build_project_bar_style(cls, c: Mapping[str, str]) -> str:
+        """Compose the project selector bar stylesheet from a palette."""
         return f"""
             QFrame {{
                 background-color: {c['bg_secondary']};
@@ -510,11 +889,28 @@ class Theme:
         Returns:
             QSS stylesheet string
         """
-        c = cls.get_colors()
+        return cls._styles[cls.current_theme]['file_display']
+
+    @classmethod
+    def _build_file_display_style(cls, c: Mapping[str, str]) -> str:
+        """Compose the file display box stylesheet from a palette."""
         return f"""
-            padding: {cls.SPACING['md']};
+            padding: {cls.SPACING.md};
             background-color: {c['bg_secondary']};
             color: {c['text_primary']};
-            border-radius: {cls.RADIUS['sm']};
+            border-radius: {cls.RADIUS.sm};
             border: 1px solid {c['border_medium']};
         """
+
+
+class _ShowEventFilter(QObject):
+    """Applies deferred theme updates when a hidden widget is shown."""
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Show and isinstance(watched, QWidget):
+            Theme._apply_pending(watched)
+        return False
+
+
+# Both themes are small, so build them at import instead of on first paint
+Theme._build_styles()
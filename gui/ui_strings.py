@@ -3,8 +3,18 @@
 This module contains all user-facing strings used in dialogs, messages, buttons,
 and labels throughout the application. Centralizing these strings makes it easy
 to update any UI text from a single location.
+
+The constants are also bundled into the read-only namespace ``S``, so a
+caller can import one name and hoist it to a local (``S.TITLE_ERROR``).
+
+``TMPL_*`` templates are parsed once at import; call them with keyword
+fields (``TMPL_LOADING_BLEND(filename=name)``) to fill them in.
 """
 
+import string
+import sys
+import types
+
 # ============================================================================
 # Dialog Titles
 # ============================================================================
@@ -98,9 +108,10 @@ BTN_LOAD_OBJECTS_COLLECTIONS = "Load Objects/Collections"
 LABEL_NO_FILE_SELECTED = "<i>No file selected</i>"
 LABEL_NO_BLEND_SELECTED = "<i>No .blend file selected</i>"
 LABEL_SELECT_BLEND_IN_BROWSER = "<i>Select a .blend file in the file browser (You must first lock target file)</i>"
+LABEL_LOADING_SCENES = "Loading scenes..."
 
 # ============================================================================
-# Template Messages (use .format() to fill in placeholders)
+# Template Messages (call with keyword fields: TMPL_X(name=value))
 # ============================================================================
 
 TMPL_PROJECT_INFO = "Project: {project_name}\nRoot: {project_root}\n.blend files found: {blend_count}"
@@ -176,3 +187,66 @@ MSG_COMPLETE = "Complete"
 TMPL_LOADING_BLEND = "Loading {filename}..."
 TMPL_FAILED_LIST_LINKS = "Failed to list linked files: {error}"
 TMPL_NO_LINKED_FILES = "'{filename}' has no linked libraries or textures."
+
+# ============================================================================
+# Templates
+# ============================================================================
+
+_FORMATTER = string.Formatter()
+
+
+class _Template(str):
+    """Message template whose fields are parsed once, at import.
+
+    Still a plain string, so ``.format`` and string operations keep working;
+    calling it fills the fields from the parsed parts.
+    """
+
+    def __new__(cls, template: str):
+        obj = super().__new__(cls, template)
+        obj._parts = tuple(_FORMATTER.parse(template))
+        return obj
+
+    def __call__(self, **fields) -> str:
+        out = []
+        for literal, name, spec, conversion in self._parts:
+            out.append(literal)
+            if name is not None:
+                value = fields[name]
+                if conversion:
+                    value = _FORMATTER.convert_field(value, conversion)
+                out.append(format(value, spec))
+        return ''.join(out)
+
+
+for _name, _value in list(globals().items()):
+    if _name.startswith('TMPL_'):
+        globals()[_name] = _Template(_value)
+
+# Share one copy of each short string; templates are str subclasses, which
+# sys.intern does not accept
+for _name, _value in list(globals().items()):
+    if _name.isupper() and type(_value) is str and len(_value) < 64:
+        globals()[_name] = sys.intern(_value)
+
+del _name, _value
+
+# ============================================================================
+# Namespace
+# ============================================================================
+
+
+class _FrozenNamespace(types.SimpleNamespace):
+    """Read-only namespace; assigning or deleting attributes raises."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"UI strings are read-only: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"UI strings are read-only: {name}")
+
+
+S = _FrozenNamespace(**{
+    name: value for name, value in globals().items()
+    if name.isupper() and isinstance(value, str)
+})
@@ -1,20 +1,296 @@
 """Dialog for displaying and managing unused files in the project."""
 
-import json
 import os
+import sys
+from array import array
+from collections import Counter
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QTimer
+)
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QPushButton,
+    QTableView, QPushButton,
     QHeaderView, QAbstractItemView, QMessageBox,
-    QCheckBox, QWidget
+    QCheckBox, QStyle
 )
 from PySide6.QtGui import QColor
 
 from send2trash import send2trash
 
+from core.json_utils import load_json_cached, write_json_atomic
+
+
+# Table columns
+COL_SELECT, COL_NAME, COL_TYPE, COL_SIZE, COL_LOCATION, COL_HIDE = range(6)
+
+# Role serving raw values for sorting, e.g. byte counts instead of "1.5 MB"
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# File types as small ints for the filter hot path; unknown types map to
+# TYPE_OTHER, which no filter shows
+FILE_TYPES = ("texture", "blend", "backup")
+TYPE_IDX = {file_type: i for i, file_type in enumerate(FILE_TYPES)}
+TYPE_OTHER = len(FILE_TYPES)
+
+# Type column colors, parsed once rather than per painted cell
+_TYPE_COLORS = {
+    "texture": QColor(0x21, 0x96, 0xF3),  # Blue
+    "blend": QColor(0xFF, 0x98, 0x00),  # Orange
+    "backup": QColor(0x9E, 0x9E, 0x9E),  # Gray
+}
+
+# send2trash moves a list of files in one shell operation on Windows;
+# elsewhere it loops over the files itself
+_BATCH_TRASH = sys.platform == "win32"
+
+_SIZE_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count for the Size column.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Size as B, KB or MB text
+    """
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes / (1024 * 1024):.2f} MB"
+
+
+class UnusedFilesModel(QAbstractTableModel):
+    """Table model over the unused files list.
+
+    Cell text and colors are produced on demand in data(), so rows outside
+    the viewport cost nothing. Selected rows are kept in a set and hidden
+    rows in a bytearray, both shown as native checkboxes.
+    """
+
+    HEADERS = ["", "File Name", "Type", "Size", "Location", "Hide"]
+
+    # Emitted when the user toggles a row's hide checkbox
+    hidden_toggled = Signal(int)
+
+    def __init__(self, unused_files: list, parent=None):
+        """Initialize the model.
+
+        Args:
+            unused_files: List of unused file info dicts
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.unused_files = unused_files
+        # Filter and sort fields as parallel arrays indexed by row; types are
+        # one byte each and sizes are packed 64-bit ints
+        self._types = bytes(TYPE_IDX.get(f["type"], TYPE_OTHER) for f in unused_files)
+        self._sizes = array('q', [f["size"] for f in unused_files])
+        self._paths = [f["path"] for f in unused_files]
+        # Rows checked for deletion, updated as checkboxes change
+        self.checked_rows = set()
+        self._hidden_mask = bytearray(len(unused_files))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.unused_files)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in (COL_SELECT, COL_HIDE):
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Views ask for about seven roles per cell on every paint; dispatch
+        # on role first so the roles this model ignores return at once
+        getter = self._ROLE_GETTERS.get(role)
+        if getter is None or not index.isValid():
+            return None
+        return getter(self, index.row(), index.column())
+
+    def _display_data(self, row: int, column: int):
+        file_info = self.unused_files[row]
+        if column == COL_NAME:
+            return file_info["name"]
+        if column == COL_TYPE:
+            return file_info["type"].capitalize()
+        if column == COL_SIZE:
+            return _format_size(file_info["size"])
+        if column == COL_LOCATION:
+            return file_info["relative_path"]
+        return None
+
+    def _check_state_data(self, row: int, column: int):
+        if column == COL_SELECT:
+            checked = row in self.checked_rows
+        elif column == COL_HIDE:
+            checked = self._hidden_mask[row]
+        else:
+            return None
+        return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+
+    def _sort_data(self, row: int, column: int):
+        if column == COL_SIZE:
+            return self._sizes[row]
+        if column == COL_SELECT:
+            return row in self.checked_rows
+        if column == COL_HIDE:
+            return bool(self._hidden_mask[row])
+        return self._display_data(row, column)
+
+    def _foreground_data(self, row: int, column: int):
+        # Color code by type
+        if column == COL_TYPE:
+            return _TYPE_COLORS.get(self.unused_files[row]["type"])
+        return None
+
+    def _alignment_data(self, row: int, column: int):
+        if column == COL_SIZE:
+            return _SIZE_ALIGNMENT
+        return None
+
+    _ROLE_GETTERS = {
+        Qt.ItemDataRole.DisplayRole: _display_data,
+        Qt.ItemDataRole.CheckStateRole: _check_state_data,
+        SORT_ROLE: _sort_data,
+        Qt.ItemDataRole.ForegroundRole: _foreground_data,
+        Qt.ItemDataRole.TextAlignmentRole: _alignment_data,
+    }
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        row = index.row()
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        if index.column() == COL_SELECT:
+            if checked:
+                self.checked_rows.add(row)
+            else:
+                self.checked_rows.discard(row)
+        elif index.column() == COL_HIDE:
+            self._hidden_mask[row] = checked
+        else:
+            return False
+
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        if index.column() == COL_HIDE:
+            self.hidden_toggled.emit(row)
+        return True
+
+    def is_checked(self, row: int) -> bool:
+        """Check whether a row is selected for deletion."""
+        return row in self.checked_rows
+
+    def is_hidden(self, row: int) -> bool:
+        """Check whether a row is marked hidden."""
+        return bool(self._hidden_mask[row])
+
+    def type_counts(self, rows) -> Counter:
+        """Count rows by type index.
+
+        Args:
+            rows: Model rows to count
+
+        Returns:
+            Counter keyed by index into FILE_TYPES (TYPE_OTHER for unknown)
+        """
+        types = self._types
+        return Counter(types[row] for row in rows)
+
+    def set_checked_rows(self, rows, checked: bool):
+        """Set the selection checkbox of several rows at once.
+
+        Args:
+            rows: Row indices to update
+            checked: New checkbox state
+        """
+        if checked:
+            self.checked_rows.update(rows)
+        else:
+            self.checked_rows.difference_update(rows)
+        self._emit_column_changed(COL_SELECT)
+
+    def clear_checked(self):
+        """Uncheck every row's selection checkbox."""
+        self.checked_rows.clear()
+        self._emit_column_changed(COL_SELECT)
+
+    def set_hidden_paths(self, hidden_paths: set):
+        """Mark the rows whose path is in a set as hidden.
+
+        Args:
+            hidden_paths: File paths to mark hidden
+        """
+        self._hidden_mask = bytearray(path in hidden_paths for path in self._paths)
+        self._emit_column_changed(COL_HIDE)
+
+    def _emit_column_changed(self, column: int):
+        """Notify views that a whole checkbox column changed."""
+        if self.unused_files:
+            self.dataChanged.emit(
+                self.index(0, column),
+                self.index(len(self.unused_files) - 1, column),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+
+
+class UnusedFilesFilterModel(QSortFilterProxyModel):
+    """Proxy model filtering unused files by type and hidden status."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Bit i set when FILE_TYPES[i] is shown; TYPE_OTHER's bit never is
+        self.type_mask = (1 << len(FILE_TYPES)) - 1
+        self.show_hidden = False
+        self.setSortRole(SORT_ROLE)
+        # Inputs of the last filter pass, to skip refiltering when unchanged
+        self._filter_state = None
+
+    def set_filters(self, show_textures: bool, show_blends: bool,
+                    show_backups: bool, show_hidden: bool):
+        """Set the filter options and re-filter if anything changed.
+
+        Args:
+            show_textures: Show texture files
+            show_blends: Show .blend files
+            show_backups: Show backup files
+            show_hidden: Show files marked hidden
+        """
+        self.type_mask = (
+            (show_textures << TYPE_IDX["texture"])
+            | (show_blends << TYPE_IDX["blend"])
+            | (show_backups << TYPE_IDX["backup"])
+        )
+        self.show_hidden = show_hidden
+
+        # Hidden flags only matter while hidden files are filtered out
+        hidden = None if show_hidden else bytes(self.sourceModel()._hidden_mask)
+        state = (self.type_mask, show_hidden, hidden)
+        if state == self._filter_state:
+            return
+        self._filter_state = state
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        model = self.sourceModel()
+        if not (self.type_mask >> model._types[source_row]) & 1:
+            return False
+        return self.show_hidden or not model._hidden_mask[source_row]
+
 
 class UnusedFilesDialog(QDialog):
     """Dialog showing unused files found in the project."""
@@ -37,6 +313,12 @@ class UnusedFilesDialog(QDialog):
         self.unused_files = results.get("unused_files", [])
         self.hidden_files = set()  # Track hidden file paths
 
+        # Checkbox changes in one event loop pass are filtered and saved once
+        self._pending_timer = QTimer(self)
+        self._pending_timer.setSingleShot(True)
+        self._pending_timer.setInterval(0)
+        self._pending_timer.timeout.connect(self._apply_pending_changes)
+
         self.setWindowTitle("Unused Files")
         self.resize(1100, 700)
 
@@ -82,6 +364,7 @@ class UnusedFilesDialog(QDialog):
                 summary_text += f"<br>• {backups} backup file(s)"
 
             self.summary_label = QLabel(summary_text)
+            self.summary_label.setTextFormat(Qt.RichText)
             layout.addWidget(self.summary_label)
 
             if warnings:
@@ -142,22 +425,29 @@ class UnusedFilesDialog(QDialog):
 
             layout.addLayout(controls_layout)
 
-            # Table with unused files
-            self.table = QTableWidget()
-            self.table.setColumnCount(6)
-            self.table.setHorizontalHeaderLabels(["", "File Name", "Type", "Size", "Location", "Hide"])
-            self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+            # Table with unused files; cells are produced by the model on demand
+            self.model = UnusedFilesModel(self.unused_files, self)
+            self.model.hidden_toggled.connect(self._toggle_hide_file)
+            self.proxy = UnusedFilesFilterModel(self)
+            self.proxy.setSourceModel(self.model)
+
+            self.table = QTableView()
+            self.table.setModel(self.proxy)
             self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-            self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-            self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
             self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
-            self.table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+            self._set_fixed_column_widths()
             self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+            # Every row is a single line, so fixed row heights let the view
+            # map scroll offsets to rows without measuring any of them
+            vertical_header = self.table.verticalHeader()
+            vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            vertical_header.setDefaultSectionSize(24)
+            self.table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+            # Keep scan order until a header is clicked
+            self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            self.table.setSortingEnabled(True)
             self.table.setAlternatingRowColors(True)
 
-            # Populate table
-            self._populate_table()
-
             layout.addWidget(self.table)
 
         # Bottom buttons
@@ -176,169 +466,117 @@ class UnusedFilesDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def _populate_table(self):
-        """Populate table with unused files."""
-        self.table.setRowCount(len(self.unused_files))
-
-        for row, file_info in enumerate(self.unused_files):
-            # Checkbox
-            checkbox = QCheckBox()
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.table.setCellWidget(row, 0, checkbox_widget)
-
-            # File name
-            name_item = QTableWidgetItem(file_info["name"])
-            name_item.setData(Qt.ItemDataRole.UserRole, file_info)  # Store full file info
-            self.table.setItem(row, 1, name_item)
-
-            # Type
-            file_type = file_info["type"].capitalize()
-            type_item = QTableWidgetItem(file_type)
-
-            # Color code by type
-            if file_info["type"] == "texture":
-                type_item.setForeground(QColor("#2196F3"))  # Blue
-            elif file_info["type"] == "blend":
-                type_item.setForeground(QColor("#FF9800"))  # Orange
-            elif file_info["type"] == "backup":
-                type_item.setForeground(QColor("#9E9E9E"))  # Gray
-
-            self.table.setItem(row, 2, type_item)
-
-            # Size
-            size_bytes = file_info["size"]
-            if size_bytes < 1024:
-                size_str = f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                size_str = f"{size_bytes / 1024:.1f} KB"
-            else:
-                size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-
-            size_item = QTableWidgetItem(size_str)
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 3, size_item)
-
-            # Location
-            location_item = QTableWidgetItem(file_info["relative_path"])
-            self.table.setItem(row, 4, location_item)
-
-            # Hide checkbox
-            hide_checkbox = QCheckBox()
-            hide_checkbox_widget = QWidget()
-            hide_checkbox_layout = QHBoxLayout(hide_checkbox_widget)
-            hide_checkbox_layout.addWidget(hide_checkbox)
-            hide_checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            hide_checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            hide_checkbox.stateChanged.connect(lambda state, r=row: self._toggle_hide_file(r))
-            self.table.setCellWidget(row, 5, hide_checkbox_widget)
+    def _set_fixed_column_widths(self):
+        """Size the short columns from font metrics instead of their contents.
+
+        ResizeToContents measures the text of every row (up to 1000) whenever
+        the table changes; these columns have a known widest value.
+        """
+        header = self.table.horizontalHeader()
+        cell_metrics = self.table.fontMetrics()
+        header_metrics = header.fontMetrics()
+        style = self.table.style()
+        padding = (
+            2 * style.pixelMetric(QStyle.PixelMetric.PM_HeaderMargin)
+            + style.pixelMetric(QStyle.PixelMetric.PM_HeaderMarkSize)
+        )
+        checkbox = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorWidth) + padding
+
+        def text_width(cells, column):
+            widest = max(cell_metrics.horizontalAdvance(text) for text in cells)
+            title = header_metrics.horizontalAdvance(UnusedFilesModel.HEADERS[column])
+            return max(widest, title) + padding
+
+        widths = {
+            COL_SELECT: checkbox,
+            COL_TYPE: text_width([t.capitalize() for t in FILE_TYPES], COL_TYPE),
+            COL_SIZE: text_width(["9999.99 MB"], COL_SIZE),
+            COL_HIDE: max(checkbox, text_width([""], COL_HIDE)),
+        }
+        for column, width in widths.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
 
     def _on_checkbox_changed(self):
         """Handle checkbox state changes."""
+        self._pending_timer.start()
+
+    def _apply_pending_changes(self):
+        """Re-filter the table and save state after checkbox changes."""
         self._apply_filters()
         self._save_state()
 
+    def flush_pending_changes(self):
+        """Apply checkbox changes still waiting for the timer."""
+        if self._pending_timer.isActive():
+            self._pending_timer.stop()
+            self._apply_pending_changes()
+
+    def done(self, result: int):
+        """Write pending state before the dialog closes."""
+        self.flush_pending_changes()
+        super().done(result)
+
     def _toggle_hide_file(self, row: int):
         """Toggle hide status for a file.
 
         Args:
-            row: Row index in the table
+            row: Row index in the model
         """
-        name_item = self.table.item(row, 1)
-        if not name_item:
-            return
+        file_path = self.model._paths[row]
 
-        file_info = name_item.data(Qt.ItemDataRole.UserRole)
-        file_path = file_info["path"]
-
-        # Get checkbox state
-        hide_checkbox_widget = self.table.cellWidget(row, 5)
-        if hide_checkbox_widget:
-            hide_checkbox = hide_checkbox_widget.findChild(QCheckBox)
-            if hide_checkbox:
-                # Update hidden status based on checkbox state
-                if hide_checkbox.isChecked():
-                    self.hidden_files.add(file_path)
-                else:
-                    self.hidden_files.discard(file_path)
-
-                # Apply filters to show/hide row
-                self._apply_filters()
+        # Update hidden status based on checkbox state
+        if self.model.is_hidden(row):
+            self.hidden_files.add(file_path)
+        else:
+            self.hidden_files.discard(file_path)
 
-                # Save state
-                self._save_state()
+        # Re-filter and save once the current burst of changes settles
+        self._pending_timer.start()
 
     def _apply_filters(self):
         """Apply type filters and hidden status to table rows."""
-        show_textures = self.show_textures_check.isChecked()
-        show_blends = self.show_blends_check.isChecked()
-        show_backups = self.show_backups_check.isChecked()
-        show_hidden = self.show_hidden_check.isChecked()
-
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 1)
-            if name_item:
-                file_info = name_item.data(Qt.ItemDataRole.UserRole)
-                file_type = file_info["type"]
-                file_path = file_info["path"]
-
-                # Check type filter
-                type_match = (
-                    (file_type == "texture" and show_textures) or
-                    (file_type == "blend" and show_blends) or
-                    (file_type == "backup" and show_backups)
-                )
-
-                # Check hidden status
-                is_hidden = file_path in self.hidden_files
-                hidden_match = show_hidden or not is_hidden
-
-                should_show = type_match and hidden_match
+        self.proxy.set_filters(
+            self.show_textures_check.isChecked(),
+            self.show_blends_check.isChecked(),
+            self.show_backups_check.isChecked(),
+            self.show_hidden_check.isChecked(),
+        )
 
-                self.table.setRowHidden(row, not should_show)
+    def _visible_rows(self):
+        """Get the model rows that pass the current filters."""
+        proxy = self.proxy
+        return [
+            proxy.mapToSource(proxy.index(i, 0)).row()
+            for i in range(proxy.rowCount())
+        ]
 
     def _select_all(self):
         """Select all visible checkboxes."""
-        for row in range(self.table.rowCount()):
-            if not self.table.isRowHidden(row):
-                checkbox_widget = self.table.cellWidget(row, 0)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        checkbox.setChecked(True)
+        self.flush_pending_changes()
+        self.model.set_checked_rows(self._visible_rows(), True)
 
     def _select_none(self):
         """Deselect all checkboxes."""
-        for row in range(self.table.rowCount()):
-            checkbox_widget = self.table.cellWidget(row, 0)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox:
-                    checkbox.setChecked(False)
+        self.model.clear_checked()
+
+    def _get_selected_rows(self):
+        """Get the checked model rows that pass the current filters."""
+        self.flush_pending_changes()
+        accepts = self.proxy.filterAcceptsRow
+        parent = QModelIndex()
+        return [row for row in sorted(self.model.checked_rows) if accepts(row, parent)]
 
     def _get_selected_files(self):
         """Get list of selected file paths."""
-        selected = []
-        for row in range(self.table.rowCount()):
-            if not self.table.isRowHidden(row):
-                checkbox_widget = self.table.cellWidget(row, 0)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox and checkbox.isChecked():
-                        name_item = self.table.item(row, 1)
-                        if name_item:
-                            file_info = name_item.data(Qt.ItemDataRole.UserRole)
-                            selected.append(file_info)
-        return selected
+        unused_files = self.unused_files
+        return [unused_files[row] for row in self._get_selected_rows()]
 
     def _delete_selected(self):
         """Delete selected files after confirmation."""
-        selected_files = self._get_selected_files()
+        selected_rows = self._get_selected_rows()
 
-        if not selected_files:
+        if not selected_rows:
             QMessageBox.warning(
                 self,
                 "No Files Selected",
@@ -347,12 +585,13 @@ class UnusedFilesDialog(QDialog):
             return
 
         # Count by type
-        textures = sum(1 for f in selected_files if f["type"] == "texture")
-        blends = sum(1 for f in selected_files if f["type"] == "blend")
-        backups = sum(1 for f in selected_files if f["type"] == "backup")
+        counts = self.model.type_counts(selected_rows)
+        textures = counts[TYPE_IDX["texture"]]
+        blends = counts[TYPE_IDX["blend"]]
+        backups = counts[TYPE_IDX["backup"]]
 
         # Build warning message
-        msg_parts = [f"You are about to delete {len(selected_files)} file(s):"]
+        msg_parts = [f"You are about to delete {len(selected_rows)} file(s):"]
         if textures > 0:
             msg_parts.append(f"• {textures} texture file(s)")
         if blends > 0:
@@ -379,19 +618,7 @@ class UnusedFilesDialog(QDialog):
             return
 
         # Delete files
-        deleted_files = []
-        errors = []
-
-        for file_info in selected_files:
-            file_path = Path(file_info["path"])
-            try:
-                if file_path.exists():
-                    send2trash(str(file_path))
-                    deleted_files.append(file_info["path"])
-                else:
-                    errors.append(f"File not found: {file_info['name']}")
-            except Exception as e:
-                errors.append(f"Failed to delete {file_info['name']}: {str(e)}")
+        deleted_files, errors = self._trash_rows(selected_rows)
 
         # Show result
         if deleted_files:
@@ -411,17 +638,63 @@ class UnusedFilesDialog(QDialog):
                 f"Failed to delete files:\n" + "\n".join(errors[:5])
             )
 
+    def _trash_rows(self, rows: list) -> tuple:
+        """Move the files of several rows to the trash.
+
+        Where the platform trash takes many files in one operation they are
+        sent together; if that fails, the files still present are retried
+        one by one so each failure is reported.
+
+        Args:
+            rows: Model rows to delete
+
+        Returns:
+            Tuple of (deleted file paths, error messages)
+        """
+        files = [self.unused_files[row] for row in rows]
+        deleted_files = []
+        errors = []
+
+        if _BATCH_TRASH and len(files) > 1:
+            # Note which files exist first, so a file that is gone after a
+            # failed batch counts as deleted only if the batch removed it
+            present = []
+            for file_info in files:
+                if os.path.lexists(file_info["path"]):
+                    present.append(file_info)
+                else:
+                    errors.append(f"File not found: {file_info['name']}")
+
+            try:
+                send2trash([f["path"] for f in present])
+                return [f["path"] for f in present], errors
+            except Exception:
+                deleted_files = [f["path"] for f in present if not os.path.lexists(f["path"])]
+                files = [f for f in present if os.path.lexists(f["path"])]
+
+        for file_info in files:
+            # send2trash checks existence itself; no separate stat per file
+            try:
+                send2trash(file_info["path"])
+                deleted_files.append(file_info["path"])
+            except FileNotFoundError:
+                errors.append(f"File not found: {file_info['name']}")
+            except Exception as e:
+                errors.append(f"Failed to delete {file_info['name']}: {str(e)}")
+
+        return deleted_files, errors
+
     def _save_state(self):
         """Save dialog state (checkbox states and hidden files) to config file."""
         if not self.config_file:
             return
 
         try:
-            # Load existing config
-            config_data = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+            # Re-read the file so changes made by other sections are kept
+            try:
+                config_data = dict(load_json_cached(self.config_file))
+            except FileNotFoundError:
+                config_data = {}
 
             # Save checkbox states and hidden files
             config_data['unused_files_dialog'] = {
@@ -431,9 +704,7 @@ class UnusedFilesDialog(QDialog):
                 'show_hidden': self.show_hidden_check.isChecked(),
                 'hidden_files': list(self.hidden_files)
             }
-
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            write_json_atomic(self.config_file, config_data)
 
         except Exception as e:
             print(f"Warning: Could not save unused files dialog state: {e}")
@@ -444,23 +715,30 @@ class UnusedFilesDialog(QDialog):
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            # Parsed once per file version; shared, so only read from it
+            config_data = load_json_cached(self.config_file)
 
             dialog_state = config_data.get('unused_files_dialog', {})
 
             # Restore hidden files list
             self.hidden_files = set(dialog_state.get('hidden_files', []))
 
-            # Restore checkbox states (default to True for type filters, False for show_hidden)
-            if hasattr(self, 'show_textures_check'):
-                self.show_textures_check.setChecked(dialog_state.get('show_textures', True))
-            if hasattr(self, 'show_blends_check'):
-                self.show_blends_check.setChecked(dialog_state.get('show_blends', True))
-            if hasattr(self, 'show_backups_check'):
-                self.show_backups_check.setChecked(dialog_state.get('show_backups', True))
-            if hasattr(self, 'show_hidden_check'):
-                self.show_hidden_check.setChecked(dialog_state.get('show_hidden', False))
+            # No table (and no filter checkboxes) when nothing is unused
+            if not hasattr(self, 'table'):
+                return
+
+            # Restore checkbox states (default to True for type filters, False
+            # for show_hidden) with signals blocked, so the table is filtered
+            # once below instead of once per checkbox
+            for checkbox, key, default in (
+                (self.show_textures_check, 'show_textures', True),
+                (self.show_blends_check, 'show_blends', True),
+                (self.show_backups_check, 'show_backups', True),
+                (self.show_hidden_check, 'show_hidden', False),
+            ):
+                checkbox.blockSignals(True)
+                checkbox.setChecked(dialog_state.get(key, default))
+                checkbox.blockSignals(False)
 
             # Update hide checkbox states for hidden files
             self._update_hide_checkboxes()
@@ -473,17 +751,4 @@ class UnusedFilesDialog(QDialog):
 
     def _update_hide_checkboxes(self):
         """Update all hide checkbox states based on hidden status."""
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 1)
-            if name_item:
-                file_info = name_item.data(Qt.ItemDataRole.UserRole)
-                file_path = file_info["path"]
-
-                hide_checkbox_widget = self.table.cellWidget(row, 5)
-                if hide_checkbox_widget:
-                    hide_checkbox = hide_checkbox_widget.findChild(QCheckBox)
-                    if hide_checkbox:
-                        # Block signals to avoid triggering _toggle_hide_file
-                        hide_checkbox.blockSignals(True)
-                        hide_checkbox.setChecked(file_path in self.hidden_files)
-                        hide_checkbox.blockSignals(False)
+        self.model.set_hidden_paths(self.hidden_files)
@@ -5,15 +5,22 @@ This is much faster than launching Blender separately for each file.
 Usage:
     blender --background --python batch_scan_references.py -- \
         --blend-files /path/to/file1.blend,/path/to/file2.blend,... \
-        --target-file /path/to/target.blend
+        --target-file /path/to/target.blend \
+        [--shard 0/4]
+
+With --shard I/N only every N-th file starting at index I is scanned, so
+several Blender processes can split one file list between them.
 """
 
-import json
 import os
 import sys
 
 import bpy
 
+# Import shared utilities
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "blender_lib"))
+from script_utils import output_json
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -26,6 +33,7 @@ def parse_args():
 
     blend_files = None
     target_file = None
+    shard = "0/1"
 
     i = 0
     while i < len(args):
@@ -35,6 +43,9 @@ def parse_args():
         elif args[i] == "--target-file" and i + 1 < len(args):
             target_file = args[i + 1]
             i += 2
+        elif args[i] == "--shard" and i + 1 < len(args):
+            shard = args[i + 1]
+            i += 2
         else:
             i += 1
 
@@ -42,12 +53,39 @@ def parse_args():
         print("ERROR: Missing required arguments")
         return None
 
+    try:
+        shard_index, shard_count = (int(part) for part in shard.split("/"))
+    except ValueError:
+        print(f"ERROR: Invalid --shard value: {shard}")
+        return None
+
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        print(f"ERROR: Invalid --shard value: {shard}")
+        return None
+
     return {
         "blend_files": [f.strip() for f in blend_files.split(",") if f.strip()],
-        "target_file": target_file
+        "target_file": target_file,
+        "shard_index": shard_index,
+        "shard_count": shard_count
     }
 
 
+def normalize_path(path):
+    """Resolve a Blender file path to a normalized absolute path.
+
+    Args:
+        path: File path, possibly relative to the open .blend file ("//")
+
+    Returns:
+        Absolute path, case-folded on case-insensitive platforms
+    """
+    resolved = bpy.path.abspath(path)
+    if not os.path.isabs(resolved):
+        resolved = os.path.abspath(resolved)
+    return os.path.normcase(os.path.normpath(resolved))
+
+
 def scan_file_for_target(blend_path, target_abs_path):
     """Scan a single blend file for references to target file.
 
@@ -66,18 +104,19 @@ def scan_file_for_target(blend_path, target_abs_path):
         "error": None
     }
 
+    target_norm = os.path.normcase(os.path.normpath(target_abs_path))
+
     try:
-        # Open the blend file
-        bpy.ops.wm.open_mainfile(filepath=blend_path)
+        # Open the blend file; only its datablocks are read, so skip the
+        # UI layout and any registered scripts it carries
+        bpy.ops.wm.open_mainfile(filepath=blend_path, load_ui=False, use_scripts=False)
 
         # Check images
         for img in bpy.data.images:
             if not img.filepath:
                 continue
 
-            resolved = bpy.path.abspath(img.filepath)
-            resolved_abs = os.path.abspath(resolved)
-            if resolved_abs == target_abs_path:
+            if normalize_path(img.filepath) == target_norm:
                 result["has_references"] = True
                 result["images"].append({
                     "name": img.name,
@@ -89,9 +128,7 @@ def scan_file_for_target(blend_path, target_abs_path):
             if not lib.filepath:
                 continue
 
-            resolved = bpy.path.abspath(lib.filepath)
-            resolved_abs = os.path.abspath(resolved)
-            if resolved_abs == target_abs_path:
+            if normalize_path(lib.filepath) == target_norm:
                 result["has_references"] = True
                 result["libraries"].append({
                     "name": lib.name,
@@ -112,6 +149,9 @@ def main():
 
     target_abs = os.path.abspath(args["target_file"])
 
+    # Nothing is edited, so no undo steps need to be recorded per file
+    bpy.context.preferences.edit.use_global_undo = False
+
     results = {
         "target_file": args["target_file"],
         "files_scanned": 0,
@@ -119,7 +159,9 @@ def main():
         "scan_results": []
     }
 
-    for blend_file in args["blend_files"]:
+    shard_files = args["blend_files"][args["shard_index"]::args["shard_count"]]
+
+    for blend_file in shard_files:
         if not os.path.exists(blend_file):
             continue
 
@@ -130,7 +172,7 @@ def main():
         if scan_result["has_references"]:
             results["files_with_references"].append(blend_file)
 
-    print("JSON_OUTPUT:", json.dumps(results, indent=2))
+    output_json(results)
 
 
 if __name__ == "__main__":
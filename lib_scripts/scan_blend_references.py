@@ -8,12 +8,16 @@ Usage:
         --blend-file /path/to/file.blend
 """
 
-import json
 import os
 import sys
+from collections import defaultdict
 
 import bpy
 
+# Import shared utilities
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "blender_lib"))
+from script_utils import output_json
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -53,26 +57,40 @@ def scan_references(blend_path):
     # Scan images
     for img in bpy.data.images:
         if img.filepath:
+            resolved = bpy.path.abspath(img.filepath)
             img_ref = {
                 "name": img.name,
                 "filepath": img.filepath,
                 "is_relative": img.filepath.startswith("//"),
-                "resolved": bpy.path.abspath(img.filepath),
-                "exists": os.path.exists(bpy.path.abspath(img.filepath))
+                "resolved": resolved,
+                "exists": os.path.exists(resolved)
             }
             references["images"].append(img_ref)
 
+    # Group linked datablocks by library in one pass each, rather than
+    # walking all objects and collections again for every library
+    objects_by_lib = defaultdict(list)
+    for obj in bpy.data.objects:
+        if obj.library is not None:
+            objects_by_lib[obj.library].append(obj.name)
+
+    collections_by_lib = defaultdict(list)
+    for col in bpy.data.collections:
+        if col.library is not None:
+            collections_by_lib[col.library].append(col.name)
+
     # Scan libraries
     for lib in bpy.data.libraries:
         if lib.filepath:
+            resolved = bpy.path.abspath(lib.filepath)
             lib_ref = {
                 "name": lib.name,
                 "filepath": lib.filepath,
                 "is_relative": lib.filepath.startswith("//"),
-                "resolved": bpy.path.abspath(lib.filepath),
-                "exists": os.path.exists(bpy.path.abspath(lib.filepath)),
-                "objects": [obj.name for obj in bpy.data.objects if obj.library == lib],
-                "collections": [col.name for col in bpy.data.collections if col.library == lib]
+                "resolved": resolved,
+                "exists": os.path.exists(resolved),
+                "objects": objects_by_lib.get(lib, []),
+                "collections": collections_by_lib.get(lib, [])
             }
             references["libraries"].append(lib_ref)
 
@@ -87,7 +105,7 @@ def main():
 
     try:
         references = scan_references(args["blend_file"])
-        print("JSON_OUTPUT:", json.dumps(references, indent=2))
+        output_json(references)
     except Exception as e:
         print(f"ERROR: {str(e)}")
         sys.exit(1)
@@ -10,12 +10,15 @@ Usage:
         --new-path /new/location
 """
 
-import json
 import os
 import sys
 
 import bpy
 
+# Import shared utilities
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "blender_lib"))
+from script_utils import output_json
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -55,11 +58,33 @@ def parse_args():
     }
 
 
+def rebase_path(abs_path, old_path, old_prefix, new_path):
+    """Move a path from under the old location to the new one.
+
+    Args:
+        abs_path: Absolute path of a datablock's file
+        old_path: Old location
+        old_prefix: old_path normalized and case-folded
+        new_path: New location
+
+    Returns:
+        The rebased path, or None if abs_path is not at or under the old location
+    """
+    abs_path = os.path.normpath(abs_path)
+    folded = os.path.normcase(abs_path)
+    if folded == old_prefix:
+        return new_path
+    if folded.startswith(old_prefix + os.sep):
+        return os.path.join(new_path, os.path.relpath(abs_path, old_path))
+    return None
+
+
 def update_paths(blend_file, old_path, new_path):
     """Update paths in blend file."""
     bpy.ops.wm.open_mainfile(filepath=blend_file)
 
     changes = []
+    old_prefix = os.path.normcase(os.path.normpath(old_path))
 
     # Update image paths
     for img in bpy.data.images:
@@ -71,9 +96,8 @@ def update_paths(blend_file, old_path, new_path):
 
         abs_path = bpy.path.abspath(original_path)
 
-        if old_path in abs_path:
-            new_abs_path = abs_path.replace(old_path, new_path)
-
+        new_abs_path = rebase_path(abs_path, old_path, old_prefix, new_path)
+        if new_abs_path is not None:
             if is_relative:
                 new_img_path = bpy.path.relpath(new_abs_path)
             else:
@@ -100,9 +124,8 @@ def update_paths(blend_file, old_path, new_path):
 
         abs_path = os.path.realpath(bpy.path.abspath(original_path))
 
-        if old_path in abs_path:
-            new_abs_path = abs_path.replace(old_path, new_path)
-
+        new_abs_path = rebase_path(abs_path, old_path, old_prefix, new_path)
+        if new_abs_path is not None:
             if is_relative:
                 new_lib_path = bpy.path.relpath(new_abs_path)
             else:
@@ -141,13 +164,13 @@ def main():
             "changes_count": len(changes),
             "changes": changes
         }
-        print("JSON_OUTPUT:", json.dumps(result, indent=2))
+        output_json(result)
     except Exception as e:
         result = {
             "success": False,
             "error": str(e)
         }
-        print("JSON_OUTPUT:", json.dumps(result, indent=2))
+        output_json(result)
         sys.exit(1)
 
 
@@ -34,8 +34,8 @@ def main():
     # Create and show main window (theme will be loaded in MainWindow.__init__)
     window = MainWindow()
 
-    # Apply global theme stylesheet after window loads theme preference
-    app.setStyleSheet(Theme.get_stylesheet())
+    # Apply global theme after window loads theme preference
+    Theme.apply_app_theme(app)
 
     window.show()
 
@@ -1,17 +1,23 @@
 """High-level Blender operations with preview support."""
 
 import json
+import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecoder
 from pathlib import Path
 from typing import Callable, List, Optional
 
 from blender_lib.blender_runner import BlenderRunner
-from blender_lib.constants import TEXTURE_EXTENSIONS, BLEND_EXTENSIONS
+from blender_lib.constants import TEXTURE_EXTENSIONS, BLEND_EXTENSIONS, MAX_SCAN_PROCESSES
 from blender_lib.models import OperationPreview, OperationResult, PathChange, LinkOperationParams
 from blender_lib.script_utils import JSON_OUTPUT_MARKER
+from core import json_utils
 from services.filesystem_service import FilesystemService
 
+logger = logging.getLogger(__name__)
+
 
 def extract_json_from_output(output: str, marker: str = JSON_OUTPUT_MARKER) -> dict:
     """Extract JSON data from Blender output.
@@ -36,6 +42,15 @@ def extract_json_from_output(output: str, marker: str = JSON_OUTPUT_MARKER) -> d
     # Start after the marker
     json_text = output[json_start + len(marker):].lstrip()
 
+    # Trailing Blender output rarely contains braces, so try the cheap
+    # whole-document parse first and only scan incrementally if it fails
+    json_end = max(json_text.rfind('}'), json_text.rfind(']'))
+    if json_end != -1:
+        try:
+            return json_utils.loads(json_text[:json_end + 1])
+        except ValueError:
+            pass
+
     # Use JSONDecoder to parse and find where JSON ends
     decoder = JSONDecoder()
     try:
@@ -45,6 +60,36 @@ def extract_json_from_output(output: str, marker: str = JSON_OUTPUT_MARKER) -> d
         raise ValueError(f"Failed to parse JSON: {e}")
 
 
+def read_json_result(output_path: Path, output: str) -> dict:
+    """Read a script result written to a file, falling back to stdout.
+
+    Scripts that support ``--output-json`` write their result to the file on
+    success, but errors are still reported on stdout with the JSON marker.
+
+    Args:
+        output_path: File the script was asked to write its result to
+        output: The stdout from Blender
+
+    Returns:
+        Parsed JSON dictionary
+
+    Raises:
+        ValueError: If JSON cannot be found or parsed
+    """
+    try:
+        raw = output_path.read_bytes()
+    except OSError:
+        raw = b''
+
+    if not raw:
+        return extract_json_from_output(output)
+
+    try:
+        return json_utils.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Failed to parse JSON: {e}")
+
+
 class BlenderService:
     """Coordinates Blender operations with preview and execution modes."""
 
@@ -636,8 +681,7 @@ class BlenderService:
             )
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Directory move failed: %s -> %s", old_path, new_path)
 
             # Try to rollback the directory move
             if new_path.exists() and not old_path.exists():
@@ -783,9 +827,12 @@ class BlenderService:
             )
 
     def _batch_scan_for_references(self, blend_files: List[Path], target_file: Path) -> List[Path]:
-        """Scan multiple blend files for references in a single Blender session.
+        """Scan multiple blend files for references across parallel Blender processes.
 
-        Much faster than launching Blender separately for each file.
+        The files are split into shards, one per Blender process, with up to
+        MAX_SCAN_PROCESSES processes running at once. Each process scans its
+        shard in a single session. If any shard fails, the whole scan falls
+        back to scanning each file individually.
 
         Args:
             blend_files: List of .blend files to scan
@@ -802,24 +849,36 @@ class BlenderService:
 
             # Create comma-separated list of blend files
             blend_files_str = ','.join(str(f) for f in blend_files)
+            target_str = str(target_file.resolve())
 
-            result = self.runner.run_script(
-                script_path,
-                {
-                    "blend-files": blend_files_str,
-                    "target-file": str(target_file.resolve())
-                },
-                timeout=300  # 5 minutes for scanning many files
-            )
-
-            # Parse JSON output
-            data = extract_json_from_output(result.stdout)
-
-            # Extract list of files with references
-            files_with_refs = data.get("files_with_references", [])
-
-            # Convert back to Path objects
-            return [Path(f) for f in files_with_refs]
+            def run_shard(shard_index: int, shard_count: int) -> list:
+                result = self.runner.run_script(
+                    script_path,
+                    {
+                        "blend-files": blend_files_str,
+                        "target-file": target_str,
+                        "shard": f"{shard_index}/{shard_count}"
+                    },
+                    timeout=300  # 5 minutes for scanning many files
+                )
+                # Parse JSON output and extract list of files with references
+                data = extract_json_from_output(result.stdout)
+                return data.get("files_with_references", [])
+
+            # Loading a .blend is single-threaded in Blender, so split the
+            # list across several processes that each scan every N-th file
+            shard_count = min(os.cpu_count() or 1, len(blend_files), MAX_SCAN_PROCESSES)
+            if shard_count == 1:
+                files_with_refs = set(run_shard(0, 1))
+            else:
+                with ThreadPoolExecutor(max_workers=shard_count) as executor:
+                    futures = [executor.submit(run_shard, i, shard_count) for i in range(shard_count)]
+                    files_with_refs = set()
+                    for future in futures:
+                        files_with_refs.update(future.result())
+
+            # Convert back to Path objects, in the order the files were given
+            return [f for f in blend_files if str(f) in files_with_refs]
 
         except Exception as e:
             print(f"Warning: Batch scan failed, falling back to individual scans: {e}")
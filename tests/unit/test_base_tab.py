@@ -0,0 +1,160 @@
+"""Unit tests for shared operation tab helpers."""
+
+from gui.operations.base_tab import BaseOperationTab
+
+
+class TestMessageFormatting:
+    """Tests for the message formatting helpers."""
+
+    def test_bullet_list_without_hidden_items(self):
+        """Test that each item becomes one bullet line."""
+        result = BaseOperationTab.format_bullet_list(["a.blend", "b.blend"])
+
+        assert result == "  • a.blend<br>  • b.blend<br>"
+
+    def test_bullet_list_with_hidden_items(self):
+        """Test that a summary line is added for truncated items."""
+        items = [f"file{i}" for i in range(8)]
+
+        result = BaseOperationTab.format_bullet_list(items[:5], len(items) - 5)
+
+        assert result.count("•") == 5
+        assert result.endswith("  ... and 3 more<br>")
+
+    def test_section_is_empty_without_items(self):
+        """Test that an empty section produces no output."""
+        assert BaseOperationTab.format_message_section("Warnings", []) == ""
+
+    def test_section_has_title(self):
+        """Test that a section starts with its bold title."""
+        result = BaseOperationTab.format_message_section("Errors", ["boom"])
+
+        assert result == "<br><b>Errors:</b><br>  • boom<br>"
+
+
+class TestRunInBackground:
+    """Tests for running blocking tasks off the GUI thread."""
+
+    def _make_tab(self):
+        from unittest.mock import MagicMock
+        from PySide6.QtWidgets import QPushButton
+
+        class Tab(BaseOperationTab):
+            def _update_controls(self):
+                button.setEnabled(not self.is_busy)
+                other.setEnabled(not self.is_busy)
+
+        tab = Tab(MagicMock())
+        button = QPushButton("Run", tab)
+        other = QPushButton("Other", tab)
+        return tab, button, other
+
+    def test_result_is_delivered_and_state_restored(self, qapp, qtbot):
+        """Test that the result reaches on_finished after the button is restored."""
+        tab, button, other = self._make_tab()
+        results = []
+
+        tab.run_in_background(
+            lambda: 42,
+            lambda result: results.append((result, button.text(), button.isEnabled())),
+            lambda error: results.append(error),
+            button,
+            "Working...",
+            extra_widgets=(other,)
+        )
+
+        assert button.text() == "Working..."
+        assert not other.isEnabled()
+
+        qtbot.waitUntil(lambda: len(results) > 0, timeout=2000)
+
+        assert results == [(42, "Run", True)]
+        assert other.isEnabled()
+        assert not tab.is_busy
+
+    def test_controls_are_recomputed_not_replayed(self, qapp, qtbot):
+        """Test that a finished task does not re-enable a control from its snapshot."""
+        import threading
+
+        tab, button, other = self._make_tab()
+        release = threading.Event()
+        done = []
+
+        tab.run_in_background(
+            lambda: release.wait(5),
+            done.append,
+            done.append,
+            button,
+            "Working...",
+            extra_widgets=(other,)
+        )
+        assert tab.is_busy
+
+        # The tab state changes while the task runs
+        tab._update_controls = lambda: other.setEnabled(False)
+        release.set()
+        qtbot.waitUntil(lambda: len(done) > 0, timeout=2000)
+
+        assert not other.isEnabled()
+        assert button.text() == "Run"
+
+    def test_exception_is_reported_as_error(self, qapp, qtbot):
+        """Test that exceptions in the task are passed to on_error."""
+        tab, button, _ = self._make_tab()
+        errors = []
+
+        def fail():
+            raise RuntimeError("Blender crashed")
+
+        tab.run_in_background(fail, lambda result: None, errors.append, button, "Working...")
+
+        qtbot.waitUntil(lambda: len(errors) > 0, timeout=2000)
+
+        assert errors == ["Blender crashed"]
+        assert button.isEnabled()
+
+    def test_exception_traceback_is_logged(self, qapp, qtbot, caplog):
+        """Test that the worker logs the traceback of a failed task."""
+        import logging
+
+        tab, button, _ = self._make_tab()
+        errors = []
+
+        def fail():
+            raise RuntimeError("Blender crashed")
+
+        with caplog.at_level(logging.ERROR, logger="gui.operations.workers"):
+            tab.run_in_background(fail, lambda result: None, errors.append, button, "Working...")
+            qtbot.waitUntil(lambda: len(errors) > 0, timeout=2000)
+
+        assert any(record.exc_info for record in caplog.records)
+
+
+class TestLoadingState:
+    """Tests for the loading state context manager."""
+
+    def test_wait_cursor_is_shared(self, qapp):
+        """Test that every tab reuses the same wait cursor instance."""
+        assert BaseOperationTab._wait_cursor() is BaseOperationTab._wait_cursor()
+
+    def test_state_restored_after_exception(self, qapp):
+        """Test that the button and extra widgets are restored when the body raises."""
+        from unittest.mock import MagicMock
+        from PySide6.QtWidgets import QApplication, QPushButton
+
+        tab = BaseOperationTab(MagicMock())
+        button = QPushButton("Load", tab)
+        other = QPushButton("Other", tab)
+
+        try:
+            with tab.loading_state(button, "Loading...", extra_widgets=(other,)):
+                assert button.text() == "Loading..."
+                assert QApplication.overrideCursor() is not None
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+        assert button.text() == "Load"
+        assert button.isEnabled()
+        assert other.isEnabled()
+        assert QApplication.overrideCursor() is None
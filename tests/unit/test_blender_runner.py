@@ -292,6 +292,52 @@ class TestRunScriptWithProgress:
             assert "error1" in result.stderr
 
 
+class TestRunScriptStreaming:
+    """Tests for run_script_streaming method."""
+
+    def _make_runner(self, tmp_path):
+        from blender_lib.blender_runner import BlenderRunner
+
+        blender_path = tmp_path / "blender"
+        blender_path.write_text("#!/bin/bash")
+
+        script_path = tmp_path / "test_script.py"
+        script_path.write_text("print('test')")
+
+        return BlenderRunner(blender_path), script_path
+
+    def test_streaming_keeps_only_json_region(self, tmp_path):
+        """Test that stdout only contains output from the JSON marker on."""
+        runner, script_path = self._make_runner(tmp_path)
+
+        mock_process = MagicMock()
+        mock_process.returncode = 0
+        mock_process.stdout = iter([
+            "Blender 4.2\n", "Read blend\n", 'JSON_OUTPUT:{\n', '  "success": true\n', "}\n", "Blender quit\n"
+        ])
+        mock_process.stderr = iter([])
+
+        with patch('subprocess.Popen', return_value=mock_process):
+            result = runner.run_script_streaming(script_path, {})
+
+        assert result.stdout == 'JSON_OUTPUT:{\n  "success": true\n}\nBlender quit'
+
+    def test_streaming_forwards_log_lines(self, tmp_path):
+        """Test that lines before the marker go to the callback."""
+        runner, script_path = self._make_runner(tmp_path)
+
+        mock_process = MagicMock()
+        mock_process.returncode = 0
+        mock_process.stdout = iter(["Read blend\n", 'JSON_OUTPUT:{}\n'])
+        mock_process.stderr = iter([])
+
+        lines = []
+        with patch('subprocess.Popen', return_value=mock_process):
+            runner.run_script_streaming(script_path, {}, lines.append)
+
+        assert lines == ["Read blend"]
+
+
 class TestRunInline:
     """Tests for run_inline method."""
 
@@ -0,0 +1,60 @@
+"""Unit tests for BlenderService."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def service(tmp_path):
+    """Create a service with a fake Blender executable."""
+    from services.blender_service import BlenderService
+
+    blender_path = tmp_path / "blender"
+    blender_path.write_text("#!/bin/bash")
+    return BlenderService(blender_path, tmp_path)
+
+
+def _fake_batch_scan(referencing):
+    """Build a run_script stand-in that scans its shard of the file list."""
+    calls = []
+
+    def run_script(script_path, args, timeout=None):
+        calls.append(args["shard"])
+        shard_index, shard_count = (int(part) for part in args["shard"].split("/"))
+        files = args["blend-files"].split(",")[shard_index::shard_count]
+        data = {"files_with_references": [f for f in files if f in referencing]}
+        stdout = f"JSON_OUTPUT: {json.dumps(data)}\nBlender quit\n"
+        return subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
+
+    return run_script, calls
+
+
+class TestBatchScanForReferences:
+    """Tests for splitting a batch reference scan across Blender processes."""
+
+    def test_shards_are_merged_in_input_order(self, service, tmp_path):
+        """Test that each shard is scanned once and hits keep the input order."""
+        blend_files = [tmp_path / f"scene{i}.blend" for i in range(6)]
+        referencing = {str(blend_files[i]) for i in (5, 1, 2)}
+        run_script, calls = _fake_batch_scan(referencing)
+
+        with patch.object(service.runner, "run_script", side_effect=run_script), \
+                patch("services.blender_service.os.cpu_count", return_value=8):
+            result = service._batch_scan_for_references(blend_files, tmp_path / "tex.png")
+
+        assert sorted(calls) == ["0/4", "1/4", "2/4", "3/4"]
+        assert result == [blend_files[1], blend_files[2], blend_files[5]]
+
+    def test_single_file_uses_one_process(self, service, tmp_path):
+        """Test that a single file is not split across processes."""
+        blend_files = [tmp_path / "scene.blend"]
+        run_script, calls = _fake_batch_scan({str(blend_files[0])})
+
+        with patch.object(service.runner, "run_script", side_effect=run_script):
+            result = service._batch_scan_for_references(blend_files, tmp_path / "tex.png")
+
+        assert calls == ["0/1"]
+        assert result == blend_files
@@ -0,0 +1,139 @@
+"""Unit tests for JSON helpers and Blender output parsing."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from core import json_utils
+from services.blender_service import extract_json_from_output
+
+
+class TestLoads:
+    """Tests for json_utils.loads function."""
+
+    def test_loads_accepts_str(self):
+        """Test parsing a str document."""
+        assert json_utils.loads('{"name": "Cube"}') == {"name": "Cube"}
+
+    def test_loads_accepts_bytes(self):
+        """Test parsing a bytes document without decoding first."""
+        assert json_utils.loads(b'[1, 2, 3]') == [1, 2, 3]
+
+    def test_loads_raises_decode_error(self):
+        """Test that invalid JSON raises a JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads('{"name": ')
+
+
+class TestExtractJsonFromOutput:
+    """Tests for extract_json_from_output function."""
+
+    def test_extract_with_trailing_output(self):
+        """Test that Blender's trailing output is ignored."""
+        output = 'Read blend\nJSON_OUTPUT:{"success": true}\n\nBlender quit\n'
+
+        assert extract_json_from_output(output) == {"success": True}
+
+    def test_extract_with_braces_after_json(self):
+        """Test fallback when trailing output also contains braces."""
+        output = 'JSON_OUTPUT:{"success": true}\nWarning: {unused}\nBlender quit'
+
+        assert extract_json_from_output(output) == {"success": True}
+
+    def test_extract_without_marker_raises(self):
+        """Test that missing marker raises ValueError."""
+        with pytest.raises(ValueError):
+            extract_json_from_output("Blender quit")
+
+
+class TestWriteJsonAtomic:
+    """Tests for json_utils.write_json_atomic function."""
+
+    def test_write_creates_readable_file(self, tmp_path):
+        """Test that the written file contains the data."""
+        config_file = tmp_path / "config.json"
+
+        json_utils.write_json_atomic(config_file, {"theme": "dark"})
+
+        assert json.loads(config_file.read_text()) == {"theme": "dark"}
+
+    def test_write_replaces_existing_file(self, tmp_path):
+        """Test that an existing file is replaced and no temp file remains."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"theme": "light"}')
+
+        json_utils.write_json_atomic(config_file, {"theme": "dark"})
+
+        assert json.loads(config_file.read_text()) == {"theme": "dark"}
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+    def test_write_escapes_non_ascii(self, tmp_path):
+        """Test that non-ASCII text is escaped so any reader encoding works."""
+        config_file = tmp_path / "config.json"
+
+        json_utils.write_json_atomic(config_file, {"last_file": "C:/Users/José/shot.blend"})
+
+        raw = config_file.read_bytes()
+        assert raw.isascii()
+        assert json.loads(raw.decode('cp1252')) == {"last_file": "C:/Users/José/shot.blend"}
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+    def test_write_keeps_file_mode(self, tmp_path):
+        """Test that replacing a file keeps its permissions."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"theme": "light"}')
+        config_file.chmod(0o644)
+
+        json_utils.write_json_atomic(config_file, {"theme": "dark"})
+
+        assert stat.S_IMODE(config_file.stat().st_mode) == 0o644
+
+
+class TestLoadJsonCached:
+    """Tests for json_utils.load_json_cached function."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Test that repeated reads of an unchanged file reuse the parse."""
+        path = tmp_path / "config.json"
+        path.write_text('{"theme": "dark"}')
+
+        calls = []
+        real_loads = json_utils.loads
+        monkeypatch.setattr(json_utils, "loads", lambda data: calls.append(data) or real_loads(data))
+
+        first = json_utils.load_json_cached(path)
+        second = json_utils.load_json_cached(path)
+
+        assert first == {"theme": "dark"}
+        assert second is first
+        assert len(calls) == 1
+
+    def test_changed_file_is_reread(self, tmp_path):
+        """Test that a file changed by another writer is parsed again."""
+        import os
+
+        path = tmp_path / "config.json"
+        path.write_text('{"theme": "dark"}')
+        json_utils.load_json_cached(path)
+
+        path.write_text('{"theme": "light", "x": 1}')
+        os.utime(path, ns=(1, 1))
+
+        assert json_utils.load_json_cached(path) == {"theme": "light", "x": 1}
+
+    def test_atomic_write_invalidates_cache(self, tmp_path):
+        """Test that writing through write_json_atomic is seen by the next read."""
+        path = tmp_path / "config.json"
+        json_utils.write_json_atomic(path, {"a": 1})
+        assert json_utils.load_json_cached(path) == {"a": 1}
+
+        json_utils.write_json_atomic(path, {"a": 2})
+
+        assert json_utils.load_json_cached(path) == {"a": 2}
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            json_utils.load_json_cached(tmp_path / "missing.json")
@@ -386,6 +386,7 @@ class TestLinkObjectsTabFilter:
         mock_controller.project.is_open = True
 
         from gui.operations.link_objects_tab import LinkObjectsTab
+        from gui.operations.list_items import ItemPayload
 
         # Create tab instance with mocked setup
         with patch.object(LinkObjectsTab, 'setup_ui'):
@@ -398,14 +399,14 @@ class TestLinkObjectsTabFilter:
 
         # Add test items
         test_data = [
-            {"type": "object", "data": {"name": "Cube.001", "type": "MESH"}},
-            {"type": "object", "data": {"name": "Camera.Main", "type": "CAMERA"}},
-            {"type": "collection", "data": {"name": "Collection.Assets", "objects_count": 5}},
-            {"type": "object", "data": {"name": "Light.001", "type": "LIGHT"}},
+            ItemPayload("object", {"name": "Cube.001", "type": "MESH"}),
+            ItemPayload("object", {"name": "Camera.Main", "type": "CAMERA"}),
+            ItemPayload("collection", {"name": "Collection.Assets", "objects_count": 5}),
+            ItemPayload("object", {"name": "Light.001", "type": "LIGHT"}),
         ]
 
         for item_data in test_data:
-            item = QListWidgetItem(f"Test {item_data['data']['name']}")
+            item = QListWidgetItem(f"Test {item_data.data['name']}")
             item.setData(Qt.UserRole, item_data)
             tab.link_items_list.addItem(item)
 
@@ -429,6 +430,7 @@ class TestLinkObjectsTabFilter:
         mock_controller.project.is_open = True
 
         from gui.operations.link_objects_tab import LinkObjectsTab
+        from gui.operations.list_items import ItemPayload
 
         with patch.object(LinkObjectsTab, 'setup_ui'):
             tab = LinkObjectsTab(mock_controller)
@@ -439,13 +441,13 @@ class TestLinkObjectsTabFilter:
 
         # Add test items
         test_data = [
-            {"type": "object", "data": {"name": "Cube.001", "type": "MESH"}},
-            {"type": "object", "data": {"name": "Camera.Main", "type": "CAMERA"}},
-            {"type": "collection", "data": {"name": "Collection.Assets", "objects_count": 5}},
+            ItemPayload("object", {"name": "Cube.001", "type": "MESH"}),
+            ItemPayload("object", {"name": "Camera.Main", "type": "CAMERA"}),
+            ItemPayload("collection", {"name": "Collection.Assets", "objects_count": 5}),
         ]
 
         for item_data in test_data:
-            item = QListWidgetItem(f"Test {item_data['data']['name']}")
+            item = QListWidgetItem(f"Test {item_data.data['name']}")
             item.setData(Qt.UserRole, item_data)
             tab.link_items_list.addItem(item)
 
@@ -467,6 +469,7 @@ class TestLinkObjectsTabFilter:
         mock_controller.project.is_open = True
 
         from gui.operations.link_objects_tab import LinkObjectsTab
+        from gui.operations.list_items import ItemPayload
 
         with patch.object(LinkObjectsTab, 'setup_ui'):
             tab = LinkObjectsTab(mock_controller)
@@ -477,13 +480,13 @@ class TestLinkObjectsTabFilter:
 
         # Add test items with mixed case
         test_data = [
-            {"type": "object", "data": {"name": "MyCube", "type": "MESH"}},
-            {"type": "collection", "data": {"name": "MyCollection", "objects_count": 3}},
-            {"type": "object", "data": {"name": "Light", "type": "LIGHT"}},
+            ItemPayload("object", {"name": "MyCube", "type": "MESH"}),
+            ItemPayload("collection", {"name": "MyCollection", "objects_count": 3}),
+            ItemPayload("object", {"name": "Light", "type": "LIGHT"}),
         ]
 
         for item_data in test_data:
-            item = QListWidgetItem(f"Test {item_data['data']['name']}")
+            item = QListWidgetItem(f"Test {item_data.data['name']}")
             item.setData(Qt.UserRole, item_data)
             tab.link_items_list.addItem(item)
 
@@ -506,6 +509,7 @@ class TestLinkObjectsTabFilter:
         mock_controller.project.is_open = True
 
         from gui.operations.link_objects_tab import LinkObjectsTab
+        from gui.operations.list_items import ItemPayload
 
         with patch.object(LinkObjectsTab, 'setup_ui'):
             tab = LinkObjectsTab(mock_controller)
@@ -516,12 +520,12 @@ class TestLinkObjectsTabFilter:
 
         # Add item with proper data
         item1 = QListWidgetItem("Valid Item")
-        item1.setData(Qt.UserRole, {"type": "object", "data": {"name": "Cube", "type": "MESH"}})
+        item1.setData(Qt.UserRole, ItemPayload("object", {"name": "Cube", "type": "MESH"}))
         tab.link_items_list.addItem(item1)
 
         # Add item with invalid data (no name)
         item2 = QListWidgetItem("Invalid Item")
-        item2.setData(Qt.UserRole, {"type": "object", "data": {}})
+        item2.setData(Qt.UserRole, ItemPayload("object", {}))
         tab.link_items_list.addItem(item2)
 
         # Add item with no data
@@ -548,6 +552,7 @@ class TestLinkObjectsTabFilter:
         mock_controller.project.is_open = True
 
         from gui.operations.link_objects_tab import LinkObjectsTab
+        from gui.operations.list_items import ItemPayload
 
         with patch.object(LinkObjectsTab, 'setup_ui'):
             tab = LinkObjectsTab(mock_controller)
@@ -558,14 +563,14 @@ class TestLinkObjectsTabFilter:
 
         # Add test collections and objects
         test_data = [
-            {"type": "collection", "data": {"name": "Assets.Props", "objects_count": 10}},
-            {"type": "collection", "data": {"name": "Assets.Characters", "objects_count": 5}},
-            {"type": "object", "data": {"name": "Prop.Table", "type": "MESH"}},
-            {"type": "collection", "data": {"name": "Lighting", "objects_count": 3}},
+            ItemPayload("collection", {"name": "Assets.Props", "objects_count": 10}),
+            ItemPayload("collection", {"name": "Assets.Characters", "objects_count": 5}),
+            ItemPayload("object", {"name": "Prop.Table", "type": "MESH"}),
+            ItemPayload("collection", {"name": "Lighting", "objects_count": 3}),
         ]
 
         for item_data in test_data:
-            item = QListWidgetItem(f"Test {item_data['data']['name']}")
+            item = QListWidgetItem(f"Test {item_data.data['name']}")
             item.setData(Qt.UserRole, item_data)
             tab.link_items_list.addItem(item)
 
@@ -589,6 +594,7 @@ class TestLinkObjectsTabFilter:
         mock_controller.project.is_open = True
 
         from gui.operations.link_objects_tab import LinkObjectsTab
+        from gui.operations.list_items import ItemPayload
 
         with patch.object(LinkObjectsTab, 'setup_ui'):
             tab = LinkObjectsTab(mock_controller)
@@ -599,13 +605,13 @@ class TestLinkObjectsTabFilter:
 
         # Add test items
         test_data = [
-            {"type": "object", "data": {"name": "Cube.001", "type": "MESH"}},
-            {"type": "object", "data": {"name": "Cube.002", "type": "MESH"}},
-            {"type": "object", "data": {"name": "Sphere", "type": "MESH"}},
+            ItemPayload("object", {"name": "Cube.001", "type": "MESH"}),
+            ItemPayload("object", {"name": "Cube.002", "type": "MESH"}),
+            ItemPayload("object", {"name": "Sphere", "type": "MESH"}),
         ]
 
         for item_data in test_data:
-            item = QListWidgetItem(f"Test {item_data['data']['name']}")
+            item = QListWidgetItem(f"Test {item_data.data['name']}")
             item.setData(Qt.UserRole, item_data)
             tab.link_items_list.addItem(item)
 
@@ -617,3 +623,233 @@ class TestLinkObjectsTabFilter:
         assert not tab.link_items_list.item(0).isHidden(), "Cube.001 should be visible"
         assert not tab.link_items_list.item(1).isHidden(), "Cube.002 should be visible"
         assert tab.link_items_list.item(2).isHidden(), "Sphere should be hidden"
+
+
+class TestLinkObjectsTabStatePersistence:
+    """Tests for delayed link state saving in link_objects_tab.py."""
+
+    def _make_tab(self, config_file):
+        from unittest.mock import MagicMock
+        from gui.operations.link_objects_tab import LinkObjectsTab
+
+        mock_controller = MagicMock()
+        mock_controller.project.is_open = False
+        return LinkObjectsTab(mock_controller, config_file=config_file)
+
+    def test_save_is_delayed_until_flush(self, qapp, tmp_path):
+        """Test that state changes are written once, after the save delay."""
+        import json
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"theme": "dark"}))
+        tab = self._make_tab(config_file)
+        tab.flush_pending_state()
+
+        tab.link_as_hidden_checkbox.setChecked(True)
+
+        # Nothing written yet, the timer is still pending
+        assert json.loads(config_file.read_text())["link_operation"]["link_as_hidden"] is False
+        assert tab._save_timer.isActive()
+
+        tab.flush_pending_state()
+
+        config_data = json.loads(config_file.read_text())
+        assert config_data["link_operation"]["link_as_hidden"] is True
+        assert config_data["theme"] == "dark"
+
+    def test_flush_keeps_other_sections(self, qapp, tmp_path):
+        """Test that sections written by others while pending are preserved."""
+        import json
+
+        config_file = tmp_path / "config.json"
+        tab = self._make_tab(config_file)
+
+        tab.link_auto_load_checkbox.setChecked(True)
+        config_file.write_text(json.dumps({"last_project": "/projects/demo"}))
+        tab.flush_pending_state()
+
+        config_data = json.loads(config_file.read_text())
+        assert config_data["last_project"] == "/projects/demo"
+        assert config_data["link_operation"]["auto_load"] is True
+
+    def test_unchanged_state_is_not_rewritten(self, qapp, tmp_path, monkeypatch):
+        """Test that flushing an unchanged state skips the config write."""
+        import json
+        from gui.operations import link_objects_tab
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"theme": "dark"}))
+        tab = self._make_tab(config_file)
+        tab.link_as_hidden_checkbox.setChecked(True)
+        tab.flush_pending_state()
+
+        writes = []
+        monkeypatch.setattr(link_objects_tab, "write_json_atomic",
+                            lambda path, obj: writes.append(obj))
+
+        # Toggle back and forth so the pending state matches the saved one
+        tab.link_as_hidden_checkbox.setChecked(False)
+        tab.link_as_hidden_checkbox.setChecked(True)
+        tab.flush_pending_state()
+
+        assert writes == []
+
+    def test_restore_defers_existing_locked_file(self, qapp, tmp_path):
+        """Test that an existing locked file is queued until the project opens."""
+        import json
+        from pathlib import Path
+
+        locked = tmp_path / "shot.blend"
+        locked.write_bytes(b"")
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"link_operation": {
+            "scene_lock_enabled": True, "locked_file": str(locked), "locked_scene": "Main"
+        }}))
+
+        tab = self._make_tab(config_file)
+
+        assert tab.pending_locked_file_restore == {"locked_file": Path(locked), "locked_scene": "Main"}
+
+    def test_restore_skips_missing_locked_file(self, qapp, tmp_path):
+        """Test that a locked file that no longer exists disables the lock."""
+        import json
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"link_operation": {
+            "scene_lock_enabled": True, "locked_file": str(tmp_path / "gone.blend")
+        }}))
+
+        tab = self._make_tab(config_file)
+
+        assert tab.pending_locked_file_restore is None
+        assert not tab.link_scene_lock.isChecked()
+
+    def test_locked_file_scenes_load_in_background(self, qapp, qtbot, tmp_path):
+        """Test that an open project restores the locked scene off the GUI thread."""
+        import json
+        from unittest.mock import MagicMock
+        from gui.operations.link_objects_tab import LinkObjectsTab
+
+        locked = tmp_path / "shot.blend"
+        locked.write_bytes(b"")
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"link_operation": {
+            "scene_lock_enabled": True, "locked_file": str(locked), "locked_scene": "Alt"
+        }}))
+
+        mock_controller = MagicMock()
+        mock_controller.project.is_open = True
+        mock_controller.project.blender_service.get_scenes.return_value = [
+            {"name": "Main"}, {"name": "Alt"}
+        ]
+
+        tab = LinkObjectsTab(mock_controller, config_file=config_file)
+
+        qtbot.waitUntil(lambda: tab.link_scene_combo.currentText() == "Alt", timeout=2000)
+
+        assert tab.link_scene_lock.isChecked()
+        assert tab.pending_locked_file_restore is None
+        mock_controller.project.blender_service.get_scenes.assert_called_once_with(locked)
+
+    def test_lock_is_saved_while_locked_scenes_load(self, qapp, qtbot, tmp_path):
+        """Test that saves during a slow locked scene load keep the lock."""
+        import json
+        import threading
+        from unittest.mock import MagicMock
+        from gui.operations.link_objects_tab import LinkObjectsTab
+
+        locked = tmp_path / "shot.blend"
+        locked.write_bytes(b"")
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"link_operation": {
+            "scene_lock_enabled": True, "locked_file": str(locked), "locked_scene": "Alt",
+            "per_file_scenes": {str(locked): "Alt"}, "add_link_suffix": True
+        }}))
+
+        release = threading.Event()
+
+        def slow_get_scenes(path):
+            release.wait(5)
+            return [{"name": "Main"}, {"name": "Alt"}]
+
+        mock_controller = MagicMock()
+        mock_controller.project.is_open = True
+        mock_controller.project.blender_service.get_scenes.side_effect = slow_get_scenes
+
+        tab = LinkObjectsTab(mock_controller, config_file=config_file)
+        try:
+            # Restoring the other checkboxes saved the state before the scenes arrived
+            tab.flush_pending_state()
+            link_state = json.loads(config_file.read_text())["link_operation"]
+            assert link_state["scene_lock_enabled"] is True
+            assert link_state["locked_file"] == str(locked)
+            assert link_state["locked_scene"] == "Alt"
+            assert link_state["per_file_scenes"] == {str(locked): "Alt"}
+            assert tab.link_scene_lock.isChecked()
+        finally:
+            release.set()
+
+        qtbot.waitUntil(lambda: tab.link_scene_combo.currentText() == "Alt", timeout=2000)
+
+    def test_failed_locked_scene_load_restores_combo_state(self, qapp, qtbot, tmp_path):
+        """Test that a failed scene load does not leave the scene combo disabled."""
+        from unittest.mock import MagicMock
+        from gui.operations.link_objects_tab import LinkObjectsTab
+
+        locked = tmp_path / "shot.blend"
+        locked.write_bytes(b"")
+        other = tmp_path / "other.blend"
+
+        mock_controller = MagicMock()
+        mock_controller.project.is_open = False
+        tab = LinkObjectsTab(mock_controller, config_file=tmp_path / "config.json")
+
+        mock_controller.project.blender_service.get_scenes.side_effect = RuntimeError("boom")
+        tab._apply_locked_file_restoration(locked, "Main")
+        assert not tab.link_scene_combo.isEnabled()
+
+        # The user unlocks and loads scenes of another file before the load fails
+        tab.link_scene_lock.setChecked(False)
+        tab.link_locked_file = other
+        tab.link_scenes = [{"name": "Main"}]
+        tab.link_scene_combo.addItem("Main")
+
+        qtbot.waitUntil(lambda: mock_controller.project.blender_service.get_scenes.called, timeout=2000)
+        qtbot.waitUntil(lambda: tab.link_scene_combo.isEnabled(), timeout=2000)
+        assert tab.link_scenes == [{"name": "Main"}]
+
+    def test_source_loaded_for_previous_file_is_ignored(self, qapp, qtbot, tmp_path, monkeypatch):
+        """Test that items arriving after the source file changed are dropped."""
+        import threading
+        from unittest.mock import MagicMock
+        from gui.operations.link_objects_tab import LinkObjectsTab
+
+        old_source = tmp_path / "old.blend"
+        old_source.write_bytes(b"")
+        new_source = tmp_path / "new.blend"
+        new_source.write_bytes(b"")
+
+        release = threading.Event()
+
+        def slow_list_objects(runner, script_path, script_args):
+            release.wait(2)
+            return {"objects": [{"name": "Cube", "type": "MESH"}], "collections": []}
+
+        mock_controller = MagicMock()
+        mock_controller.project.is_open = False
+        tab = LinkObjectsTab(mock_controller, config_file=tmp_path / "config.json")
+        monkeypatch.setattr(tab, "get_blender_runner", lambda: None)
+        monkeypatch.setattr(LinkObjectsTab, "_run_list_objects_script", staticmethod(slow_list_objects))
+
+        tab.link_source_file = old_source
+        tab._load_link_source()
+
+        # The user selects another source file while the old one loads
+        tab.link_source_file = new_source
+        release.set()
+        qtbot.waitUntil(lambda: not tab._active_tasks, timeout=2000)
+
+        assert tab.link_items_list.count() == 0
+        assert tab.link_source_data != {"objects": [{"name": "Cube", "type": "MESH"}], "collections": []}
+        assert not tab.link_preview_btn.isEnabled()
+        assert not tab.link_execute_btn.isEnabled()
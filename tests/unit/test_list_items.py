@@ -0,0 +1,75 @@
+"""Unit tests for the Qt-free list item helpers."""
+
+from gui.operations.list_items import ItemPayload, build_item_rows, is_hidden_by_filter, payload_name
+
+
+SAMPLE_DATA = {
+    "objects": [{"name": "Cube", "type": "MESH"}],
+    "collections": [{"name": "Props", "objects_count": 3}],
+    "materials": [{"name": "Wood", "use_nodes": True, "users": 2}],
+}
+
+
+class TestBuildItemRows:
+    """Tests for build_item_rows function."""
+
+    def test_all_filter_lists_every_kind(self):
+        """Test that the All filter lists objects, collections and materials."""
+        rows = build_item_rows(SAMPLE_DATA, "All")
+
+        assert [row[1].kind for row in rows] == ["object", "collection", "material"]
+        assert rows[0][0] == "🔷 Cube (MESH)"
+        assert rows[1][0] == "📁 Props (3 objects)"
+        assert rows[2][0] == "🎨 Wood (nodes, 2 users)"
+
+    def test_type_filter_limits_kinds(self):
+        """Test that a type filter only lists matching items."""
+        rows = build_item_rows(SAMPLE_DATA, "Collections")
+
+        assert len(rows) == 1
+        assert rows[0][1] == ItemPayload("collection", SAMPLE_DATA["collections"][0])
+
+    def test_materials_can_be_excluded(self):
+        """Test that materials are skipped when not supported by the tab."""
+        rows = build_item_rows(SAMPLE_DATA, "All", include_materials=False)
+
+        assert all(row[1].kind != "material" for row in rows)
+
+    def test_invalid_entries_are_skipped(self):
+        """Test that non-list sections and non-dict entries are ignored."""
+        rows = build_item_rows({"objects": "bad", "collections": [None, {"name": "A"}]}, "All")
+
+        assert len(rows) == 1
+        assert rows[0][1].data == {"name": "A"}
+
+
+class TestNameFilter:
+    """Tests for payload_name and is_hidden_by_filter functions."""
+
+    def test_payload_name(self):
+        """Test extracting the name from a payload."""
+        assert payload_name(ItemPayload("object", {"name": "Cube"})) == "Cube"
+        assert payload_name(None) is None
+
+    def test_payload_survives_item_round_trip(self, qapp):
+        """Test that a payload stored on a list item comes back as the same object."""
+        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QListWidgetItem
+
+        payload = ItemPayload("object", {"name": "Cube"})
+        item = QListWidgetItem("Cube")
+        item.setData(Qt.UserRole, payload)
+
+        assert item.data(Qt.UserRole) is payload
+
+    def test_filter_is_case_insensitive_substring(self):
+        """Test that the filter matches lowercased substrings."""
+        payload = ItemPayload("object", {"name": "Chair_Wood"})
+
+        assert is_hidden_by_filter(payload, "wood") is False
+        assert is_hidden_by_filter(payload, "metal") is True
+
+    def test_empty_filter_shows_everything(self):
+        """Test that an empty filter never hides items, even without data."""
+        assert is_hidden_by_filter(None, "") is False
+        assert is_hidden_by_filter(None, "cube") is True
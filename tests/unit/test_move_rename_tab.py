@@ -0,0 +1,98 @@
+"""Unit tests for the move/rename tab."""
+
+
+class TestMoveRenameSamePath:
+    """Tests for the move/rename tab path comparison."""
+
+    def test_same_path_ignores_trailing_separator(self):
+        """Test that equivalent spellings of a path compare equal."""
+        from gui.operations.move_rename_tab import MoveRenameTab
+
+        assert MoveRenameTab._is_same_path("/project/textures/", "/project/textures")
+        assert MoveRenameTab._is_same_path("/project/./scenes/a.blend", "/project/scenes/a.blend")
+
+    def test_different_paths(self):
+        """Test that a renamed file is detected as a change."""
+        from gui.operations.move_rename_tab import MoveRenameTab
+
+        assert not MoveRenameTab._is_same_path("/project/wood.png", "/project/oak.png")
+
+
+class TestMoveRenameTextureResults:
+    """Tests for texture rename results that arrive after the selection changed."""
+
+    def _make_tab(self, monkeypatch, messages):
+        from unittest.mock import MagicMock
+        from gui.operations.move_rename_tab import MoveRenameTab
+
+        tab = MoveRenameTab(MagicMock())
+        monkeypatch.setattr(tab, "show_info", lambda title, message: messages.append(message))
+        return tab
+
+    def test_preview_names_the_file_it_ran_for(self, qapp, tmp_path, monkeypatch):
+        """Test that the preview message uses the file selected at dispatch."""
+        messages = []
+        tab = self._make_tab(monkeypatch, messages)
+        old_path = tmp_path / "wood.png"
+        tab.set_file(tmp_path / "stone.png")
+
+        tab._show_texture_preview_results({"updated_files_count": 0}, old_path, tmp_path / "oak.png")
+
+        assert "wood.png → oak.png" in messages[0]
+        assert "stone.png" not in messages[0]
+
+    def test_execute_keeps_newer_selection(self, qapp, tmp_path, monkeypatch):
+        """Test that a finished rename does not clear a file selected meanwhile."""
+        messages = []
+        tab = self._make_tab(monkeypatch, messages)
+        old_path = tmp_path / "wood.png"
+        new_selection = tmp_path / "stone.png"
+        tab.set_file(new_selection)
+
+        tab._show_texture_execute_results({"file_moved": True}, old_path, tmp_path / "oak.png")
+
+        assert messages
+        assert tab.current_file == new_selection
+        assert tab.new_path_input.text() == str(new_selection)
+
+    def test_execute_clears_its_own_selection(self, qapp, tmp_path, monkeypatch):
+        """Test that a finished rename clears the file it ran for."""
+        messages = []
+        tab = self._make_tab(monkeypatch, messages)
+        old_path = tmp_path / "wood.png"
+        tab.set_file(old_path)
+
+        tab._show_texture_execute_results({"file_moved": True}, old_path, tmp_path / "oak.png")
+
+        assert tab.current_file is None
+
+
+class TestMoveRenameBusyState:
+    """Tests for the move/rename buttons while a texture task is running."""
+
+    def test_set_file_keeps_buttons_disabled_while_busy(self, qapp, qtbot, tmp_path):
+        """Test that selecting a file during a running task does not allow a second one."""
+        import threading
+        from unittest.mock import MagicMock
+        from gui.operations.move_rename_tab import MoveRenameTab
+
+        tab = MoveRenameTab(MagicMock())
+        tab.set_file(tmp_path / "wood.png")
+        release = threading.Event()
+        done = []
+
+        tab.run_in_background(lambda: release.wait(5), done.append, done.append,
+                              tab.execute_btn, "Executing...",
+                              extra_widgets=(tab.preview_btn, tab.browse_btn))
+        tab.set_file(tmp_path / "stone.png")
+
+        assert not tab.execute_btn.isEnabled()
+        assert not tab.preview_btn.isEnabled()
+        assert not tab.browse_btn.isEnabled()
+
+        release.set()
+        qtbot.waitUntil(lambda: len(done) > 0, timeout=2000)
+
+        assert tab.execute_btn.isEnabled()
+        assert tab.preview_btn.isEnabled()
+        assert tab.browse_btn.isEnabled()
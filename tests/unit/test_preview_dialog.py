@@ -0,0 +1,42 @@
+"""Unit tests for the operation preview dialog."""
+
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+
+from blender_lib.models import OperationPreview, PathChange
+from gui.preview_dialog import OperationPreviewDialog
+
+
+def _make_preview(statuses):
+    changes = [
+        PathChange(Path(f"/project/file{i}.blend"), "image", f"img{i}", f"//old{i}.png", f"//new{i}.png", status)
+        for i, status in enumerate(statuses)
+    ]
+    return OperationPreview(operation_name="Move", changes=changes)
+
+
+class TestOperationPreviewDialog:
+    """Tests for the changes table of OperationPreviewDialog."""
+
+    def test_rows_show_change_fields(self, qapp):
+        """Test that each change fills one row with its five fields."""
+        dialog = OperationPreviewDialog(_make_preview(['ok', 'ok']))
+        model = dialog.table.model()
+
+        assert model.rowCount() == 2
+        assert [model.index(1, col).data() for col in range(5)] == [
+            "file1.blend", "image", "img1", "//old1.png", "//new1.png"
+        ]
+
+    def test_rows_are_colored_by_status(self, qapp):
+        """Test that warning and error rows get their status colors."""
+        dialog = OperationPreviewDialog(_make_preview(['ok', 'warning', 'error']))
+        model = dialog.table.model()
+        brushes = OperationPreviewDialog._STATUS_BRUSHES
+
+        for row, status in enumerate(['ok', 'warning', 'error']):
+            background = model.index(row, 4).data(Qt.BackgroundRole)
+            foreground = model.index(row, 0).data(Qt.ForegroundRole)
+            assert background.color() == brushes[status][0].color()
+            assert foreground.color() == brushes[status][1].color()
@@ -376,3 +376,101 @@ class TestRenameObjectsTabFilter:
         # Verify: All items should be shown (not hidden)
         tab.items[0].setHidden.assert_called_with(False)
         tab.items[1].setHidden.assert_called_with(False)
+
+
+class TestRenameObjectsTabSelection:
+    """Tests for selection handling in rename_objects_tab.py."""
+
+    def _make_tab(self, names):
+        from PySide6.QtWidgets import QListWidgetItem
+        from PySide6.QtCore import Qt
+        from gui.operations.list_items import ItemPayload
+        from gui.operations.rename_objects_tab import RenameObjectsTab
+
+        tab = RenameObjectsTab(MagicMock())
+        for name in names:
+            item = QListWidgetItem(name)
+            item.setData(Qt.UserRole, ItemPayload("object", {"name": name}))
+            tab.obj_list.addItem(item)
+        return tab
+
+    def test_selection_caches_names(self, qapp):
+        """Test that selected names are cached for the rename operation."""
+        tab = self._make_tab(["Cube", "Sphere", "Cone"])
+
+        tab.obj_list.item(0).setSelected(True)
+        tab.obj_list.item(2).setSelected(True)
+
+        assert sorted(tab._selected_names) == ["Cone", "Cube"]
+
+    def test_single_selection_fills_find_input(self, qapp):
+        """Test that a single selection puts the exact name in Find."""
+        tab = self._make_tab(["Cube", "Sphere"])
+
+        tab.obj_list.item(1).setSelected(True)
+
+        assert tab.obj_find_input.text() == "Sphere"
+
+    def test_multi_selection_fills_common_prefix(self, qapp):
+        """Test that multiple selections prefill their common prefix."""
+        tab = self._make_tab(["Chair_Wood", "Chair_Metal", "Table"])
+
+        tab.obj_list.item(0).setSelected(True)
+        tab.obj_list.item(1).setSelected(True)
+
+        assert tab.obj_find_input.text() == "Chair_"
+
+    def test_multi_selection_without_prefix_uses_first_name(self, qapp):
+        """Test fallback to a selected name when there is no common prefix."""
+        tab = self._make_tab(["Chair", "Table"])
+
+        tab.obj_list.item(0).setSelected(True)
+        tab.obj_list.item(1).setSelected(True)
+
+        assert tab.obj_find_input.text() in ("Chair", "Table")
+
+    def test_clearing_selection_clears_cache(self, qapp):
+        """Test that deselecting everything empties the cached names."""
+        tab = self._make_tab(["Cube"])
+
+        tab.obj_list.item(0).setSelected(True)
+        tab.obj_list.clearSelection()
+
+        assert tab._selected_names == []
+        assert tab.obj_find_input.text() == ""
+
+    def test_selection_without_valid_names_warns_no_valid_items(self, qapp, tmp_path):
+        """Test that selecting only rows without names reports no valid items."""
+        from PySide6.QtWidgets import QListWidgetItem
+        from gui.ui_strings import TITLE_NO_ITEMS, MSG_NO_VALID_ITEMS
+
+        tab = self._make_tab([])
+        tab.obj_list.addItem(QListWidgetItem("(no objects)"))
+        tab.current_file = tmp_path / "scene.blend"
+        tab.show_warning = MagicMock()
+
+        tab.obj_list.item(0).setSelected(True)
+        tab._rename_objects_internal(dry_run=True)
+
+        tab.show_warning.assert_called_once_with(TITLE_NO_ITEMS, MSG_NO_VALID_ITEMS)
+
+
+class TestRenameObjectsTabStatePersistence:
+    """Tests for saving rename objects tab state to the config file."""
+
+    def test_save_refreshes_cached_config(self, qapp, tmp_path):
+        """Test that readers of the cached config see the saved state."""
+        import json
+        from core.json_utils import load_json_cached
+        from gui.operations.rename_objects_tab import RenameObjectsTab
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"theme": "dark", "rename_objects": {"auto_load": False}}))
+        tab = RenameObjectsTab(MagicMock(), config_file=config_file)
+        assert load_json_cached(config_file)["rename_objects"] == {"auto_load": False}
+
+        # The write must drop the cached parse, mtime alone may not change
+        tab.obj_auto_load_checkbox.setChecked(True)
+        tab._save_state()
+
+        assert load_json_cached(config_file) == {"theme": "dark", "rename_objects": {"auto_load": True}}
@@ -19,8 +19,8 @@ class TestOutputJson:
 
         captured = capsys.readouterr()
         assert JSON_OUTPUT_MARKER in captured.out
-        assert '"key": "value"' in captured.out
-        assert '"number": 42' in captured.out
+        assert '"key":"value"' in captured.out
+        assert '"number":42' in captured.out
 
     def test_output_json_formats_as_json(self, capsys):
         """Test that output is valid JSON."""
@@ -61,6 +61,41 @@ class TestOutputJson:
         assert "deep" in captured.out
 
 
+class TestOutputJsonFile:
+    """Tests for output_json_file function."""
+
+    def test_output_json_file_writes_parsable_json(self, tmp_path):
+        """Test that the written file round-trips through json.loads."""
+        from blender_lib.script_utils import output_json_file
+
+        data = {"success": True, "objects": [{"name": "Cube"}]}
+        output_path = tmp_path / "result.json"
+
+        output_json_file(data, str(output_path))
+
+        assert json.loads(output_path.read_text()) == data
+
+    def test_output_json_file_does_not_print(self, tmp_path, capsys):
+        """Test that nothing is written to stdout."""
+        from blender_lib.script_utils import output_json_file
+
+        output_json_file({"key": "value"}, str(tmp_path / "result.json"))
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+
+    def test_read_json_result_falls_back_to_stdout(self, tmp_path):
+        """Test that an empty result file falls back to the stdout marker."""
+        from services.blender_service import read_json_result
+
+        output_path = tmp_path / "result.json"
+        output_path.touch()
+
+        data = read_json_result(output_path, 'JSON_OUTPUT:{"error": "boom"}\nBlender quit')
+
+        assert data == {"error": "boom"}
+
+
 class TestCreateErrorResult:
     """Tests for create_error_result function."""
 
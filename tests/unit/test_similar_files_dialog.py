@@ -0,0 +1,78 @@
+"""Unit tests for the similar files selection dialog."""
+
+from pathlib import Path
+
+from gui.similar_files_dialog import SimilarFilesDialog
+
+
+PROJECT_ROOT = Path("/project")
+
+SIMILAR_FILES = [
+    {
+        "missing_path": "//textures/wood.png",
+        "missing_filename": "wood.png",
+        "similar_matches": [
+            {"path": "/project/textures/wood_01.png", "similarity": 90},
+            {"path": "/elsewhere/wood.jpg", "similarity": 70},
+        ],
+    },
+    {
+        "missing_path": "//textures/metal.png",
+        "missing_filename": "metal.png",
+        "similar_matches": [
+            {"path": "/project/textures/metal_old.png", "similarity": 65},
+        ],
+    },
+]
+
+
+class TestSimilarFilesDialog:
+    """Tests for SimilarFilesDialog."""
+
+    def test_best_matches_selected_by_default(self, qapp):
+        """Test that every row starts with its best match selected."""
+        dialog = SimilarFilesDialog(SIMILAR_FILES, PROJECT_ROOT)
+
+        assert dialog.get_selected_matches() == {
+            "//textures/wood.png": "/project/textures/wood_01.png",
+            "//textures/metal.png": "/project/textures/metal_old.png",
+        }
+
+    def test_match_labels_use_project_relative_paths(self, qapp):
+        """Test that matches inside the project show their relative path."""
+        dialog = SimilarFilesDialog(SIMILAR_FILES, PROJECT_ROOT)
+        combo = dialog.table.cellWidget(0, 3)
+
+        assert dialog.table.item(0, 2).text() == str(Path("textures/wood_01.png"))
+        assert combo.itemText(1) == f"wood_01.png (90%) - {Path('textures/wood_01.png')}"
+        assert combo.itemText(2) == "wood.jpg (70%)"
+
+    def test_relative_path_ignores_case_where_filesystem_does(self, qapp, monkeypatch):
+        """Test that a case mismatch with the root still gives a relative path."""
+        import os
+
+        # Emulate Windows, where normcase folds case
+        monkeypatch.setattr(os.path, "normcase", str.lower)
+        dialog = SimilarFilesDialog(SIMILAR_FILES, Path("/Project"))
+
+        path = os.path.join(str(Path("/project")), "Textures", "wood_01.png")
+        assert dialog._relative_path(path) == os.path.join("Textures", "wood_01.png")
+        assert dialog._relative_path("/elsewhere/wood.jpg") is None
+
+    def test_skip_all_and_select_all_best(self, qapp):
+        """Test the bulk selection buttons."""
+        dialog = SimilarFilesDialog(SIMILAR_FILES, PROJECT_ROOT)
+
+        dialog._skip_all()
+        assert dialog.get_selected_matches() == {}
+
+        dialog._select_all_best()
+        assert len(dialog.get_selected_matches()) == 2
+
+    def test_combo_change_updates_selection(self, qapp):
+        """Test that picking another candidate updates the selection."""
+        dialog = SimilarFilesDialog(SIMILAR_FILES, PROJECT_ROOT)
+
+        dialog.table.cellWidget(0, 3).setCurrentIndex(2)
+
+        assert dialog.get_selected_matches()["//textures/wood.png"] == "/elsewhere/wood.jpg"
@@ -0,0 +1,204 @@
+"""Unit tests for theme stylesheet caching."""
+
+from types import MappingProxyType
+
+import pytest
+
+from gui.theme import Theme
+
+
+@pytest.fixture
+def restore_theme():
+    """Restore the global theme after the test."""
+    original = Theme.current_theme
+    yield
+    Theme.set_theme(original)
+
+
+class TestStylesheetCache:
+    """Tests for the cached stylesheet getters."""
+
+    def test_repeated_calls_return_cached_string(self, restore_theme):
+        """Test that a stylesheet is composed once per theme."""
+        Theme.set_theme('light')
+
+        assert Theme.get_stylesheet() is Theme.get_stylesheet()
+        assert Theme.get_file_display_style() is Theme.get_file_display_style()
+
+    def test_styles_follow_theme_switch(self, restore_theme):
+        """Test that switching themes returns the other palette's stylesheet."""
+        Theme.set_theme('light')
+        light = Theme.get_project_bar_style()
+
+        Theme.toggle_theme()
+        dark = Theme.get_project_bar_style()
+
+        assert Theme._hex(Theme.COLORS_LIGHT['bg_secondary']) in light
+        assert Theme._hex(Theme.COLORS_DARK['bg_secondary']) in dark
+        assert light != dark
+
+    def test_both_themes_built_at_import(self):
+        """Test that both themes' stylesheets are built at import."""
+        for theme in ('light', 'dark'):
+            assert set(Theme._styles[theme]) == {'main', 'project_bar', 'file_display'}
+
+    def test_invalidate_cache_rebuilds_from_palette(self, restore_theme, monkeypatch):
+        """Test that invalidating picks up a changed palette."""
+        Theme.set_theme('light')
+        palette = dict(Theme.COLORS_LIGHT, bg_secondary=0x123456)
+        monkeypatch.setattr(Theme, 'COLORS_LIGHT', MappingProxyType(palette))
+
+        Theme.invalidate_cache()
+        assert '#123456' in Theme.get_file_display_style()
+        assert Theme.get_c().bg_secondary == '#123456'
+
+        monkeypatch.undo()
+        Theme.invalidate_cache()
+
+
+class TestPalettes:
+    """Test the read-only palettes and their attribute views."""
+
+    def test_palettes_are_read_only(self):
+        """Test that palette entries cannot be assigned."""
+        with pytest.raises(TypeError):
+            Theme.COLORS_LIGHT['bg_main'] = 0x000000
+
+    def test_palette_schema_mismatch_raises(self, monkeypatch):
+        """Test that a palette missing a color fails the build."""
+        palette = dict(Theme.COLORS_DARK)
+        del palette['row_error']
+        monkeypatch.setattr(Theme, 'COLORS_DARK', MappingProxyType(palette))
+
+        with pytest.raises(ValueError, match="row_error"):
+            Theme._build_styles()
+
+    def test_hover_shades_are_derived(self):
+        """Test that hover colors are derived from their base colors."""
+        light = Theme._packed['light']
+        dark = Theme._packed['dark']
+
+        assert 'success_hover' not in Theme.COLORS_LIGHT
+        assert light['success_hover'] == Theme._shade(light['success'], Theme.HOVER_SHADE['light'])
+        assert Theme._palettes['light']['success_hover'] == Theme._hex(light['success_hover'])
+        assert sum(light['accent_hover'].to_bytes(3, 'big')) < sum(light['accent'].to_bytes(3, 'big'))
+        assert sum(dark['accent_hover'].to_bytes(3, 'big')) > sum(dark['accent'].to_bytes(3, 'big'))
+
+    def test_shade_clamps_lightness(self):
+        """Test that shading past the ends stays black or white."""
+        assert Theme._shade(0x808080, 1.0) == 0xffffff
+        assert Theme._shade(0x808080, -1.0) == 0x000000
+        assert Theme._shade(0x3498db, 0.0) == 0x3498db
+
+    def test_get_c_follows_theme(self, restore_theme):
+        """Test that the attribute view matches the current palette."""
+        for theme in ('light', 'dark'):
+            Theme.set_theme(theme)
+            assert vars(Theme.get_c()) == dict(Theme.get_colors())
+
+
+class TestStylesheetLayers:
+    """Test the split between the static base and the color overlay."""
+
+    def test_static_part_contains_no_palette_colors(self):
+        """Test that the static base is free of palette colors."""
+        static = Theme._build_static_stylesheet()
+        for palette in Theme._palettes.values():
+            for color in palette.values():
+                assert color not in static
+
+    def test_main_stylesheet_is_static_plus_overlay(self):
+        """Test that each theme's main sheet is the shared base plus its overlay."""
+        static = Theme._build_static_stylesheet()
+        for theme, palette in Theme._palettes.items():
+            main = Theme._styles[theme]['main']
+            assert main == static + Theme._build_color_overlay(palette)
+
+
+class TestWidgetRestyle:
+    """Test theme switches for widgets styled through Theme.apply."""
+
+    def test_visible_widget_restyled_immediately(self, qtbot, restore_theme):
+        """Test that a visible widget gets the new theme at once."""
+        from PySide6.QtWidgets import QLabel
+
+        Theme.set_theme('light')
+        label = QLabel()
+        qtbot.addWidget(label)
+        Theme.apply(label, 'file_display')
+        label.show()
+
+        Theme.set_theme('dark')
+        Theme.restyle_widgets()
+
+        assert label.styleSheet() == Theme.get_file_display_style()
+
+    def test_hidden_widget_restyled_on_show(self, qtbot, restore_theme):
+        """Test that a hidden widget keeps its style until shown."""
+        from PySide6.QtWidgets import QLabel
+
+        Theme.set_theme('light')
+        label = QLabel()
+        qtbot.addWidget(label)
+        Theme.apply(label, 'file_display')
+        light_style = label.styleSheet()
+
+        Theme.set_theme('dark')
+        Theme.restyle_widgets()
+        assert label.styleSheet() == light_style
+        assert label in Theme._pending
+
+        label.show()
+
+        assert label.styleSheet() == Theme.get_file_display_style()
+        assert label not in Theme._pending
+
+
+class TestQPalette:
+    """Test the palette that carries the base theme colors."""
+
+    def test_palette_matches_theme_colors(self, qapp, restore_theme):
+        """Test that palette roles take the current theme's colors."""
+        from PySide6.QtGui import QPalette
+
+        for theme in ('light', 'dark'):
+            Theme.set_theme(theme)
+            palette = Theme.build_palette()
+            colors = Theme.get_colors()
+
+            assert palette.color(QPalette.ColorRole.Window).name() == colors['bg_main']
+            assert palette.color(QPalette.ColorRole.Highlight).name() == colors['accent']
+
+    def test_palette_cached_per_theme(self, qapp, restore_theme):
+        """Test that the palette is built once per theme."""
+        Theme.set_theme('dark')
+        assert Theme.build_palette() is Theme.build_palette()
+
+    def test_reapply_replaces_stylesheet(self, qtbot, restore_theme):
+        """Test that reapply leaves only the current theme's stylesheet."""
+        from PySide6.QtWidgets import QWidget
+
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        widget.setStyleSheet("QWidget { color: red; }")
+
+        Theme.set_theme('dark')
+        Theme.reapply(widget)
+
+        assert widget.styleSheet() == Theme.get_stylesheet()
+
+
+class TestThemeSelection:
+    """Test switching between themes."""
+
+    def test_set_theme_ignores_unknown_names(self, restore_theme):
+        """Test that an unknown theme name leaves the theme unchanged."""
+        Theme.set_theme('dark')
+        Theme.set_theme('sepia')
+        assert Theme.current_theme == 'dark'
+
+    def test_toggle_theme_alternates(self, restore_theme):
+        """Test that toggling switches back and forth."""
+        Theme.set_theme('light')
+        assert Theme.toggle_theme() == 'dark'
+        assert Theme.toggle_theme() == 'light'
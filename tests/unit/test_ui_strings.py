@@ -0,0 +1,64 @@
+"""Tests for the UI strings module."""
+
+import pytest
+
+from gui import ui_strings
+from gui.ui_strings import S
+
+
+class TestStringsNamespace:
+    """Test the read-only strings namespace."""
+
+    def test_namespace_mirrors_module_constants(self):
+        """Test that every string constant is reachable through S."""
+        assert S.TITLE_ERROR == ui_strings.TITLE_ERROR
+        assert S.TMPL_LOADING_BLEND == ui_strings.TMPL_LOADING_BLEND
+        for name, value in vars(S).items():
+            assert getattr(ui_strings, name) == value
+
+    def test_namespace_is_read_only(self):
+        """Test that assigning or deleting attributes raises."""
+        with pytest.raises(AttributeError):
+            S.TITLE_ERROR = "Changed"
+        with pytest.raises(AttributeError):
+            del S.TITLE_ERROR
+        assert S.TITLE_ERROR == "Error"
+
+
+class TestTemplates:
+    """Test the pre-parsed message templates."""
+
+    def test_call_matches_format(self):
+        """Test that calling a template gives the same text as str.format."""
+        from gui.ui_strings import TMPL_CONFIRM_DELETE_BACKUPS, TMPL_LOADING_BLEND
+
+        assert TMPL_LOADING_BLEND(filename="a.blend") == str.format(TMPL_LOADING_BLEND, filename="a.blend")
+        fields = {"count": 3, "blend1_count": 2, "blend2_count": 1, "size_mb": 1.5}
+        assert TMPL_CONFIRM_DELETE_BACKUPS(**fields) == str.format(TMPL_CONFIRM_DELETE_BACKUPS, **fields)
+        assert "1.50 MB" in TMPL_CONFIRM_DELETE_BACKUPS(**fields)
+
+    def test_templates_are_still_strings(self):
+        """Test that templates without fields can be used as plain text."""
+        from gui.ui_strings import TMPL_REFS_COMPLETE
+
+        assert isinstance(TMPL_REFS_COMPLETE, str)
+        assert TMPL_REFS_COMPLETE() == TMPL_REFS_COMPLETE == "Complete!"
+        assert S.TMPL_REFS_COMPLETE is TMPL_REFS_COMPLETE
+
+    def test_missing_field_raises(self):
+        """Test that a missing field raises like str.format does."""
+        from gui.ui_strings import TMPL_LOADING_BLEND
+
+        with pytest.raises(KeyError):
+            TMPL_LOADING_BLEND()
+
+
+class TestInterning:
+    """Test that short UI strings are interned."""
+
+    def test_short_strings_are_interned(self):
+        """Test that short constants share the interned copy."""
+        import sys
+
+        assert ui_strings.TITLE_ERROR is sys.intern("Error")
+        assert S.TITLE_SUCCESS is sys.intern("Success")
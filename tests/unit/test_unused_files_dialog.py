@@ -1,10 +1,26 @@
 """Tests for unused files dialog."""
 
 import json
+import os
 from pathlib import Path
 import pytest
 
 
+def _is_row_hidden(dialog, row):
+    """Check whether a model row is filtered out of the table."""
+    return row not in dialog._visible_rows()
+
+
+def _set_hide_checked(dialog, row, checked):
+    """Toggle a row's hide checkbox the way the view does."""
+    from PySide6.QtCore import Qt
+    from gui.unused_files_dialog import COL_HIDE
+
+    state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+    index = dialog.model.index(row, COL_HIDE)
+    dialog.model.setData(index, state, Qt.ItemDataRole.CheckStateRole)
+
+
 class TestUnusedFilesDialog:
     """Test cases for UnusedFilesDialog."""
 
@@ -59,6 +75,7 @@ class TestUnusedFilesDialog:
         dialog1.show_textures_check.setChecked(False)
         dialog1.show_blends_check.setChecked(True)
         dialog1.show_backups_check.setChecked(False)
+        dialog1.flush_pending_changes()
 
         # Verify config file was created and contains correct states
         assert config_file.exists()
@@ -155,44 +172,47 @@ class TestUnusedFilesDialog:
         dialog = UnusedFilesDialog(results, project_root, None)
 
         # Initially all rows should be visible
-        assert dialog.table.isRowHidden(0) == False  # texture
-        assert dialog.table.isRowHidden(1) == False  # blend
-        assert dialog.table.isRowHidden(2) == False  # backup
+        assert _is_row_hidden(dialog, 0) == False  # texture
+        assert _is_row_hidden(dialog, 1) == False  # blend
+        assert _is_row_hidden(dialog, 2) == False  # backup
 
         # Uncheck textures
         dialog.show_textures_check.setChecked(False)
+        dialog.flush_pending_changes()
 
-        assert dialog.table.isRowHidden(0) == True   # texture hidden
-        assert dialog.table.isRowHidden(1) == False  # blend visible
-        assert dialog.table.isRowHidden(2) == False  # backup visible
+        assert _is_row_hidden(dialog, 0) == True   # texture hidden
+        assert _is_row_hidden(dialog, 1) == False  # blend visible
+        assert _is_row_hidden(dialog, 2) == False  # backup visible
 
         # Uncheck blends
         dialog.show_blends_check.setChecked(False)
+        dialog.flush_pending_changes()
 
-        assert dialog.table.isRowHidden(0) == True   # texture hidden
-        assert dialog.table.isRowHidden(1) == True   # blend hidden
-        assert dialog.table.isRowHidden(2) == False  # backup visible
+        assert _is_row_hidden(dialog, 0) == True   # texture hidden
+        assert _is_row_hidden(dialog, 1) == True   # blend hidden
+        assert _is_row_hidden(dialog, 2) == False  # backup visible
 
         # Uncheck backups (all hidden)
         dialog.show_backups_check.setChecked(False)
+        dialog.flush_pending_changes()
 
-        assert dialog.table.isRowHidden(0) == True   # texture hidden
-        assert dialog.table.isRowHidden(1) == True   # blend hidden
-        assert dialog.table.isRowHidden(2) == True   # backup hidden
+        assert _is_row_hidden(dialog, 0) == True   # texture hidden
+        assert _is_row_hidden(dialog, 1) == True   # blend hidden
+        assert _is_row_hidden(dialog, 2) == True   # backup hidden
 
         # Re-check all
         dialog.show_textures_check.setChecked(True)
         dialog.show_blends_check.setChecked(True)
         dialog.show_backups_check.setChecked(True)
+        dialog.flush_pending_changes()
 
-        assert dialog.table.isRowHidden(0) == False  # texture visible
-        assert dialog.table.isRowHidden(1) == False  # blend visible
-        assert dialog.table.isRowHidden(2) == False  # backup visible
+        assert _is_row_hidden(dialog, 0) == False  # texture visible
+        assert _is_row_hidden(dialog, 1) == False  # blend visible
+        assert _is_row_hidden(dialog, 2) == False  # backup visible
 
     def test_hide_file_functionality(self, qapp, tmp_path):
         """Test that files can be hidden and unhidden."""
         from gui.unused_files_dialog import UnusedFilesDialog
-        from PySide6.QtWidgets import QCheckBox
 
         results = {
             "success": True,
@@ -228,42 +248,42 @@ class TestUnusedFilesDialog:
 
         # Initially no files are hidden
         assert len(dialog.hidden_files) == 0
-        assert dialog.table.isRowHidden(0) == False
+        assert _is_row_hidden(dialog, 0) == False
 
-        # Get hide checkbox for first row
-        hide_checkbox_widget = dialog.table.cellWidget(0, 5)
-        hide_checkbox = hide_checkbox_widget.findChild(QCheckBox)
-        assert hide_checkbox is not None
-        assert hide_checkbox.isChecked() == False
+        # Hide checkbox for first row starts unchecked
+        assert dialog.model.is_hidden(0) == False
 
         # Check the checkbox to hide the file
-        hide_checkbox.setChecked(True)
+        _set_hide_checked(dialog, 0, True)
+        dialog.flush_pending_changes()
 
         # File should now be hidden
         assert "/test/texture.png" in dialog.hidden_files
-        assert hide_checkbox.isChecked() == True
-        assert dialog.table.isRowHidden(0) == True  # Hidden by default
+        assert dialog.model.is_hidden(0) == True
+        assert _is_row_hidden(dialog, 0) == True  # Hidden by default
 
         # Enable show hidden files
         dialog.show_hidden_check.setChecked(True)
-        assert dialog.table.isRowHidden(0) == False  # Visible when show_hidden is checked
+        dialog.flush_pending_changes()
+        assert _is_row_hidden(dialog, 0) == False  # Visible when show_hidden is checked
 
         # Disable show hidden files again
         dialog.show_hidden_check.setChecked(False)
-        assert dialog.table.isRowHidden(0) == True  # Hidden again
+        dialog.flush_pending_changes()
+        assert _is_row_hidden(dialog, 0) == True  # Hidden again
 
         # Uncheck the checkbox to unhide the file
-        hide_checkbox.setChecked(False)
+        _set_hide_checked(dialog, 0, False)
+        dialog.flush_pending_changes()
 
         # File should no longer be hidden
         assert "/test/texture.png" not in dialog.hidden_files
-        assert hide_checkbox.isChecked() == False
-        assert dialog.table.isRowHidden(0) == False
+        assert dialog.model.is_hidden(0) == False
+        assert _is_row_hidden(dialog, 0) == False
 
     def test_hidden_files_persistence(self, qapp, tmp_path):
         """Test that hidden files are persisted to config file."""
         from gui.unused_files_dialog import UnusedFilesDialog
-        from PySide6.QtWidgets import QCheckBox
 
         config_file = tmp_path / "config.json"
 
@@ -299,9 +319,8 @@ class TestUnusedFilesDialog:
 
         # Create first dialog and hide a file
         dialog1 = UnusedFilesDialog(results, project_root, config_file)
-        hide_checkbox_widget = dialog1.table.cellWidget(0, 5)
-        hide_checkbox = hide_checkbox_widget.findChild(QCheckBox)
-        hide_checkbox.setChecked(True)
+        _set_hide_checked(dialog1, 0, True)
+        dialog1.flush_pending_changes()
 
         # Verify config file contains hidden files
         assert config_file.exists()
@@ -316,10 +335,8 @@ class TestUnusedFilesDialog:
         dialog2 = UnusedFilesDialog(results, project_root, config_file)
 
         assert "/test/texture.png" in dialog2.hidden_files
-        hide_checkbox_widget2 = dialog2.table.cellWidget(0, 5)
-        hide_checkbox2 = hide_checkbox_widget2.findChild(QCheckBox)
-        assert hide_checkbox2.isChecked() == True
-        assert dialog2.table.isRowHidden(0) == True
+        assert dialog2.model.is_hidden(0) == True
+        assert _is_row_hidden(dialog2, 0) == True
 
     def test_show_hidden_checkbox_persistence(self, qapp, tmp_path):
         """Test that show hidden checkbox state is persisted."""
@@ -350,6 +367,7 @@ class TestUnusedFilesDialog:
         # Create dialog and check show_hidden
         dialog1 = UnusedFilesDialog(results, project_root, config_file)
         dialog1.show_hidden_check.setChecked(True)
+        dialog1.flush_pending_changes()
 
         # Verify it was saved
         with open(config_file, 'r') as f:
@@ -360,3 +378,446 @@ class TestUnusedFilesDialog:
         # Create new dialog and verify state is restored
         dialog2 = UnusedFilesDialog(results, project_root, config_file)
         assert dialog2.show_hidden_check.isChecked() == True
+
+
+class TestUnusedFilesSelection:
+    """Test row selection in the model-backed table."""
+
+    @pytest.fixture
+    def dialog(self, qapp, tmp_path):
+        """Create a dialog with one file of each type."""
+        from gui.unused_files_dialog import UnusedFilesDialog
+
+        results = {
+            "unused_files": [
+                {"path": "/test/texture.png", "name": "texture.png", "type": "texture",
+                 "size": 1024, "relative_path": "texture.png"},
+                {"path": "/test/file.blend", "name": "file.blend", "type": "blend",
+                 "size": 2048, "relative_path": "file.blend"},
+                {"path": "/test/backup.blend1", "name": "backup.blend1", "type": "backup",
+                 "size": 512, "relative_path": "backup.blend1"},
+            ],
+            "total_unused_size": 3584,
+            "unused_by_type": {"texture": 1, "blend": 1, "backup": 1},
+        }
+        return UnusedFilesDialog(results, tmp_path, None)
+
+    def test_model_serves_cells_without_widgets(self, dialog):
+        """Test that cells come from the model rather than cell widgets."""
+        from PySide6.QtCore import Qt
+        from gui.unused_files_dialog import COL_NAME, COL_SELECT, COL_SIZE
+
+        model = dialog.model
+        assert model.index(0, COL_NAME).data() == "texture.png"
+        assert model.index(0, COL_SIZE).data() == "1.0 KB"
+        assert model.index(0, COL_SELECT).data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+        assert model.flags(model.index(0, COL_SELECT)) & Qt.ItemFlag.ItemIsUserCheckable
+        assert dialog.table.indexWidget(dialog.proxy.index(0, COL_SELECT)) is None
+
+    def test_select_all_only_checks_visible_rows(self, dialog):
+        """Test that Select All skips rows hidden by the type filters."""
+        dialog.show_blends_check.setChecked(False)
+        dialog.flush_pending_changes()
+
+        dialog._select_all()
+
+        assert [f["name"] for f in dialog._get_selected_files()] == ["texture.png", "backup.blend1"]
+        assert dialog.model.is_checked(1) is False
+
+    def test_select_none_clears_all_rows(self, dialog):
+        """Test that Select None unchecks every row."""
+        dialog._select_all()
+        dialog._select_none()
+
+        assert dialog._get_selected_files() == []
+
+    def test_unknown_type_is_never_shown(self, qapp, tmp_path):
+        """Test that a file with an unknown type is filtered out."""
+        from gui.unused_files_dialog import TYPE_OTHER, UnusedFilesDialog
+
+        results = {
+            "unused_files": [
+                {"path": "/test/notes.txt", "name": "notes.txt", "type": "other",
+                 "size": 10, "relative_path": "notes.txt"},
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, None)
+
+        assert list(dialog.model._types) == [TYPE_OTHER]
+        assert dialog._visible_rows() == []
+
+    def test_unchanged_filters_skip_refilter(self, dialog, monkeypatch):
+        """Test that re-applying the same filters does not invalidate the proxy."""
+        dialog._apply_filters()
+        calls = []
+        monkeypatch.setattr(dialog.proxy, "invalidate", lambda: calls.append(1))
+
+        dialog._apply_filters()
+        assert calls == []
+
+        dialog.show_backups_check.setChecked(False)
+        dialog.flush_pending_changes()
+        assert calls == [1]
+
+    def test_hiding_file_still_refilters(self, dialog):
+        """Test that a hide toggle changes visibility despite equal checkboxes."""
+        from PySide6.QtCore import Qt
+        from gui.unused_files_dialog import COL_HIDE
+
+        dialog.model.setData(dialog.model.index(0, COL_HIDE), Qt.Checked, Qt.CheckStateRole)
+        dialog.flush_pending_changes()
+
+        assert dialog._visible_rows() == [1, 2]
+
+    def test_size_column_sorts_numerically(self, dialog):
+        """Test that sorting by size compares bytes, not formatted text."""
+        from PySide6.QtCore import Qt
+        from gui.unused_files_dialog import COL_SIZE
+
+        assert dialog._visible_rows() == [0, 1, 2]
+
+        dialog.table.sortByColumn(COL_SIZE, Qt.SortOrder.AscendingOrder)
+
+        # As text "512 B" would sort after "1.0 KB" and "2.0 KB"
+        assert dialog._visible_rows() == [2, 0, 1]
+
+    def test_short_columns_have_fixed_widths(self, dialog):
+        """Test that short columns are not sized by measuring every row."""
+        from PySide6.QtWidgets import QHeaderView
+        from gui.unused_files_dialog import COL_HIDE, COL_SELECT, COL_SIZE, COL_TYPE
+
+        header = dialog.table.horizontalHeader()
+        metrics = dialog.table.fontMetrics()
+        for column in (COL_SELECT, COL_TYPE, COL_SIZE, COL_HIDE):
+            assert header.sectionResizeMode(column) == QHeaderView.ResizeMode.Fixed
+        assert header.sectionSize(COL_SIZE) > metrics.horizontalAdvance("9999.99 MB")
+        assert header.sectionSize(COL_TYPE) > metrics.horizontalAdvance("Texture")
+
+    def test_unserved_roles_return_none(self, dialog):
+        """Test that roles the model does not provide return None for any cell."""
+        from PySide6.QtCore import Qt
+
+        model = dialog.model
+        for column in range(model.columnCount()):
+            index = model.index(0, column)
+            for role in (Qt.ItemDataRole.FontRole, Qt.ItemDataRole.DecorationRole,
+                         Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole):
+                assert model.data(index, role) is None
+
+    def test_rows_have_fixed_height(self, dialog):
+        """Test that row heights are fixed rather than measured per row."""
+        from PySide6.QtWidgets import QHeaderView
+
+        vertical_header = dialog.table.verticalHeader()
+        assert vertical_header.sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+        assert {dialog.table.rowHeight(row) for row in range(3)} == {24}
+
+    def test_summary_label_is_rich_text(self, dialog):
+        """Test that the summary label has a fixed rich text format."""
+        from PySide6.QtCore import Qt
+
+        assert dialog.summary_label.textFormat() == Qt.RichText
+
+    def test_restore_filters_table_once(self, qapp, tmp_path, monkeypatch):
+        """Test that restoring state filters once and does not re-save."""
+        from gui.unused_files_dialog import UnusedFilesDialog
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"unused_files_dialog": {
+            "show_textures": False, "show_blends": False,
+            "show_backups": True, "show_hidden": True, "hidden_files": [],
+        }}))
+        calls = []
+        original_apply = UnusedFilesDialog._apply_filters
+
+        def counting_apply(self):
+            calls.append("apply")
+            original_apply(self)
+
+        monkeypatch.setattr(UnusedFilesDialog, "_apply_filters", counting_apply)
+        monkeypatch.setattr(UnusedFilesDialog, "_save_state", lambda self: calls.append("save"))
+
+        results = {
+            "unused_files": [
+                {"path": "/test/texture.png", "name": "texture.png", "type": "texture",
+                 "size": 1024, "relative_path": "texture.png"},
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, config_file)
+
+        assert calls == ["apply"]
+        assert dialog.show_hidden_check.isChecked() is True
+        assert dialog._visible_rows() == []
+
+
+class TestFormatSize:
+    """Test the Size column formatting."""
+
+    def test_units(self):
+        """Test that sizes pick B, KB or MB."""
+        from gui.unused_files_dialog import _format_size
+
+        assert _format_size(512) == "512 B"
+        assert _format_size(1536) == "1.5 KB"
+        assert _format_size(3 * 1024 * 1024) == "3.00 MB"
+
+
+class TestPendingChanges:
+    """Test that checkbox bursts are filtered and saved once."""
+
+    def test_burst_of_toggles_saves_once(self, qtbot, tmp_path, monkeypatch):
+        """Test that several toggles in one pass apply and save once."""
+        from gui.unused_files_dialog import UnusedFilesDialog
+
+        results = {
+            "unused_files": [
+                {"path": "/test/texture.png", "name": "texture.png", "type": "texture",
+                 "size": 1024, "relative_path": "texture.png"},
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, tmp_path / "config.json")
+        qtbot.addWidget(dialog)
+        saves = []
+        monkeypatch.setattr(dialog, "_save_state", lambda: saves.append(1))
+
+        dialog.show_textures_check.setChecked(False)
+        dialog.show_blends_check.setChecked(False)
+        dialog.show_hidden_check.setChecked(True)
+        assert saves == []
+
+        qtbot.waitUntil(lambda: len(saves) == 1)
+        assert dialog._visible_rows() == []
+
+    def test_close_flushes_pending_save(self, qtbot, tmp_path):
+        """Test that closing the dialog writes a pending change."""
+        from gui.unused_files_dialog import UnusedFilesDialog
+
+        config_file = tmp_path / "config.json"
+        results = {
+            "unused_files": [
+                {"path": "/test/texture.png", "name": "texture.png", "type": "texture",
+                 "size": 1024, "relative_path": "texture.png"},
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, config_file)
+        qtbot.addWidget(dialog)
+
+        dialog.show_backups_check.setChecked(False)
+        dialog.accept()
+
+        assert json.loads(config_file.read_text())["unused_files_dialog"]["show_backups"] is False
+
+
+    def test_save_keeps_other_sections(self, qtbot, tmp_path):
+        """Test that saving replaces the config atomically and keeps other keys."""
+        from gui.unused_files_dialog import UnusedFilesDialog
+
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"link_operation": {"link_mode": "link"}}))
+        results = {
+            "unused_files": [
+                {"path": "/test/texture.png", "name": "texture.png", "type": "texture",
+                 "size": 1024, "relative_path": "texture.png"},
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, config_file)
+        qtbot.addWidget(dialog)
+
+        dialog.show_blends_check.setChecked(False)
+        dialog.flush_pending_changes()
+
+        config_data = json.loads(config_file.read_text())
+        assert config_data["link_operation"] == {"link_mode": "link"}
+        assert config_data["unused_files_dialog"]["show_blends"] is False
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+class TestCheckedRows:
+    """Test the incrementally tracked selection."""
+
+    def test_checked_rows_follow_checkbox_edits(self, qapp, tmp_path):
+        """Test that checking and unchecking updates the selected rows."""
+        from PySide6.QtCore import Qt
+        from gui.unused_files_dialog import COL_SELECT, UnusedFilesDialog
+
+        results = {
+            "unused_files": [
+                {"path": f"/test/t{i}.png", "name": f"t{i}.png", "type": "texture",
+                 "size": 1, "relative_path": f"t{i}.png"}
+                for i in range(3)
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, None)
+        model = dialog.model
+
+        for row in (2, 0):
+            model.setData(model.index(row, COL_SELECT), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+        assert model.checked_rows == {0, 2}
+        assert [f["name"] for f in dialog._get_selected_files()] == ["t0.png", "t2.png"]
+
+        model.setData(model.index(2, COL_SELECT), Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+        assert model.checked_rows == {0}
+
+
+class TestDeleteSelected:
+    """Test moving selected unused files to the trash."""
+
+    def test_missing_file_reported_without_stat(self, qapp, tmp_path, monkeypatch):
+        """Test that send2trash's not-found error is reported per file."""
+        from PySide6.QtWidgets import QMessageBox
+        import gui.unused_files_dialog as dialog_module
+
+        trashed = []
+
+        def fake_send2trash(path):
+            if path.endswith("missing.png"):
+                raise FileNotFoundError(path)
+            trashed.append(path)
+
+        messages = []
+        monkeypatch.setattr(dialog_module, "send2trash", fake_send2trash)
+        monkeypatch.setattr(QMessageBox, "question",
+                            lambda *args: QMessageBox.StandardButton.Yes)
+        monkeypatch.setattr(QMessageBox, "information",
+                            lambda parent, title, text: messages.append(text))
+
+        results = {
+            "unused_files": [
+                {"path": "/test/present.png", "name": "present.png", "type": "texture",
+                 "size": 1, "relative_path": "present.png"},
+                {"path": "/test/missing.png", "name": "missing.png", "type": "texture",
+                 "size": 1, "relative_path": "missing.png"},
+            ],
+        }
+        dialog = dialog_module.UnusedFilesDialog(results, tmp_path, None)
+        deleted = []
+        dialog.files_deleted.connect(deleted.extend)
+        dialog._select_all()
+
+        dialog._delete_selected()
+
+        assert trashed == ["/test/present.png"]
+        assert deleted == ["/test/present.png"]
+        assert "1 error(s) occurred" in messages[0]
+
+    def test_confirmation_counts_selected_types(self, qapp, tmp_path, monkeypatch):
+        """Test that the confirmation lists the selected files per type."""
+        from PySide6.QtWidgets import QMessageBox
+        from gui.unused_files_dialog import UnusedFilesDialog
+
+        prompts = []
+
+        def fake_question(parent, title, text, *args):
+            prompts.append(text)
+            return QMessageBox.StandardButton.No
+
+        monkeypatch.setattr(QMessageBox, "question", fake_question)
+
+        results = {
+            "unused_files": [
+                {"path": "/test/a.png", "name": "a.png", "type": "texture",
+                 "size": 1, "relative_path": "a.png"},
+                {"path": "/test/b.png", "name": "b.png", "type": "texture",
+                 "size": 1, "relative_path": "b.png"},
+                {"path": "/test/c.blend", "name": "c.blend", "type": "blend",
+                 "size": 1, "relative_path": "c.blend"},
+            ],
+        }
+        dialog = UnusedFilesDialog(results, tmp_path, None)
+        dialog._select_all()
+
+        dialog._delete_selected()
+
+        assert "delete 3 file(s)" in prompts[0]
+        assert "• 2 texture file(s)" in prompts[0]
+        assert "• 1 .blend file(s)" in prompts[0]
+        assert "backup" not in prompts[0]
+
+    def test_batch_trash_sends_files_together(self, qapp, tmp_path, monkeypatch):
+        """Test that a batching platform trashes all selected files in one call."""
+        import gui.unused_files_dialog as dialog_module
+
+        calls = []
+        monkeypatch.setattr(dialog_module, "_BATCH_TRASH", True)
+        monkeypatch.setattr(dialog_module, "send2trash", calls.append)
+
+        files = [tmp_path / f"t{i}.png" for i in range(3)]
+        for file_path in files:
+            file_path.write_text("x")
+        results = {
+            "unused_files": [
+                {"path": str(f), "name": f.name, "type": "texture",
+                 "size": 1, "relative_path": f.name}
+                for f in files
+            ],
+        }
+        dialog = dialog_module.UnusedFilesDialog(results, tmp_path, None)
+
+        deleted, errors = dialog._trash_rows([0, 2])
+
+        assert calls == [[str(files[0]), str(files[2])]]
+        assert deleted == [str(files[0]), str(files[2])]
+        assert errors == []
+
+    def test_failed_batch_retries_remaining_files(self, qapp, tmp_path, monkeypatch):
+        """Test that files left after a failed batch are retried and reported."""
+        import gui.unused_files_dialog as dialog_module
+
+        files = [tmp_path / name for name in ("a.png", "b.png", "c.png")]
+        for file_path in files:
+            file_path.write_text("x")
+
+        def fake_send2trash(paths):
+            if isinstance(paths, list):
+                # Trash the first file, then fail
+                files[0].unlink()
+                raise OSError("batch failed")
+            if paths.endswith("c.png"):
+                raise PermissionError("locked")
+            os.unlink(paths)
+
+        monkeypatch.setattr(dialog_module, "_BATCH_TRASH", True)
+        monkeypatch.setattr(dialog_module, "send2trash", fake_send2trash)
+
+        results = {
+            "unused_files": [
+                {"path": str(f), "name": f.name, "type": "texture",
+                 "size": 1, "relative_path": f.name}
+                for f in files
+            ],
+        }
+        dialog = dialog_module.UnusedFilesDialog(results, tmp_path, None)
+
+        deleted, errors = dialog._trash_rows([0, 1, 2])
+
+        assert deleted == [str(files[0]), str(files[1])]
+        assert errors == ["Failed to delete c.png: locked"]
+
+    def test_failed_batch_reports_files_missing_beforehand(self, qapp, tmp_path, monkeypatch):
+        """Test that a file already missing before the batch is not counted as deleted."""
+        import gui.unused_files_dialog as dialog_module
+
+        present = tmp_path / "present.png"
+        present.write_text("x")
+        missing = tmp_path / "missing.png"
+
+        def fake_send2trash(paths):
+            if isinstance(paths, list):
+                raise OSError("batch failed")
+            os.unlink(paths)
+
+        monkeypatch.setattr(dialog_module, "_BATCH_TRASH", True)
+        monkeypatch.setattr(dialog_module, "send2trash", fake_send2trash)
+
+        results = {
+            "unused_files": [
+                {"path": str(f), "name": f.name, "type": "texture",
+                 "size": 1, "relative_path": f.name}
+                for f in (present, missing)
+            ],
+        }
+        dialog = dialog_module.UnusedFilesDialog(results, tmp_path, None)
+
+        deleted, errors = dialog._trash_rows([0, 1])
+
+        assert deleted == [str(present)]
+        assert errors == ["File not found: missing.png"]